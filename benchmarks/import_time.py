@@ -0,0 +1,65 @@
+"""Measure the startup time of the package and of the `pwc` command.
+
+Runs every statement in a fresh interpreter and prints the best wall time
+over the repetitions, with and without the interpreter startup time. Use
+`python -X importtime -c "import paperswithcode"` to see which modules the
+time is spent in.
+
+Usage:
+    python benchmarks/import_time.py [--repeat 10]
+"""
+import argparse
+import subprocess
+import sys
+import time
+
+RUNS = (
+    ("import paperswithcode", ["-c", "import paperswithcode"]),
+    (
+        "from paperswithcode.models import Paper",
+        ["-c", "from paperswithcode.models import Paper"],
+    ),
+    (
+        "from paperswithcode import PapersWithCodeClient",
+        ["-c", "from paperswithcode import PapersWithCodeClient"],
+    ),
+    (
+        "PapersWithCodeClient()",
+        [
+            "-c",
+            "from paperswithcode import PapersWithCodeClient\n"
+            "PapersWithCodeClient()",
+        ],
+    ),
+    ("pwc --help", ["-m", "paperswithcode", "--help"]),
+)
+
+
+def best(args, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, *args], check=True, capture_output=True
+        )
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    baseline = best(["-c", "pass"], args.repeat)
+    print(f"{'command':<52} {'total':>10} {'import':>10}")
+    for name, command in RUNS:
+        total = best(command, args.repeat)
+        print(
+            f"{name:<52} {total * 1000:>8.1f}ms "
+            f"{(total - baseline) * 1000:>8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Compare the standard library and orjson JSON codecs.
+
+Decodes a large papers page and encodes a large `evaluation_synchronize`
+request with `JsonCodec` and `OrjsonCodec`, checks that the results are
+identical and prints the time per payload. Requires orjson.
+
+Usage:
+    python benchmarks/json_codec.py [--items 1000] [--repeat 20]
+"""
+import argparse
+import timeit
+
+from paperswithcode.codec import JsonCodec, OrjsonCodec
+from paperswithcode.models import EvaluationTableSyncRequest
+
+from model_construction import papers, synchronize
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    json_codec, orjson_codec = JsonCodec(), OrjsonCodec()
+    response = json_codec.dumps(papers(args.items))
+    request = EvaluationTableSyncRequest(**synchronize(args.items)).dict()
+    assert json_codec.loads(response) == orjson_codec.loads(response)
+    assert json_codec.dumps(request) == orjson_codec.dumps(request)
+
+    print(f"{'payload':<44} {'json':>12} {'orjson':>12} {'speedup':>8}")
+    for name, func, data in (
+        (f"decode papers ({args.items} items)", "loads", response),
+        (f"encode synchronize ({args.items} rows)", "dumps", request),
+    ):
+        times = [
+            min(
+                timeit.repeat(
+                    lambda: getattr(codec, func)(data),
+                    number=1,
+                    repeat=args.repeat,
+                )
+            )
+            for codec in (json_codec, orjson_codec)
+        ]
+        print(
+            f"{name:<44} {times[0] * 1000:>10.2f}ms "
+            f"{times[1] * 1000:>10.2f}ms {times[0] / times[1]:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Compare validated and trusted model construction.
+
+Builds the models of typical large responses with full pydantic validation
+(`PapersWithCodeClient()`) and with the trusted fast path
+(`PapersWithCodeClient(trusted=True)`), checks that the results are equal
+and prints the time per response.
+
+Usage:
+    python benchmarks/model_construction.py [--items 1000] [--repeat 20]
+"""
+import argparse
+import timeit
+
+from paperswithcode.construct import construct
+from paperswithcode.models import (
+    Papers,
+    Results,
+    EvaluationTableSyncResponse,
+)
+
+
+def papers(items):
+    return {
+        "count": items,
+        "next_page": 2,
+        "previous_page": None,
+        "results": [
+            {
+                "id": f"paper-{i}",
+                "arxiv_id": f"2101.{i:05d}",
+                "nips_id": None,
+                "url_abs": f"https://arxiv.org/abs/2101.{i:05d}",
+                "url_pdf": f"https://arxiv.org/pdf/2101.{i:05d}.pdf",
+                "title": f"Paper {i}",
+                "abstract": "Lorem ipsum dolor sit amet. " * 40,
+                "authors": [f"Author {j}" for j in range(6)],
+                "published": "2021-01-01",
+                "conference": None,
+                "conference_url_abs": None,
+                "conference_url_pdf": None,
+                "proceeding": None,
+            }
+            for i in range(items)
+        ],
+    }
+
+
+def results(items):
+    return {
+        "count": items,
+        "next_page": None,
+        "previous_page": None,
+        "results": [
+            {
+                "id": f"result-{i}",
+                "best_rank": None,
+                "metrics": {"Top 1 Accuracy": "90.1", "Params": "25M"},
+                "methodology": f"Model {i}",
+                "uses_additional_data": False,
+                "paper": f"paper-{i}",
+                "best_metric": None,
+                "evaluated_on": "2021-01-01",
+                "external_source_url": None,
+            }
+            for i in range(items)
+        ],
+    }
+
+
+def synchronize(items):
+    return {
+        "id": "evaluation",
+        "task": "task",
+        "dataset": "dataset",
+        "description": "",
+        "mirror_url": None,
+        "external_id": "",
+        "metrics": [
+            {"name": "Top 1 Accuracy", "description": "", "is_loss": False}
+        ],
+        "results": results(items)["results"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'response':<44} {'validated':>12} {'trusted':>12} {'speedup':>8}")
+    for model, data in (
+        (Papers, papers(args.items)),
+        (Results, results(args.items)),
+        (EvaluationTableSyncResponse, synchronize(args.items)),
+    ):
+        assert model(**data) == construct(model, data)
+        validated = min(
+            timeit.repeat(lambda: model(**data), number=1, repeat=args.repeat)
+        )
+        trusted = min(
+            timeit.repeat(
+                lambda: construct(model, data), number=1, repeat=args.repeat
+            )
+        )
+        print(
+            f"{model.__name__ + f' ({args.items} items)':<44} "
+            f"{validated * 1000:>10.2f}ms {trusted * 1000:>10.2f}ms "
+            f"{validated / trusted:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
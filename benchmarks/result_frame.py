@@ -0,0 +1,79 @@
+"""Compare row by row leaderboard analytics with a `ResultFrame`.
+
+Builds a leaderboard of `Result` objects with metric values like "85.3%"
+and "25M", then computes the best accuracy per evaluation year by looping
+over the results and by building a `ResultFrame` and using numpy. Checks
+that the results are identical and prints the time of every step.
+Requires numpy.
+
+Usage:
+    python benchmarks/result_frame.py [--items 20000] [--repeat 10]
+"""
+import argparse
+import random
+import timeit
+
+import numpy
+
+from paperswithcode.frame import ResultFrame
+from paperswithcode.models import Results
+
+from model_construction import results
+
+
+def leaderboard(items):
+    page = results(items)
+    random.seed(0)
+    for i, result in enumerate(page["results"]):
+        result["metrics"] = {
+            "Top 1 Accuracy": f"{random.randint(600, 999) / 10}%",
+            "Params": f"{random.randint(1, 500)}M",
+        }
+        result["evaluated_on"] = f"{2015 + i % 7}-0{1 + i % 9}-1{i % 9}"
+    return Results(**page).results
+
+
+def rows(leaderboard):
+    best = {}
+    for result in leaderboard:
+        year = int(result.evaluated_on[:4])
+        value = float(result.metrics["Top 1 Accuracy"].rstrip("%"))
+        best[year] = max(best.get(year, value), value)
+    return best
+
+
+def frame(leaderboard):
+    frame = ResultFrame.from_results(leaderboard)
+    years = frame.evaluated_on.astype("datetime64[Y]").astype(int) + 1970
+    unique, inverse = numpy.unique(years, return_inverse=True)
+    best = numpy.full(len(unique), -numpy.inf)
+    numpy.maximum.at(best, inverse, frame.metrics["Top 1 Accuracy"])
+    return dict(zip(unique.tolist(), best.tolist()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    data = leaderboard(args.items)
+    assert rows(data) == frame(data)
+    built = ResultFrame.from_results(data)
+
+    print(f"{'step':<44} {'time':>12}")
+    for name, func in (
+        ("best per year, row by row", lambda: rows(data)),
+        ("build the frame", lambda: ResultFrame.from_results(data)),
+        ("best per year, frame", lambda: frame(data)),
+        (
+            "mean accuracy of the built frame",
+            lambda: numpy.nanmean(built.metrics["Top 1 Accuracy"]),
+        ),
+    ):
+        time = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        print(f"{name:<44} {time * 1000:>10.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,18 @@
 __all__ = ["PapersWithCodeClient", "version", "__version__"]
 
-from paperswithcode.client import PapersWithCodeClient
 from paperswithcode.version import version, __version__
+
+
+def __getattr__(name):
+    # The client pulls in httpx, pydantic and all the models, so it is
+    # imported on first use.
+    if name == "PapersWithCodeClient":
+        from paperswithcode.client import PapersWithCodeClient
+
+        globals()[name] = PapersWithCodeClient
+        return PapersWithCodeClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,1798 @@
+import copy
+import functools
+from urllib import parse
+from typing import Callable, Dict, Iterable, Optional
+
+from paperswithcode.batch import BatchResult, aget_many
+from paperswithcode.cache import DiskCache, MemoryCache, invalidate, memoize
+from paperswithcode.codec import JsonCodec
+from paperswithcode.config import get_config
+from paperswithcode.construct import construct
+from paperswithcode.errors import SyncValidationError
+from paperswithcode.frame import ResultFrame
+from paperswithcode.handler import async_handler
+from paperswithcode.http import AsyncHttpClient, PoolLimits
+from paperswithcode.models import (
+    Paper,
+    Papers,
+    Repository,
+    Repositories,
+    PaperRepos,
+    Author,
+    Authors,
+    Conference,
+    Conferences,
+    Proceeding,
+    Proceedings,
+    Area,
+    Areas,
+    Task,
+    TaskCreateRequest,
+    TaskUpdateRequest,
+    Tasks,
+    Dataset,
+    DatasetCreateRequest,
+    DatasetUpdateRequest,
+    Datasets,
+    Method,
+    Methods,
+    Metric,
+    Metrics,
+    MetricCreateRequest,
+    MetricUpdateRequest,
+    Result,
+    Results,
+    ResultCreateRequest,
+    ResultUpdateRequest,
+    EvaluationTable,
+    EvaluationTables,
+    EvaluationTableCreateRequest,
+    EvaluationTableUpdateRequest,
+    EvaluationTableSyncRequest,
+    EvaluationTableSyncResponse,
+)
+from paperswithcode.pagination import aiterate
+from paperswithcode.ranking import Ranking
+from paperswithcode.ratelimit import RateLimiter
+from paperswithcode.streaming import (
+    AsyncDeferredRequest,
+    AsyncPageStream,
+    AsyncStreamingHttpClient,
+)
+from paperswithcode.synchronize import (
+    SyncDelta,
+    SyncState,
+    _check_unique,
+    asynchronize_chunked,
+)
+from paperswithcode.validation import validate_evaluation
+
+
+class AsyncPapersWithCodeClient:
+    """Asynchronous PapersWithCode client.
+
+    Exposes the same methods as the `PapersWithCodeClient`, but all of them
+    are coroutines. Requests are made using a non-blocking HTTP transport
+    with a connection pool shared by all requests made by the client.
+
+    The client can be used as an async context manager, which closes the
+    connection pool on exit:
+
+        >>> async with AsyncPapersWithCodeClient() as client:
+        ...     papers = await client.paper_list()
+
+    Args:
+        token (str, optional): API token used for authentication.
+        url (str, optional): URL of the PapersWithCode server.
+        pool_limits (PoolLimits, optional): Connection pool configuration.
+        cache (DiskCache, optional): Persistent cache for the responses to
+            the GET requests. Responses are not cached by default.
+        memory_cache (MemoryCache, optional): In-process cache for the
+            objects returned by the single object getters (`paper_get`,
+            `task_get`, ...). Entries are invalidated by the client methods
+            that update or delete the objects.
+        rate_limiter (RateLimiter, optional): Client side rate limiter that
+            throttles the requests, adapts to the server responses and
+            retries the failed GET requests. Requests are not throttled by
+            default.
+        coalesce (bool): If True, identical GET requests made concurrently
+            share a single request to the server. Default: True.
+        trusted (bool): If True, the responses are trusted to match the
+            models and the models are built without validating the values
+            that already have the right type, which is several times faster
+            for large pages. Default: False.
+        codec (JsonCodec, optional): JSON codec used to serialize the
+            request bodies and deserialize the responses. Default: orjson if
+            it is installed, otherwise the standard library.
+        compress_threshold (int, optional): Request bodies of at least this
+            many bytes, e.g. large `evaluation_synchronize` requests, are
+            sent gzip compressed. If the server rejects a compressed body,
+            the request is sent again uncompressed and the compression is
+            disabled. Default: None, the bodies are not compressed.
+    """
+
+    # Set on the clients returned by the `raw` and `streaming` properties.
+    _raw = False
+    _raw_client = None
+    _streaming_client = None
+
+    def __init__(
+        self,
+        token=None,
+        url=None,
+        pool_limits: Optional[PoolLimits] = None,
+        cache: Optional[DiskCache] = None,
+        memory_cache: Optional[MemoryCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce: bool = True,
+        trusted: bool = False,
+        codec: Optional[JsonCodec] = None,
+        compress_threshold: Optional[int] = None,
+    ):
+        config = get_config()
+        url = url or config.server_url
+        self.http = AsyncHttpClient(
+            url=f"{url}/api/v{config.api_version}",
+            token=token or "",
+            authorization_method=AsyncHttpClient.Authorization.token,
+            pool_limits=pool_limits,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            coalesce=coalesce,
+            codec=codec,
+            compress_threshold=compress_threshold,
+        )
+        self.memory_cache = memory_cache
+        self.trusted = trusted
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the connection pool used by the client."""
+        await self.http.aclose()
+
+    @property
+    def raw(self) -> "AsyncPapersWithCodeClient":
+        """Client that returns the deserialized responses instead of models.
+
+        The raw client has the same methods and shares the connection pool
+        and the caches with this client, but skips building the models. The
+        single object methods return the objects as dictionaries, exactly as
+        sent by the server, and the list methods return the pages as
+        dictionaries with the `count`, `next_page`, `previous_page` and
+        `results` keys, so they can be used with the pagination helpers.
+
+        The memory cache is not used by the raw client, since it holds
+        models.
+
+        Example:
+            >>> async for page in aiterate_pages(client.raw.paper_list):
+            ...     await producer.send("papers", page["results"])
+        """
+        if self._raw_client is None:
+            raw = copy.copy(self)
+            raw.memory_cache = None
+            raw._raw = True
+            raw._raw_client = raw
+            raw._streaming_client = None
+            self._raw_client = raw
+        return self._raw_client
+
+    @property
+    def streaming(self) -> "AsyncPapersWithCodeClient":
+        """Client whose list methods stream the results.
+
+        The streaming client has the same methods and shares the connection
+        pool with this client, but the list methods return an
+        `AsyncPageStream` instead of a page. The results are decoded and
+        built one at a time while they are read from the server, so the
+        memory used does not grow with the page size. The other methods
+        behave as usual.
+
+        Streamed pages are neither cached nor coalesced.
+
+        Example:
+            >>> async for paper in aiterate(client.streaming.paper_list,
+            ...                             items_per_page=1000):
+            ...     print(paper.title)
+        """
+        if self._streaming_client is None:
+            streaming = copy.copy(self)
+            streaming.http = AsyncStreamingHttpClient(self.http)
+            streaming._raw_client = None
+            streaming._streaming_client = streaming
+            self._streaming_client = streaming
+        return self._streaming_client
+
+    @staticmethod
+    def __params(page: int, items_per_page: int, **kwargs) -> Dict[str, str]:
+        params = {key: str(value) for key, value in kwargs.items()}
+        params["page"] = str(page)
+        params["items_per_page"] = str(items_per_page)
+        return params
+
+    @staticmethod
+    def __parse(url: str) -> int:
+        """Return page number."""
+        p = parse.urlparse(url)
+        if p.query == "":
+            return 1
+        else:
+            q = parse.parse_qs(p.query)
+            return int(q.get("page", [1])[0])
+
+    def __model(self, model, data):
+        if self._raw:
+            return data
+        if self.trusted:
+            return construct(model, data)
+        return model(**data)
+
+    async def __page(self, request, page_model):
+        if isinstance(request, AsyncDeferredRequest):
+            return await AsyncPageStream(
+                request.stream(),
+                functools.partial(
+                    self.__model, page_model.__fields__["results"].type_
+                ),
+                self.__parse,
+            ).open()
+        result = await request
+        next_page = result["next"]
+        if next_page is not None:
+            next_page = self.__parse(next_page)
+        previous_page = result["previous"]
+        if previous_page is not None:
+            previous_page = self.__parse(previous_page)
+        page = {
+            "count": result["count"],
+            "next_page": next_page,
+            "previous_page": previous_page,
+            "results": result["results"],
+        }
+        return self.__model(page_model, page)
+
+    @async_handler
+    async def search(
+        self,
+        q: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> PaperRepos:
+        """Search in a similar fashion to the frontpage search.
+
+        Args:
+            q (str, optional): Filter papers by querying the paper title and
+                abstract.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            PaperRepos: PaperRepos object.
+        """
+        params = self.__params(page, items_per_page)
+        timeout = None
+        if q is not None:
+            params["q"] = q
+        return await self.__page(
+            self.http.get("/search/", params=params, timeout=timeout),
+            PaperRepos,
+        )
+
+    @async_handler
+    async def paper_list(
+        self,
+        q: Optional[str] = None,
+        arxiv_id: Optional[str] = None,
+        title: Optional[str] = None,
+        abstract: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Papers:
+        """Return a paginated list of papers.
+
+        Args:
+            q (str, optional): Filter papers by querying the paper title and
+                abstract.
+            arxiv_id (str, optional): Filter papers by arxiv id.
+            title (str, optional): Filter papers by part of the title.
+            abstract (str, optional): Filter papers by part of the abstract.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Papers: Papers object.
+        """
+        params = self.__params(page, items_per_page)
+        timeout = None
+        if q is not None:
+            params["q"] = q
+            timeout = 60
+        if arxiv_id is not None:
+            params["arxiv_id"] = arxiv_id
+        if title is not None:
+            params["title"] = title
+        if abstract is not None:
+            params["abstract"] = abstract
+            timeout = 60
+        return await self.__page(
+            self.http.get("/papers/", params=params, timeout=timeout),
+            Papers,
+        )
+
+    @async_handler
+    @memoize("paper")
+    async def paper_get(self, paper_id: str) -> Paper:
+        """Return a paper by it's ID.
+
+        Args:
+            paper_id (str): ID of the paper.
+
+        Returns:
+            Paper: Paper object.
+        """
+        return self.__model(Paper, await self.http.get(f"/papers/{paper_id}/"))
+
+    async def paper_get_many(
+        self, paper_ids: Iterable[str], workers: int = 8
+    ) -> BatchResult:
+        """Return multiple papers by their IDs.
+
+        Duplicate IDs are fetched only once and the papers are fetched
+        concurrently. The papers that could not be fetched are reported in
+        the batch result errors instead of raising an exception.
+
+        Args:
+            paper_ids (iterable): IDs of the papers.
+            workers (int): Number of papers fetched concurrently. Default: 8.
+
+        Returns:
+            BatchResult: Paper objects and errors keyed by the paper ID.
+        """
+        return await aget_many(self.paper_get, paper_ids, workers=workers)
+
+    @async_handler
+    async def paper_dataset_list(
+        self, paper_id: str, page: int = 1, items_per_page: int = 50
+    ) -> Repositories:
+        """Return a list of datasets mentioned in the paper..
+
+        Args:
+            paper_id (str): ID of the paper.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Datasets: Datasets object.
+        """
+        params = self.__params(page, items_per_page)
+        return await self.__page(
+            self.http.get(f"/papers/{paper_id}/datasets/", params=params),
+            Datasets,
+        )
+
+    @async_handler
+    async def paper_repository_list(
+        self, paper_id: str, page: int = 1, items_per_page: int = 50
+    ) -> Repositories:
+        """Return a list of paper implementations.
+
+        Args:
+            paper_id (str): ID of the paper.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Repositories: Repositories object.
+        """
+        params = self.__params(page, items_per_page)
+        return await self.__page(
+            self.http.get(f"/papers/{paper_id}/repositories/", params=params),
+            Repositories,
+        )
+
+    @async_handler
+    async def paper_task_list(
+        self, paper_id: str, page: int = 1, items_per_page: int = 50
+    ) -> Tasks:
+        """Return a list of tasks mentioned in the paper.
+
+        Args:
+            paper_id (str): ID of the paper.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Tasks: Tasks object.
+        """
+        params = self.__params(page, items_per_page)
+        return await self.__page(
+            self.http.get(f"/papers/{paper_id}/tasks/", params=params),
+            Tasks,
+        )
+
+    @async_handler
+    async def paper_method_list(
+        self, paper_id: str, page: int = 1, items_per_page: int = 50
+    ) -> Methods:
+        """Return a list of methods mentioned in the paper.
+
+        Args:
+            paper_id (str): ID of the paper.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Methods: Methods object.
+        """
+        params = self.__params(page, items_per_page)
+        return await self.__page(
+            self.http.get(f"/papers/{paper_id}/methods/", params=params),
+            Methods,
+        )
+
+    @async_handler
+    async def paper_result_list(
+        self, paper_id: str, page: int = 1, items_per_page: int = 50
+    ) -> Results:
+        """Return a list of evaluation results for the paper.
+
+        Args:
+            paper_id (str): ID of the paper.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Results: Results object.
+        """
+        params = self.__params(page, items_per_page)
+        return await self.__page(
+            self.http.get(f"/papers/{paper_id}/results/", params=params),
+            Results,
+        )
+
+    @async_handler
+    async def repository_list(
+        self,
+        q: Optional[str] = None,
+        owner: Optional[str] = None,
+        name: Optional[str] = None,
+        stars: Optional[int] = None,
+        framework: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Papers:
+        """Return a paginated list of repositories.
+
+        Args:
+            q (str, optional): Search all searchable fields.
+            owner (str, optional): Filter repositories by owner.
+            name (str, optional): Filter repositories by name.
+            stars (int, optional): Filter repositories by minimum number of
+                stars.
+            framework (str, optional): Filter repositories by framework.
+                Available values: tf, pytorch, mxnet, torch, caffe2, jax,
+                paddle, mindspore.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Repositories: Repositories object.
+        """
+        params = self.__params(page, items_per_page)
+
+        if q is not None:
+            params["q"] = q
+        if owner is not None:
+            params["owner"] = owner
+        if name is not None:
+            params["name"] = name
+        if stars is not None:
+            params["stars"] = str(stars)
+        if framework is not None:
+            params["framework"] = framework
+        return await self.__page(
+            self.http.get("/repositories/", params=params),
+            Repositories,
+        )
+
+    @async_handler
+    async def repository_owner_list(self, owner: str) -> Repositories:
+        """List all repositories for a specific repo owner.
+
+        Args:
+            owner (str): Repository owner.
+
+        Returns:
+            Repositories: Repositories object.
+        """
+        return await self.__page(
+            self.http.get(f"/repositories/{owner}"),
+            Repositories,
+        )
+
+    @async_handler
+    @memoize("repository")
+    async def repository_get(self, owner: str, name: str) -> Repository:
+        """Return a repository by it's owner/name pair.
+
+        Args:
+            owner (str): Owner name.
+            name (str): Repository name.
+
+        Returns:
+            Repository: Repository object.
+        """
+        return self.__model(
+            Repository, await self.http.get(f"/repositories/{owner}/{name}/")
+        )
+
+    @async_handler
+    async def repository_paper_list(
+        self, owner: str, name: str, page: int = 1, items_per_page: int = 50
+    ) -> Papers:
+        """List all papers connected to the repository.
+
+        Args:
+            owner (str): Owner name.
+            name (str): Repository name.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Papers: Papers object.
+        """
+        params = self.__params(page, items_per_page)
+        return await self.__page(
+            self.http.get(
+                f"/repositories/{owner}/{name}/papers/", params=params
+            ),
+            Papers,
+        )
+
+    @async_handler
+    async def author_list(
+        self,
+        q: Optional[str] = None,
+        full_name: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Authors:
+        """Return a paginated list of paper authors.
+
+        Args:
+            q (str, optional): Search all searchable fields.
+            full_name (str, optional): Filter authors by part of their full
+                name.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Repositories: Repositories object.
+        """
+        params = self.__params(page, items_per_page)
+
+        if q is not None:
+            params["q"] = q
+        if full_name is not None:
+            params["full_name"] = full_name
+        return await self.__page(
+            self.http.get("/authors/", params=params), Authors
+        )
+
+    @async_handler
+    @memoize("author")
+    async def author_get(self, author_id: str) -> Author:
+        """Return a specific author selected by its id.
+
+        Args:
+            author_id (str): Author id.
+
+        Returns:
+            Author: Author object.
+        """
+        return self.__model(
+            Author, await self.http.get(f"/authors/{author_id}/")
+        )
+
+    async def author_get_many(
+        self, author_ids: Iterable[str], workers: int = 8
+    ) -> BatchResult:
+        """Return multiple authors by their IDs.
+
+        Duplicate IDs are fetched only once and the authors are fetched
+        concurrently. The authors that could not be fetched are reported in
+        the batch result errors instead of raising an exception.
+
+        Args:
+            author_ids (iterable): IDs of the authors.
+            workers (int): Number of authors fetched concurrently. Default: 8.
+
+        Returns:
+            BatchResult: Author objects and errors keyed by the author ID.
+        """
+        return await aget_many(self.author_get, author_ids, workers=workers)
+
+    @async_handler
+    async def author_paper_list(
+        self, author_id: str, page: int = 1, items_per_page: int = 50
+    ) -> Papers:
+        """List all papers connected to the author.
+
+        Args:
+            author_id (str): Author id.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Papers: Papers object.
+        """
+        params = self.__params(page, items_per_page)
+        return await self.__page(
+            self.http.get(f"/authors/{author_id}/papers/", params=params),
+            Papers,
+        )
+
+    @async_handler
+    async def conference_list(
+        self,
+        q: Optional[str] = None,
+        name: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Conferences:
+        """Return a paginated list of conferences.
+
+        Args:
+            q (str, optional): Search all searchable fields.
+            name (str, optional): Filter conferences by part of the name.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Conferences: Conferences object.
+        """
+        params = self.__params(page, items_per_page)
+        if q is not None:
+            params["q"] = q
+        if name is not None:
+            params["name"] = name
+        return await self.__page(
+            self.http.get("/conferences/", params=params), Conferences
+        )
+
+    @async_handler
+    @memoize("conference")
+    async def conference_get(self, conference_id: str) -> Conference:
+        """Return a conference by it's ID.
+
+        Args:
+            conference_id (str): ID of the conference.
+
+        Returns:
+            Conference: Conference object.
+        """
+        return self.__model(
+            Conference, await self.http.get(f"/conferences/{conference_id}/")
+        )
+
+    async def conference_get_many(
+        self, conference_ids: Iterable[str], workers: int = 8
+    ) -> BatchResult:
+        """Return multiple conferences by their IDs.
+
+        Duplicate IDs are fetched only once and the conferences are fetched
+        concurrently. The conferences that could not be fetched are reported in
+        the batch result errors instead of raising an exception.
+
+        Args:
+            conference_ids (iterable): IDs of the conferences.
+            workers (int): Number of conferences fetched concurrently.
+                Default: 8.
+
+        Returns:
+            BatchResult: Conference objects and errors keyed by the
+                conference ID.
+        """
+        return await aget_many(
+            self.conference_get, conference_ids, workers=workers
+        )
+
+    @async_handler
+    async def proceeding_list(
+        self, conference_id: str, page: int = 1, items_per_page: int = 50
+    ) -> Proceedings:
+        """Return a paginated list of conference proceedings.
+
+        Args:
+            conference_id (str): ID of the conference.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Proceedings: Proceedings object.
+        """
+        return await self.__page(
+            self.http.get(
+                f"/conferences/{conference_id}/proceedings/",
+                params=self.__params(page, items_per_page),
+            ),
+            Proceedings,
+        )
+
+    @async_handler
+    @memoize("proceeding")
+    async def proceeding_get(
+        self, conference_id: str, proceeding_id: str
+    ) -> Proceeding:
+        """Return a conference proceeding by it's ID.
+
+        Args:
+            conference_id (str): ID of the conference.
+            proceeding_id (str): ID of the proceeding.
+
+        Returns:
+            Proceeding: Proceeding object.
+        """
+        return self.__model(
+            Proceeding,
+            await self.http.get(
+                f"/conferences/{conference_id}/proceedings/{proceeding_id}/"
+            ),
+        )
+
+    @async_handler
+    async def proceeding_paper_list(
+        self,
+        conference_id: str,
+        proceeding_id: str,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Papers:
+        """Return a list of papers published in a confernce proceeding.
+
+        Args:
+            conference_id (str): ID of the conference.
+            proceeding_id (str): ID of the proceding.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Papers: Papers object.
+        """
+        params = self.__params(page, items_per_page)
+        return await self.__page(
+            self.http.get(
+                f"/conferences/{conference_id}/proceedings/{proceeding_id}"
+                f"/papers/",
+                params=params,
+            ),
+            Papers,
+        )
+
+    @async_handler
+    async def area_list(
+        self,
+        q: Optional[str] = None,
+        name: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Areas:
+        """Return a paginated list of areas.
+
+        Args:
+            q (str, optional): Filter areas by querying the area name.
+            name (str, optional): Filter areas by part of the name.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Areas: Areas object.
+        """
+        params = self.__params(page, items_per_page)
+        timeout = None
+        if q is not None:
+            params["q"] = q
+            timeout = 60
+        if name is not None:
+            params["name"] = name
+
+        return await self.__page(
+            self.http.get("/areas/", params=params, timeout=timeout),
+            Areas,
+        )
+
+    @async_handler
+    @memoize("area")
+    async def area_get(self, area_id: str) -> Area:
+        """Return an area by it's ID.
+
+        Args:
+            area_id (str): ID of the area.
+
+        Returns:
+            Area: Area object.
+        """
+        return self.__model(Area, await self.http.get(f"/areas/{area_id}/"))
+
+    async def area_get_many(
+        self, area_ids: Iterable[str], workers: int = 8
+    ) -> BatchResult:
+        """Return multiple areas by their IDs.
+
+        Duplicate IDs are fetched only once and the areas are fetched
+        concurrently. The areas that could not be fetched are reported in
+        the batch result errors instead of raising an exception.
+
+        Args:
+            area_ids (iterable): IDs of the areas.
+            workers (int): Number of areas fetched concurrently. Default: 8.
+
+        Returns:
+            BatchResult: Area objects and errors keyed by the area ID.
+        """
+        return await aget_many(self.area_get, area_ids, workers=workers)
+
+    @async_handler
+    async def area_task_list(
+        self, area_id: str, page: int = 1, items_per_page: int = 50
+    ) -> Tasks:
+        """Return a paginated list of tasks in an area.
+
+        Args:
+            area_id (str): ID of the area.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Tasks: Tasks object.
+        """
+        params = self.__params(page, items_per_page)
+        return await self.__page(
+            self.http.get(f"/areas/{area_id}/tasks/", params=params),
+            Tasks,
+        )
+
+    @async_handler
+    async def task_list(
+        self,
+        q: Optional[str] = None,
+        name: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Tasks:
+        """Return a paginated list of tasks.
+
+        Args:
+            q (str, optional): Filter tasks by querying the task name.
+            name (str, optional): Filter tasks by part of th name.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Tasks: Tasks object.
+        """
+        params = self.__params(page, items_per_page)
+        timeout = None
+        if q is not None:
+            params["q"] = q
+            timeout = 60
+        if name is not None:
+            params["name"] = name
+        return await self.__page(
+            self.http.get("/tasks/", params=params, timeout=timeout),
+            Tasks,
+        )
+
+    @async_handler
+    @memoize("task")
+    async def task_get(self, task_id: str) -> Task:
+        """Return a task by it's ID.
+
+        Args:
+            task_id (str): ID of the task.
+
+        Returns:
+            Task: Task object.
+        """
+        return self.__model(Task, await self.http.get(f"/tasks/{task_id}/"))
+
+    async def task_get_many(
+        self, task_ids: Iterable[str], workers: int = 8
+    ) -> BatchResult:
+        """Return multiple tasks by their IDs.
+
+        Duplicate IDs are fetched only once and the tasks are fetched
+        concurrently. The tasks that could not be fetched are reported in
+        the batch result errors instead of raising an exception.
+
+        Args:
+            task_ids (iterable): IDs of the tasks.
+            workers (int): Number of tasks fetched concurrently. Default: 8.
+
+        Returns:
+            BatchResult: Task objects and errors keyed by the task ID.
+        """
+        return await aget_many(self.task_get, task_ids, workers=workers)
+
+    @async_handler
+    async def task_add(self, task: TaskCreateRequest) -> Task:
+        """Add a task.
+
+        Args:
+           task (TaskCreateRequest): Task create request.
+
+        Returns:
+            Task: Created task.
+        """
+        return self.__model(Task, await self.http.post("/tasks/", data=task))
+
+    @async_handler
+    @invalidate("task", "task_id")
+    async def task_update(self, task_id: str, task: TaskUpdateRequest) -> Task:
+        """Update a task.
+
+        Args:
+            task_id (str): ID of the task.
+            task (TaskUpdateRequest): Task update request.
+
+        Returns:
+            Task: Updated task.
+        """
+        return self.__model(
+            Task, await self.http.patch(f"/tasks/{task_id}/", data=task)
+        )
+
+    @async_handler
+    @invalidate("task", "task_id")
+    async def task_delete(self, task_id: str):
+        """Delete a task.
+
+        Args:
+            task_id (str): ID of the task.
+        """
+        await self.http.delete(f"/tasks/{task_id}/")
+
+    @async_handler
+    async def task_parent_list(
+        self, task_id: str, page: int = 1, items_per_page: int = 50
+    ) -> Tasks:
+        """Return a paginated list of parent tasks for a selected task.
+
+        Args:
+            task_id (str): ID of the task.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Tasks: Tasks object.
+        """
+        params = self.__params(page, items_per_page)
+        return await self.__page(
+            self.http.get(f"/tasks/{task_id}/parents/", params=params),
+            Tasks,
+        )
+
+    @async_handler
+    async def task_child_list(
+        self, task_id: str, page: int = 1, items_per_page: int = 50
+    ) -> Tasks:
+        """Return a paginated list of child tasks for a selected task.
+
+        Args:
+            task_id (str): ID of the task.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Tasks: Tasks object.
+        """
+        params = self.__params(page, items_per_page)
+        return await self.__page(
+            self.http.get(f"/tasks/{task_id}/children/", params=params),
+            Tasks,
+        )
+
+    @async_handler
+    async def task_paper_list(
+        self, task_id: str, page: int = 1, items_per_page: int = 50
+    ) -> Papers:
+        """Return a paginated list of papers for a selected task.
+
+        Args:
+            task_id (str): ID of the task.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Papers: Papers object.
+        """
+        params = self.__params(page, items_per_page)
+        return await self.__page(
+            self.http.get(f"/tasks/{task_id}/papers/", params=params),
+            Papers,
+        )
+
+    @async_handler
+    async def task_evaluation_list(
+        self, task_id: str, page: int = 1, items_per_page: int = 50
+    ) -> EvaluationTables:
+        """Return a list of evaluation tables for a selected task.
+
+        Args:
+            task_id (str): ID of the task.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            EvaluationTables: EvaluationTables object.
+        """
+        params = self.__params(page, items_per_page)
+        return await self.__page(
+            self.http.get(f"/tasks/{task_id}/evaluations/", params=params),
+            EvaluationTables,
+        )
+
+    @async_handler
+    async def dataset_list(
+        self,
+        q: Optional[str] = None,
+        name: Optional[str] = None,
+        full_name: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Datasets:
+        """Return a paginated list of datasets.
+
+        Args:
+            q (str, optional): Filter datasets by querying the dataset name.
+            name (str, optional): Filter datasets by their name.
+            full_name (str, optional): Filter datasets by their full name.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Datasets: Datasets object.
+        """
+        params = self.__params(page, items_per_page)
+        timeout = None
+        if q is not None:
+            params["q"] = q
+            timeout = 60
+        if name is not None:
+            params["name"] = name
+        if full_name is not None:
+            params["full_name"] = full_name
+        return await self.__page(
+            self.http.get("/datasets/", params=params, timeout=timeout),
+            Datasets,
+        )
+
+    @async_handler
+    @memoize("dataset")
+    async def dataset_get(self, dataset_id: str) -> Dataset:
+        """Return a dastaset by it's ID.
+
+        Args:
+            dataset_id (str): ID of the dataset.
+
+        Returns:
+            Dataset: Dataset object.
+        """
+        return self.__model(
+            Dataset, await self.http.get(f"/datasets/{dataset_id}/")
+        )
+
+    async def dataset_get_many(
+        self, dataset_ids: Iterable[str], workers: int = 8
+    ) -> BatchResult:
+        """Return multiple datasets by their IDs.
+
+        Duplicate IDs are fetched only once and the datasets are fetched
+        concurrently. The datasets that could not be fetched are reported in
+        the batch result errors instead of raising an exception.
+
+        Args:
+            dataset_ids (iterable): IDs of the datasets.
+            workers (int): Number of datasets fetched concurrently. Default: 8.
+
+        Returns:
+            BatchResult: Dataset objects and errors keyed by the dataset ID.
+        """
+        return await aget_many(self.dataset_get, dataset_ids, workers=workers)
+
+    @async_handler
+    async def dataset_add(self, dataset: DatasetCreateRequest) -> Dataset:
+        """Add a dataset.
+
+        Args:
+           dataset (DatasetCreateRequest): Dataset create request.
+
+        Returns:
+            Dataset: Created dataset.
+        """
+        return self.__model(
+            Dataset, await self.http.post("/datasets/", data=dataset)
+        )
+
+    @async_handler
+    @invalidate("dataset", "dataset_id")
+    async def dataset_update(
+        self, dataset_id: str, dataset: DatasetUpdateRequest
+    ) -> Dataset:
+        """Update a dataset.
+
+        Args:
+            dataset_id (str): ID of the dataset.
+            dataset (DatasetUpdateRequest): Dataset update request.
+
+        Returns:
+            Dataset: Updated dataset.
+        """
+        return self.__model(
+            Dataset,
+            await self.http.patch(f"/datasets/{dataset_id}/", data=dataset),
+        )
+
+    @async_handler
+    @invalidate("dataset", "dataset_id")
+    async def dataset_delete(self, dataset_id: str):
+        """Delete a dataset.
+
+        Args:
+            dataset_id (str): ID of the dataset.
+        """
+        await self.http.delete(f"/datasets/{dataset_id}/")
+
+    @async_handler
+    async def dataset_evaluation_list(
+        self, dataset_id: str, page: int = 1, items_per_page: int = 50
+    ) -> EvaluationTables:
+        """Return a list of evaluation tables for a selected dataset.
+
+        Args:
+            dataset_id (str): ID of the dasaset.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+           EvaluationTables: EvaluationTables object.
+        """
+        params = self.__params(page, items_per_page)
+        return await self.__page(
+            self.http.get(
+                f"/datasets/{dataset_id}/evaluations/", params=params
+            ),
+            EvaluationTables,
+        )
+
+    @async_handler
+    async def method_list(
+        self,
+        q: Optional[str] = None,
+        name: Optional[str] = None,
+        full_name: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Methods:
+        """Return a paginated list of methods.
+
+        Args:
+            q (str, optional): Search all searchable fields.
+            name (str, optional): Filter methods by part of the name.
+            full_name (str, optional): Filter methods by part of the full name.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Methods: Methods object.
+        """
+        params = self.__params(page, items_per_page)
+        timeout = None
+        if q is not None:
+            params["q"] = q
+            timeout = 60
+        if name is not None:
+            params["name"] = name
+        if full_name is not None:
+            params["full_name"] = full_name
+        return await self.__page(
+            self.http.get("/methods/", params=params, timeout=timeout),
+            Methods,
+        )
+
+    @async_handler
+    @memoize("method")
+    async def method_get(self, method_id) -> Method:
+        """Return a method by it's ID.
+
+        Args:
+            method_id (str): ID of the method.
+
+        Returns:
+            Method: Method object.
+        """
+        return self.__model(
+            Method, await self.http.get(f"/methods/{method_id}/")
+        )
+
+    async def method_get_many(
+        self, method_ids: Iterable[str], workers: int = 8
+    ) -> BatchResult:
+        """Return multiple methods by their IDs.
+
+        Duplicate IDs are fetched only once and the methods are fetched
+        concurrently. The methods that could not be fetched are reported in
+        the batch result errors instead of raising an exception.
+
+        Args:
+            method_ids (iterable): IDs of the methods.
+            workers (int): Number of methods fetched concurrently. Default: 8.
+
+        Returns:
+            BatchResult: Method objects and errors keyed by the method ID.
+        """
+        return await aget_many(self.method_get, method_ids, workers=workers)
+
+    @async_handler
+    async def evaluation_list(
+        self, page: int = 1, items_per_page: int = 50
+    ) -> EvaluationTables:
+        """Return a paginated list of evaluation tables.
+
+        Args:
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            EvaluationTables: Evaluation table page object.
+        """
+        params = self.__params(page, items_per_page)
+        return await self.__page(
+            self.http.get("/evaluations/", params=params),
+            EvaluationTables,
+        )
+
+    @async_handler
+    @memoize("evaluation")
+    async def evaluation_get(self, evaluation_id: str) -> EvaluationTable:
+        """Return a evaluation table by it's ID.
+
+        Args:
+            evaluation_id (str): ID of the evaluation table.
+
+        Returns:
+            EvaluationTable: Evaluation table object.
+        """
+        return self.__model(
+            EvaluationTable,
+            await self.http.get(f"/evaluations/{evaluation_id}/"),
+        )
+
+    async def evaluation_get_many(
+        self, evaluation_ids: Iterable[str], workers: int = 8
+    ) -> BatchResult:
+        """Return multiple evaluation tables by their IDs.
+
+        Duplicate IDs are fetched only once and the evaluation tables are
+        fetched concurrently. The evaluation tables that could not be fetched
+        are reported in the batch result errors instead of raising an
+        exception.
+
+        Args:
+            evaluation_ids (iterable): IDs of the evaluation tables.
+            workers (int): Number of evaluation tables fetched concurrently.
+                Default: 8.
+
+        Returns:
+            BatchResult: EvaluationTable objects and errors keyed by the
+                evaluation table ID.
+        """
+        return await aget_many(
+            self.evaluation_get, evaluation_ids, workers=workers
+        )
+
+    @async_handler
+    async def evaluation_create(
+        self, evaluation: EvaluationTableCreateRequest
+    ) -> EvaluationTable:
+        """Create an evaluation table.
+
+        Args:
+            evaluation (EvaluationTableCreateRequest): Evaluation table create
+                request object.
+
+        Returns:
+            EvaluationTable: The new created evaluation table.
+        """
+        return self.__model(
+            EvaluationTable,
+            await self.http.post("/evaluations/", data=evaluation),
+        )
+
+    @async_handler
+    @invalidate("evaluation", "evaluation_id")
+    async def evaluation_update(
+        self, evaluation_id: str, evaluation: EvaluationTableUpdateRequest
+    ) -> EvaluationTable:
+        """Update an evaluation table.
+
+        Args:
+            evaluation_id (str): ID of the evaluation table.
+            evaluation (EvaluationTableUpdateRequest): Evaluation table update
+                request object.
+
+        Returns:
+            EvaluationTable: The updated evaluation table.
+        """
+        return self.__model(
+            EvaluationTable,
+            await self.http.patch(
+                f"/evaluations/{evaluation_id}/", data=evaluation
+            ),
+        )
+
+    @async_handler
+    @invalidate("evaluation", "evaluation_id")
+    async def evaluation_delete(self, evaluation_id: str):
+        """Delete an evaluation table.
+
+        Args:
+            evaluation_id (str): ID of the evaluation table.
+        """
+        await self.http.delete(f"/evaluations/{evaluation_id}/")
+
+    @async_handler
+    async def evaluation_metric_list(
+        self, evaluation_id: str, page: int = 1, items_per_page: int = 50
+    ) -> Metrics:
+        """List all metrics used in the evaluation table.
+
+        Args:
+            evaluation_id (str): ID of the evaluation table.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Metrics: Metrics object.
+        """
+        params = self.__params(page, items_per_page)
+        return await self.__page(
+            self.http.get(
+                f"/evaluations/{evaluation_id}/metrics/", params=params
+            ),
+            Metrics,
+        )
+
+    @async_handler
+    @memoize("metric")
+    async def evaluation_metric_get(
+        self, evaluation_id: str, metric_id: str
+    ) -> Metric:
+        """Get a metrics used in the evaluation table.
+
+        Args:
+            evaluation_id (str): ID of the evaluation table.
+            metric_id (str): ID of the metric.
+
+        Returns:
+            Metric: Requested metric.
+        """
+        return self.__model(
+            Metric,
+            await self.http.get(
+                f"/evaluations/{evaluation_id}/metrics/{metric_id}/"
+            ),
+        )
+
+    @async_handler
+    async def evaluation_metric_add(
+        self, evaluation_id: str, metric: MetricCreateRequest
+    ) -> Metric:
+        """Add a metrics to the evaluation table.
+
+        Args:
+            evaluation_id (str): ID of the evaluation table.
+            metric (MetricCreateRequest): Metric create request.
+
+        Returns:
+            Metric: Created metric.
+        """
+        return self.__model(
+            Metric,
+            await self.http.post(
+                f"/evaluations/{evaluation_id}/metrics/", data=metric
+            ),
+        )
+
+    @async_handler
+    @invalidate("metric", "evaluation_id", "metric_id")
+    async def evaluation_metric_update(
+        self, evaluation_id: str, metric_id: str, metric: MetricUpdateRequest
+    ) -> Metric:
+        """Update a metrics in the evaluation table.
+
+        Args:
+            evaluation_id (str): ID of the evaluation table.
+            metric_id (str): ID of the metric.
+            metric (MetricCreateRequest): Metric update request.
+
+        Returns:
+            Metric: Updated metric.
+        """
+        return self.__model(
+            Metric,
+            await self.http.patch(
+                f"/evaluations/{evaluation_id}/metrics/{metric_id}/",
+                data=metric,
+            ),
+        )
+
+    @async_handler
+    @invalidate("metric", "evaluation_id", "metric_id")
+    async def evaluation_metric_delete(
+        self, evaluation_id: str, metric_id: str
+    ):
+        """Delete a metrics from the evaluation table.
+
+        Args:
+            evaluation_id (str): ID of the evaluation table.
+            metric_id (str): ID of the metric.
+        """
+        await self.http.delete(
+            f"/evaluations/{evaluation_id}/metrics/{metric_id}/"
+        )
+
+    @async_handler
+    async def evaluation_result_list(
+        self, evaluation_id: str, page: int = 1, items_per_page: int = 50
+    ) -> Results:
+        """List all results from the evaluation table.
+
+        Args:
+            evaluation_id (str): ID of the evaluation table.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Results: Results object.
+        """
+        params = self.__params(page, items_per_page)
+        return await self.__page(
+            self.http.get(
+                f"/evaluations/{evaluation_id}/results/", params=params
+            ),
+            Results,
+        )
+
+    async def evaluation_result_frame(
+        self,
+        evaluation_id: str,
+        items_per_page: int = 500,
+        workers: int = 1,
+    ) -> ResultFrame:
+        """Return all the results of the evaluation table in columns.
+
+        All the pages of `evaluation_result_list` are fetched and the results
+        are converted to a `ResultFrame`, with one array of floats per metric
+        and the evaluation dates parsed. Requires numpy, and pandas for
+        `ResultFrame.to_pandas`.
+
+        Args:
+            evaluation_id (str): ID of the evaluation table.
+            items_per_page (int): Number of results fetched per request.
+                Default: 500.
+            workers (int): Number of pages fetched concurrently. Default: 1.
+
+        Returns:
+            ResultFrame: Results of the evaluation table.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        return ResultFrame.from_results(
+            [
+                result
+                async for result in aiterate(
+                    self.evaluation_result_list,
+                    evaluation_id,
+                    items_per_page=items_per_page,
+                    workers=workers,
+                )
+            ]
+        )
+
+    async def evaluation_ranking(
+        self,
+        evaluation_id: str,
+        items_per_page: int = 500,
+        workers: int = 1,
+    ) -> Ranking:
+        """Return the local ranking of the results of the evaluation table.
+
+        The ranks are computed locally from the metric values and the
+        `is_loss` flag of the metrics, see `Ranking`, and can be used to
+        preview the ranks of new results before adding them.
+
+        Args:
+            evaluation_id (str): ID of the evaluation table.
+            items_per_page (int): Number of results fetched per request.
+                Default: 500.
+            workers (int): Number of pages fetched concurrently. Default: 1.
+
+        Returns:
+            Ranking: Ranking of the results of the evaluation table.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        metrics = [
+            metric
+            async for metric in aiterate(
+                self.evaluation_metric_list, evaluation_id
+            )
+        ]
+        frame = await self.evaluation_result_frame(
+            evaluation_id, items_per_page=items_per_page, workers=workers
+        )
+        return Ranking.from_frame(frame, metrics)
+
+    @async_handler
+    @memoize("result")
+    async def evaluation_result_get(
+        self, evaluation_id: str, result_id: str
+    ) -> Result:
+        """Get a result from the evaluation table.
+
+        Args:
+            evaluation_id (str): ID of the evaluation table.
+            result_id (str): ID of the result.
+
+        Returns:
+            Result: Requested result.
+        """
+        return self.__model(
+            Result,
+            await self.http.get(
+                f"/evaluations/{evaluation_id}/results/{result_id}/"
+            ),
+        )
+
+    @async_handler
+    async def evaluation_result_add(
+        self, evaluation_id: str, result: ResultCreateRequest
+    ) -> Result:
+        """Add a result to the evaluation table.
+
+        Args:
+            evaluation_id (str): ID of the evaluation table.
+            result (ResultCreateRequest): Result create request.
+
+        Returns:
+            Result: Created result.
+        """
+        return self.__model(
+            Result,
+            await self.http.post(
+                f"/evaluations/{evaluation_id}/results/", data=result
+            ),
+        )
+
+    @async_handler
+    @invalidate("result", "evaluation_id", "result_id")
+    async def evaluation_result_update(
+        self, evaluation_id: str, result_id: str, result: ResultUpdateRequest
+    ) -> Result:
+        """Update a result in the evaluation table.
+
+        Args:
+            evaluation_id (str): ID of the evaluation table.
+            result_id (str): ID of the result.
+            result (ResultUpdateRequest): Result update request.
+
+        Returns:
+            Result: Updated result.
+        """
+        return self.__model(
+            Result,
+            await self.http.patch(
+                f"/evaluations/{evaluation_id}/results/{result_id}/",
+                data=result,
+            ),
+        )
+
+    @async_handler
+    @invalidate("result", "evaluation_id", "result_id")
+    async def evaluation_result_delete(
+        self, evaluation_id: str, result_id: str
+    ):
+        """Delete a result from the evaluation table.
+
+        Args:
+            evaluation_id (str): ID of the evaluation table.
+            result_id (str): ID of the result.
+        """
+        await self.http.delete(
+            f"/evaluations/{evaluation_id}/results/{result_id}/"
+        )
+
+    @async_handler
+    @invalidate("evaluation")
+    @invalidate("metric")
+    @invalidate("result")
+    async def evaluation_synchronize(
+        self,
+        evaluation: EvaluationTableSyncRequest,
+        chunk_size: Optional[int] = None,
+        retries: int = 3,
+        progress: Optional[Callable[[int, int], None]] = None,
+        state: Optional[SyncState] = None,
+        delta: Optional[SyncDelta] = None,
+        validate: bool = False,
+    ) -> EvaluationTableSyncResponse:
+        """Synchronize an evaluation table.
+
+        By default the table is sent with all its results in one request.
+        Very large tables can be sent in chunks of `chunk_size` results
+        instead. Every chunk has the table and the metrics and a slice of
+        the results, so the server must match the results by their
+        `external_id`, which every result must have. Chunks that fail with
+        a timeout, a connection error, a 429 or a 5xx response are retried.
+        If a chunk still fails, the error is raised and calling the method
+        again with the same `state` sends only the chunks that did not
+        succeed.
+
+        With a `SyncDelta`, only the results that are new or changed since
+        the last synchronization are sent, and the response contains only
+        those results.
+
+        Example:
+            >>> state = SyncState()
+            >>> try:
+            ...     await client.evaluation_synchronize(
+            ...         evaluation, chunk_size=1000, state=state
+            ...     )
+            ... except PapersWithCodeError:
+            ...     await client.evaluation_synchronize(
+            ...         evaluation, chunk_size=1000, state=state
+            ...     )
+
+        Args:
+            evaluation (EvaluationTableSyncRequest): Evaluation table to
+                synchronize.
+            chunk_size (int, optional): Maximal number of results per
+                request. Default: all results in one request.
+            retries (int): Maximal number of retries of a chunk. Used only
+                with `chunk_size`. Default: 3.
+            progress (callable, optional): Called with the number of
+                synchronized results and the total number of results after
+                every chunk.
+            state (SyncState, optional): State of a previous failed chunked
+                synchronization to resume.
+            delta (SyncDelta, optional): Record of the synchronized results.
+                A failed synchronization with a delta is resumed by calling
+                the method again with the same delta, so it can't be
+                combined with `state`.
+            validate (bool): If True, the table is checked with
+                `validate_evaluation` before anything is sent, and all the
+                problems found are raised together. Default: False.
+
+        Returns:
+            EvaluationTableSyncResponse: Synchronized evaluation table.
+
+        Raises:
+            ValueError: If both `state` and `delta` are given, or if
+                `chunk_size` is given and a result has no `external_id`.
+            SyncValidationError: If `validate` is True and the table is not
+                valid.
+        """
+        if state is not None and delta is not None:
+            raise ValueError("A delta synchronization can't use a state.")
+        if validate:
+            report = validate_evaluation(evaluation)
+            if not report.ok:
+                raise SyncValidationError(report)
+        if delta is not None:
+            evaluation = delta.changed(evaluation)
+
+        async def post(chunk):
+            d = await self.http.post(
+                "/rpc/evaluation-synchronize/", data=chunk
+            )
+            if delta is not None:
+                delta.commit(chunk)
+            return d
+
+        if chunk_size is None:
+            d = await post(evaluation)
+        else:
+            d = await asynchronize_chunked(
+                post,
+                evaluation,
+                chunk_size,
+                retries=retries,
+                progress=progress,
+                state=state,
+            )
+        return self.__model(EvaluationTableSyncResponse, d)
+
+    async def evaluation_synchronize_many(
+        self,
+        evaluations: Iterable[EvaluationTableSyncRequest],
+        workers: int = 4,
+        chunk_size: Optional[int] = None,
+        retries: int = 3,
+        delta: Optional[SyncDelta] = None,
+        validate: bool = False,
+    ) -> BatchResult:
+        """Synchronize multiple evaluation tables concurrently.
+
+        The tables are synchronized with `evaluation_synchronize`. The tables
+        that could not be synchronized are reported in the batch result
+        errors instead of raising an exception, and don't stop the other
+        tables from being synchronized.
+
+        Args:
+            evaluations (iterable): Evaluation tables to synchronize.
+            workers (int): Number of tables synchronized concurrently.
+                Default: 4.
+            chunk_size (int, optional): Maximal number of results per
+                request. Default: all results of a table in one request.
+            retries (int): Maximal number of retries of a chunk. Used only
+                with `chunk_size`. Default: 3.
+            delta (SyncDelta, optional): Record of the synchronized results,
+                to send only the new and changed results.
+            validate (bool): If True, every table is validated before it is
+                sent. Default: False.
+
+        Returns:
+            BatchResult: Synchronized evaluation tables and errors keyed by
+                the position of the table in `evaluations`.
+
+        Raises:
+            ValueError: If an evaluation table is given more than once.
+        """
+        evaluations = list(evaluations)
+        _check_unique(evaluations)
+        return await aget_many(
+            lambda index: self.evaluation_synchronize(
+                evaluations[index],
+                chunk_size=chunk_size,
+                retries=retries,
+                delta=delta,
+                validate=validate,
+            ),
+            range(len(evaluations)),
+            workers=workers,
+        )
@@ -0,0 +1,115 @@
+__all__ = ["BatchResult", "get_many", "aget_many"]
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterable
+
+from paperswithcode.errors import PapersWithCodeError
+
+
+class BatchResult:
+    """Result of a batch operation.
+
+    Attributes:
+        results (dict): Mapping from the key (e.g. object ID) to the result
+            for all the successful operations.
+        errors (dict): Mapping from the key to the raised
+            `PapersWithCodeError` for all the failed operations.
+    """
+
+    __slots__ = ("results", "errors")
+
+    def __init__(self):
+        self.results: Dict[Hashable, Any] = {}
+        self.errors: Dict[Hashable, PapersWithCodeError] = {}
+
+    def __repr__(self):
+        return (
+            f"BatchResult(results={len(self.results)}, "
+            f"errors={len(self.errors)})"
+        )
+
+    def __len__(self):
+        return len(self.results) + len(self.errors)
+
+    def __contains__(self, key):
+        return key in self.results or key in self.errors
+
+    def __getitem__(self, key):
+        """Return the result for the key or raise its error."""
+        if key in self.errors:
+            raise self.errors[key]
+        return self.results[key]
+
+    @property
+    def ok(self) -> bool:
+        """True if all the operations succeeded."""
+        return not self.errors
+
+
+def get_many(
+    getter: Callable[[Hashable], Any],
+    ids: Iterable[Hashable],
+    workers: int = 8,
+) -> BatchResult:
+    """Fetch multiple objects concurrently.
+
+    Duplicate IDs are fetched only once. A failure to fetch one object does
+    not stop the others from being fetched, the error is recorded in the
+    batch result instead.
+
+    Args:
+        getter (callable): Client getter method, e.g. `client.paper_get`.
+        ids (iterable): IDs of the objects to fetch.
+        workers (int): Number of objects fetched concurrently. Default: 8.
+
+    Returns:
+        BatchResult: Fetched objects and errors keyed by the object ID.
+    """
+    batch = BatchResult()
+
+    def fetch(object_id):
+        try:
+            batch.results[object_id] = getter(object_id)
+        except PapersWithCodeError as e:
+            batch.errors[object_id] = e
+
+    unique = list(dict.fromkeys(ids))
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        # Consume the iterator so that unexpected errors are raised here.
+        list(executor.map(fetch, unique))
+    return batch
+
+
+async def aget_many(
+    getter: Callable[[Hashable], Awaitable[Any]],
+    ids: Iterable[Hashable],
+    workers: int = 8,
+) -> BatchResult:
+    """Fetch multiple objects concurrently using an async client getter.
+
+    Asynchronous counterpart of `get_many`.
+
+    Args:
+        getter (callable): Async client getter method, e.g.
+            `client.paper_get`.
+        ids (iterable): IDs of the objects to fetch.
+        workers (int): Number of objects fetched concurrently. Default: 8.
+
+    Returns:
+        BatchResult: Fetched objects and errors keyed by the object ID.
+    """
+    batch = BatchResult()
+    semaphore = asyncio.Semaphore(max(1, workers))
+
+    async def fetch(object_id):
+        async with semaphore:
+            try:
+                batch.results[object_id] = await getter(object_id)
+            except PapersWithCodeError as e:
+                batch.errors[object_id] = e
+
+    await asyncio.gather(
+        *[fetch(object_id) for object_id in dict.fromkeys(ids)]
+    )
+    return batch
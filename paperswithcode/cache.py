@@ -0,0 +1,442 @@
+__all__ = [
+    "CacheEntry",
+    "DiskCache",
+    "MemoryCache",
+    "memoize",
+    "invalidate",
+]
+
+import time
+import asyncio
+import inspect
+import functools
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from collections import OrderedDict
+from urllib import parse
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+import httpx
+
+
+class CacheEntry:
+    """Cached response.
+
+    Attributes:
+        body (bytes): Response body.
+        etag (str, optional): Value of the ETag response header.
+        last_modified (str, optional): Value of the Last-Modified response
+            header.
+        stored_at (float): Unix timestamp when the response was stored or
+            last revalidated.
+    """
+
+    __slots__ = ("body", "etag", "last_modified", "stored_at")
+
+    def __init__(
+        self,
+        body: bytes,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        stored_at: float,
+    ):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.stored_at = stored_at
+
+    def __repr__(self):
+        return (
+            f"CacheEntry(etag={self.etag!r}, "
+            f"last_modified={self.last_modified!r}, "
+            f"stored_at={self.stored_at}, size={len(self.body)})"
+        )
+
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Conditional request headers used to revalidate the entry."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class DiskCache:
+    """Persistent HTTP response cache.
+
+    Responses to GET requests are stored in an SQLite database, keyed by the
+    request URL, the query parameters and the authorization token. Cached
+    responses are revalidated with the server using the `If-None-Match` and
+    `If-Modified-Since` headers, so unchanged resources are answered with a
+    body-less `304 Not Modified` response. Responses younger than `max_age`
+    seconds are served without contacting the server at all.
+
+    When the total size of the cached bodies exceeds `max_size` bytes, the
+    least recently used responses are evicted.
+
+    With `max_age` set, the client removes all the cached responses of its
+    server after every request that modifies data (POST, PATCH or DELETE),
+    since a write can change many resources, e.g. an evaluation table
+    synchronization changes the paper results. Changes made by other
+    clients, e.g. on the website, are seen once the cached responses are
+    older than `max_age`. Without `max_age` the responses are always
+    revalidated, so nothing needs to be removed.
+
+    The cache can be shared between threads and between processes.
+
+    Args:
+        path (str or Path, optional): Path to the cache database. Default:
+            `~/.paperswithcode/cache.sqlite`.
+        max_size (int): Maximal total size of the cached response bodies in
+            bytes. Default: 256 MiB.
+        max_age (float): Number of seconds during which a cached response is
+            served without revalidation. Default: 0, always revalidate.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Union[str, Path]] = None,
+        max_size: int = 256 * 1024 * 1024,
+        max_age: float = 0,
+    ):
+        if path is None:
+            path = Path("~/.paperswithcode/cache.sqlite")
+        self.path = Path(path).expanduser().absolute()
+        self.max_size = max_size
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, "
+            "url TEXT NOT NULL, "
+            "body BLOB NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "etag TEXT, "
+            "last_modified TEXT, "
+            "stored_at REAL NOT NULL, "
+            "accessed_at REAL NOT NULL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS responses_accessed_at "
+            "ON responses (accessed_at)"
+        )
+
+    @staticmethod
+    def key(
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        authorization: Optional[str] = None,
+    ) -> str:
+        """Return the cache key for the request.
+
+        Authenticated responses can contain private data, so the
+        `Authorization` header is part of the key and clients with different
+        tokens never share responses. Only the hash of the header is stored.
+        """
+        query = parse.urlencode(sorted((params or {}).items()))
+        return hashlib.sha256(
+            f"{authorization or ''}\n{url}?{query}".encode("utf-8")
+        ).hexdigest()
+
+    @property
+    def size(self) -> int:
+        """Total size of all the cached response bodies in bytes."""
+        with self._lock:
+            (size,) = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return size
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Can the entry be used without revalidating it with the server."""
+        return time.time() - entry.stored_at < self.max_age
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Return the cached response and mark it as recently used."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, etag, last_modified, stored_at "
+                "FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        return CacheEntry(*row)
+
+    def store(self, key: str, response: httpx.Response):
+        """Store a successful response.
+
+        Responses without the ETag and Last-Modified headers cannot be
+        revalidated and are stored only if `max_age` is set. Responses marked
+        with `Cache-Control: no-store` are never stored.
+        """
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return
+        if etag is None and last_modified is None and self.max_age <= 0:
+            return
+        body = response.content
+        if len(body) > self.max_size:
+            return
+        # Without the query, so that all the responses of a server can be
+        # removed by `invalidate`.
+        url = str(response.request.url.copy_with(query=None))
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, url, body, size, etag, last_modified, stored_at, "
+                "accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, url, body, len(body), etag, last_modified, now, now),
+            )
+            self._evict()
+
+    def revalidated(self, key: str, response: httpx.Response):
+        """Mark the entry as fresh after a `304 Not Modified` response."""
+        now = time.time()
+        with self._lock:
+            self._db.execute(
+                "UPDATE responses SET "
+                "etag = COALESCE(?, etag), "
+                "last_modified = COALESCE(?, last_modified), "
+                "stored_at = ?, accessed_at = ? WHERE key = ?",
+                (
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    now,
+                    now,
+                    key,
+                ),
+            )
+
+    def delete(self, key: str):
+        """Remove the cached response."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def invalidate(self, url: str):
+        """Remove the cached responses of all the URLs starting with `url`.
+
+        Args:
+            url (str): URL prefix, e.g. the API root URL of a server.
+        """
+        with self._lock:
+            self._db.execute(
+                "DELETE FROM responses WHERE substr(url, 1, ?) = ?",
+                (len(url), url),
+            )
+
+    def clear(self):
+        """Remove all cached responses."""
+        with self._lock:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self):
+        """Close the cache database."""
+        with self._lock:
+            self._db.close()
+
+    def _evict(self):
+        (size,) = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        if size <= self.max_size:
+            return
+        rows = self._db.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        )
+        evicted = []
+        for key, entry_size in rows:
+            if size <= self.max_size:
+                break
+            evicted.append((key,))
+            size -= entry_size
+        self._db.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+
+class MemoryCache:
+    """In-process cache for objects returned by the client getters.
+
+    Entries expire `ttl` seconds after they were stored. When the cache holds
+    more than `max_entries` entries, the least recently used ones are
+    evicted. Every entry belongs to a resource (e.g. "task" or "paper") and
+    can be invalidated individually or together with all the other entries
+    of the same resource.
+
+    The cached objects are shared between the callers, they should not be
+    modified in place.
+
+    Args:
+        ttl (float): Number of seconds after which an entry expires.
+            Default: 300.
+        max_entries (int): Maximal number of entries in the cache.
+            Default: 10000.
+        resource_ttl (dict, optional): Per resource time to live overrides,
+            e.g. `{"paper": 3600}`.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 300,
+        max_entries: int = 10000,
+        resource_ttl: Optional[Dict[str, float]] = None,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.resource_ttl = resource_ttl or {}
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, resource: str, key: Hashable) -> Tuple[bool, Any]:
+        """Return a `(found, value)` pair for the resource key."""
+        with self._lock:
+            item = self._entries.get((resource, key))
+            if item is None:
+                return False, None
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._entries[(resource, key)]
+                return False, None
+            self._entries.move_to_end((resource, key))
+            return True, value
+
+    def set(self, resource: str, key: Hashable, value: Any):
+        """Store the value for the resource key."""
+        ttl = self.resource_ttl.get(resource, self.ttl)
+        with self._lock:
+            self._entries[(resource, key)] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end((resource, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, resource: str, key: Optional[Hashable] = None):
+        """Remove the resource key, or all the resource entries if no key."""
+        with self._lock:
+            if key is not None:
+                self._entries.pop((resource, key), None)
+                return
+            for item in [k for k in self._entries if k[0] == resource]:
+                del self._entries[item]
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+def _key(
+    signature: inspect.Signature, arguments: Tuple[str], args, kwargs
+) -> Tuple:
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return tuple(bound.arguments[name] for name in arguments)
+
+
+def memoize(resource: str) -> Callable:
+    """Cache the client method results in the client memory cache.
+
+    The results are stored under the resource, keyed by all the method
+    arguments. Methods are called directly if the client has no memory
+    cache. Works with both regular and coroutine methods.
+
+    Args:
+        resource (str): Name of the resource returned by the method.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+        arguments = tuple(signature.parameters)[1:]
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                cache = self.memory_cache
+                if cache is None:
+                    return await func(self, *args, **kwargs)
+                key = _key(signature, arguments, (self,) + args, kwargs)
+                found, value = cache.get(resource, key)
+                if not found:
+                    value = await func(self, *args, **kwargs)
+                    cache.set(resource, key, value)
+                return value
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            cache = self.memory_cache
+            if cache is None:
+                return func(self, *args, **kwargs)
+            key = _key(signature, arguments, (self,) + args, kwargs)
+            found, value = cache.get(resource, key)
+            if not found:
+                value = func(self, *args, **kwargs)
+                cache.set(resource, key, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def invalidate(resource: str, *arguments: str) -> Callable:
+    """Invalidate memory cache entries after a successful client call.
+
+    Args:
+        resource (str): Name of the resource modified by the method.
+        *arguments (str): Names of the method arguments that form the key of
+            the modified entry. The key must match the arguments of the
+            memoized getter. If no arguments are provided, all the resource
+            entries are invalidated.
+    """
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        def clear(self, args, kwargs):
+            cache = self.memory_cache
+            if cache is None:
+                return
+            if arguments:
+                key = _key(signature, arguments, (self,) + args, kwargs)
+                cache.invalidate(resource, key)
+            else:
+                cache.invalidate(resource)
+
+        if asyncio.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self, *args, **kwargs):
+                result = await func(self, *args, **kwargs)
+                clear(self, args, kwargs)
+                return result
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            result = func(self, *args, **kwargs)
+            clear(self, args, kwargs)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -1,11 +1,18 @@
+import copy
+import functools
 from urllib import parse
-from typing import Dict, Optional
+from typing import Callable, Dict, Iterable, Optional
 
-
-from tea_client.http import HttpClient
 from tea_client.handler import handler
 
-from paperswithcode.config import config
+from paperswithcode.batch import BatchResult, get_many
+from paperswithcode.cache import DiskCache, MemoryCache, invalidate, memoize
+from paperswithcode.codec import JsonCodec
+from paperswithcode.config import get_config
+from paperswithcode.construct import construct
+from paperswithcode.errors import SyncValidationError
+from paperswithcode.frame import ResultFrame
+from paperswithcode.http import HttpClient, PoolLimits
 from paperswithcode.models import (
     Paper,
     Papers,
@@ -45,18 +52,156 @@ from paperswithcode.models import (
     EvaluationTableSyncRequest,
     EvaluationTableSyncResponse,
 )
+from paperswithcode.pagination import iterate
+from paperswithcode.ranking import Ranking
+from paperswithcode.ratelimit import RateLimiter
+from paperswithcode.streaming import (
+    DeferredRequest,
+    PageStream,
+    StreamingHttpClient,
+)
+from paperswithcode.synchronize import (
+    SyncDelta,
+    SyncState,
+    _check_unique,
+    synchronize_chunked,
+)
+from paperswithcode.validation import validate_evaluation
 
 
 class PapersWithCodeClient:
-    """PapersWithCode client."""
-
-    def __init__(self, token=None, url=None):
+    """PapersWithCode client.
+
+    Requests are made over a pool of persistent connections which is shared
+    by all the threads using the client. The pool can be configured by
+    passing `PoolLimits`. The client can be used as a context manager, which
+    closes the connection pool on exit.
+
+    Args:
+        token (str, optional): API token used for authentication.
+        url (str, optional): URL of the PapersWithCode server.
+        pool_limits (PoolLimits, optional): Connection pool configuration.
+        cache (DiskCache, optional): Persistent cache for the responses to
+            the GET requests. Responses are not cached by default.
+        memory_cache (MemoryCache, optional): In-process cache for the
+            objects returned by the single object getters (`paper_get`,
+            `task_get`, ...). Entries are invalidated by the client methods
+            that update or delete the objects.
+        rate_limiter (RateLimiter, optional): Client side rate limiter that
+            throttles the requests, adapts to the server responses and
+            retries the failed GET requests. Requests are not throttled by
+            default.
+        coalesce (bool): If True, identical GET requests made concurrently
+            share a single request to the server. Default: True.
+        trusted (bool): If True, the responses are trusted to match the
+            models and the models are built without validating the values
+            that already have the right type, which is several times faster
+            for large pages. Default: False.
+        codec (JsonCodec, optional): JSON codec used to serialize the
+            request bodies and deserialize the responses. Default: orjson if
+            it is installed, otherwise the standard library.
+        compress_threshold (int, optional): Request bodies of at least this
+            many bytes, e.g. large `evaluation_synchronize` requests, are
+            sent gzip compressed. If the server rejects a compressed body,
+            the request is sent again uncompressed and the compression is
+            disabled. Default: None, the bodies are not compressed.
+    """
+
+    # Set on the clients returned by the `raw` and `streaming` properties.
+    _raw = False
+    _raw_client = None
+    _streaming_client = None
+
+    def __init__(
+        self,
+        token=None,
+        url=None,
+        pool_limits: Optional[PoolLimits] = None,
+        cache: Optional[DiskCache] = None,
+        memory_cache: Optional[MemoryCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce: bool = True,
+        trusted: bool = False,
+        codec: Optional[JsonCodec] = None,
+        compress_threshold: Optional[int] = None,
+    ):
+        config = get_config()
         url = url or config.server_url
         self.http = HttpClient(
             url=f"{url}/api/v{config.api_version}",
             token=token or "",
             authorization_method=HttpClient.Authorization.token,
+            pool_limits=pool_limits,
+            cache=cache,
+            rate_limiter=rate_limiter,
+            coalesce=coalesce,
+            codec=codec,
+            compress_threshold=compress_threshold,
         )
+        self.memory_cache = memory_cache
+        self.trusted = trusted
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the connection pool used by the client."""
+        self.http.close()
+
+    @property
+    def raw(self) -> "PapersWithCodeClient":
+        """Client that returns the deserialized responses instead of models.
+
+        The raw client has the same methods and shares the connection pool
+        and the caches with this client, but skips building the models. The
+        single object methods return the objects as dictionaries, exactly as
+        sent by the server, and the list methods return the pages as
+        dictionaries with the `count`, `next_page`, `previous_page` and
+        `results` keys, so they can be used with the pagination helpers.
+
+        The memory cache is not used by the raw client, since it holds
+        models.
+
+        Example:
+            >>> for page in iterate_pages(client.raw.paper_list):
+            ...     producer.send("papers", page["results"])
+        """
+        if self._raw_client is None:
+            raw = copy.copy(self)
+            raw.memory_cache = None
+            raw._raw = True
+            raw._raw_client = raw
+            raw._streaming_client = None
+            self._raw_client = raw
+        return self._raw_client
+
+    @property
+    def streaming(self) -> "PapersWithCodeClient":
+        """Client whose list methods stream the results.
+
+        The streaming client has the same methods and shares the connection
+        pool with this client, but the list methods return a `PageStream`
+        instead of a page. The results are decoded and built one at a time
+        while they are read from the server, so the memory used does not
+        grow with the page size. The other methods behave as usual.
+
+        Streamed pages are neither cached nor coalesced.
+
+        Example:
+            >>> for paper in iterate(client.streaming.paper_list,
+            ...                      items_per_page=1000):
+            ...     print(paper.title)
+        """
+        if self._streaming_client is None:
+            streaming = copy.copy(self)
+            streaming.http = StreamingHttpClient(self.http)
+            streaming._raw_client = None
+            streaming._streaming_client = streaming
+            self._streaming_client = streaming
+        return self._streaming_client
 
     @staticmethod
     def __params(page: int, items_per_page: int, **kwargs) -> Dict[str, str]:
@@ -75,20 +220,37 @@ class PapersWithCodeClient:
             q = parse.parse_qs(p.query)
             return int(q.get("page", [1])[0])
 
-    @classmethod
-    def __page(cls, result, page_model):
+    def __model(self, model, data):
+        if isinstance(data, DeferredRequest):
+            data = data.load()
+        if self._raw:
+            return data
+        if self.trusted:
+            return construct(model, data)
+        return model(**data)
+
+    def __page(self, result, page_model):
+        if isinstance(result, DeferredRequest):
+            return PageStream(
+                result.stream(),
+                functools.partial(
+                    self.__model, page_model.__fields__["results"].type_
+                ),
+                self.__parse,
+            )
         next_page = result["next"]
         if next_page is not None:
-            next_page = cls.__parse(next_page)
+            next_page = self.__parse(next_page)
         previous_page = result["previous"]
         if previous_page is not None:
-            previous_page = cls.__parse(previous_page)
-        return page_model(
-            count=result["count"],
-            next_page=next_page,
-            previous_page=previous_page,
-            results=result["results"],
-        )
+            previous_page = self.__parse(previous_page)
+        page = {
+            "count": result["count"],
+            "next_page": next_page,
+            "previous_page": previous_page,
+            "results": result["results"],
+        }
+        return self.__model(page_model, page)
 
     @handler
     def search(
@@ -160,6 +322,7 @@ class PapersWithCodeClient:
         )
 
     @handler
+    @memoize("paper")
     def paper_get(self, paper_id: str) -> Paper:
         """Return a paper by it's ID.
 
@@ -169,7 +332,25 @@ class PapersWithCodeClient:
         Returns:
             Paper: Paper object.
         """
-        return Paper(**self.http.get(f"/papers/{paper_id}/"))
+        return self.__model(Paper, self.http.get(f"/papers/{paper_id}/"))
+
+    def paper_get_many(
+        self, paper_ids: Iterable[str], workers: int = 8
+    ) -> BatchResult:
+        """Return multiple papers by their IDs.
+
+        Duplicate IDs are fetched only once and the papers are fetched
+        concurrently. The papers that could not be fetched are reported in
+        the batch result errors instead of raising an exception.
+
+        Args:
+            paper_ids (iterable): IDs of the papers.
+            workers (int): Number of papers fetched concurrently. Default: 8.
+
+        Returns:
+            BatchResult: Paper objects and errors keyed by the paper ID.
+        """
+        return get_many(self.paper_get, paper_ids, workers=workers)
 
     @handler
     def paper_dataset_list(
@@ -337,6 +518,7 @@ class PapersWithCodeClient:
         )
 
     @handler
+    @memoize("repository")
     def repository_get(self, owner: str, name: str) -> Repository:
         """Return a repository by it's owner/name pair.
 
@@ -347,7 +529,9 @@ class PapersWithCodeClient:
         Returns:
             Repository: Repository object.
         """
-        return Repository(**self.http.get(f"/repositories/{owner}/{name}/"))
+        return self.__model(
+            Repository, self.http.get(f"/repositories/{owner}/{name}/")
+        )
 
     @handler
     def repository_paper_list(
@@ -403,6 +587,7 @@ class PapersWithCodeClient:
         return self.__page(self.http.get("/authors/", params=params), Authors)
 
     @handler
+    @memoize("author")
     def author_get(self, author_id: str) -> Author:
         """Return a specific author selected by its id.
 
@@ -412,7 +597,25 @@ class PapersWithCodeClient:
         Returns:
             Author: Author object.
         """
-        return Author(**self.http.get(f"/authors/{author_id}/"))
+        return self.__model(Author, self.http.get(f"/authors/{author_id}/"))
+
+    def author_get_many(
+        self, author_ids: Iterable[str], workers: int = 8
+    ) -> BatchResult:
+        """Return multiple authors by their IDs.
+
+        Duplicate IDs are fetched only once and the authors are fetched
+        concurrently. The authors that could not be fetched are reported in
+        the batch result errors instead of raising an exception.
+
+        Args:
+            author_ids (iterable): IDs of the authors.
+            workers (int): Number of authors fetched concurrently. Default: 8.
+
+        Returns:
+            BatchResult: Author objects and errors keyed by the author ID.
+        """
+        return get_many(self.author_get, author_ids, workers=workers)
 
     @handler
     def author_paper_list(
@@ -465,6 +668,7 @@ class PapersWithCodeClient:
         )
 
     @handler
+    @memoize("conference")
     def conference_get(self, conference_id: str) -> Conference:
         """Return a conference by it's ID.
 
@@ -474,7 +678,29 @@ class PapersWithCodeClient:
         Returns:
             Conference: Conference object.
         """
-        return Conference(**self.http.get(f"/conferences/{conference_id}/"))
+        return self.__model(
+            Conference, self.http.get(f"/conferences/{conference_id}/")
+        )
+
+    def conference_get_many(
+        self, conference_ids: Iterable[str], workers: int = 8
+    ) -> BatchResult:
+        """Return multiple conferences by their IDs.
+
+        Duplicate IDs are fetched only once and the conferences are fetched
+        concurrently. The conferences that could not be fetched are reported in
+        the batch result errors instead of raising an exception.
+
+        Args:
+            conference_ids (iterable): IDs of the conferences.
+            workers (int): Number of conferences fetched concurrently.
+                Default: 8.
+
+        Returns:
+            BatchResult: Conference objects and errors keyed by the
+                conference ID.
+        """
+        return get_many(self.conference_get, conference_ids, workers=workers)
 
     @handler
     def proceeding_list(
@@ -500,6 +726,7 @@ class PapersWithCodeClient:
         )
 
     @handler
+    @memoize("proceeding")
     def proceeding_get(
         self, conference_id: str, proceeding_id: str
     ) -> Proceeding:
@@ -512,10 +739,11 @@ class PapersWithCodeClient:
         Returns:
             Proceeding: Proceeding object.
         """
-        return Proceeding(
-            **self.http.get(
+        return self.__model(
+            Proceeding,
+            self.http.get(
                 f"/conferences/{conference_id}/proceedings/{proceeding_id}/"
-            )
+            ),
         )
 
     @handler
@@ -581,6 +809,7 @@ class PapersWithCodeClient:
         )
 
     @handler
+    @memoize("area")
     def area_get(self, area_id: str) -> Area:
         """Return an area by it's ID.
 
@@ -590,7 +819,25 @@ class PapersWithCodeClient:
         Returns:
             Area: Area object.
         """
-        return Area(**self.http.get(f"/areas/{area_id}/"))
+        return self.__model(Area, self.http.get(f"/areas/{area_id}/"))
+
+    def area_get_many(
+        self, area_ids: Iterable[str], workers: int = 8
+    ) -> BatchResult:
+        """Return multiple areas by their IDs.
+
+        Duplicate IDs are fetched only once and the areas are fetched
+        concurrently. The areas that could not be fetched are reported in
+        the batch result errors instead of raising an exception.
+
+        Args:
+            area_ids (iterable): IDs of the areas.
+            workers (int): Number of areas fetched concurrently. Default: 8.
+
+        Returns:
+            BatchResult: Area objects and errors keyed by the area ID.
+        """
+        return get_many(self.area_get, area_ids, workers=workers)
 
     @handler
     def area_task_list(
@@ -644,6 +891,7 @@ class PapersWithCodeClient:
         )
 
     @handler
+    @memoize("task")
     def task_get(self, task_id: str) -> Task:
         """Return a task by it's ID.
 
@@ -653,7 +901,25 @@ class PapersWithCodeClient:
         Returns:
             Task: Task object.
         """
-        return Task(**self.http.get(f"/tasks/{task_id}/"))
+        return self.__model(Task, self.http.get(f"/tasks/{task_id}/"))
+
+    def task_get_many(
+        self, task_ids: Iterable[str], workers: int = 8
+    ) -> BatchResult:
+        """Return multiple tasks by their IDs.
+
+        Duplicate IDs are fetched only once and the tasks are fetched
+        concurrently. The tasks that could not be fetched are reported in
+        the batch result errors instead of raising an exception.
+
+        Args:
+            task_ids (iterable): IDs of the tasks.
+            workers (int): Number of tasks fetched concurrently. Default: 8.
+
+        Returns:
+            BatchResult: Task objects and errors keyed by the task ID.
+        """
+        return get_many(self.task_get, task_ids, workers=workers)
 
     @handler
     def task_add(self, task: TaskCreateRequest) -> Task:
@@ -665,9 +931,10 @@ class PapersWithCodeClient:
         Returns:
             Task: Created task.
         """
-        return Task(**self.http.post("/tasks/", data=task))
+        return self.__model(Task, self.http.post("/tasks/", data=task))
 
     @handler
+    @invalidate("task", "task_id")
     def task_update(self, task_id: str, task: TaskUpdateRequest) -> Task:
         """Update a task.
 
@@ -678,9 +945,12 @@ class PapersWithCodeClient:
         Returns:
             Task: Updated task.
         """
-        return Task(**self.http.patch(f"/tasks/{task_id}/", data=task))
+        return self.__model(
+            Task, self.http.patch(f"/tasks/{task_id}/", data=task)
+        )
 
     @handler
+    @invalidate("task", "task_id")
     def task_delete(self, task_id: str):
         """Delete a task.
 
@@ -807,6 +1077,7 @@ class PapersWithCodeClient:
         )
 
     @handler
+    @memoize("dataset")
     def dataset_get(self, dataset_id: str) -> Dataset:
         """Return a dastaset by it's ID.
 
@@ -816,7 +1087,25 @@ class PapersWithCodeClient:
         Returns:
             Dataset: Dataset object.
         """
-        return Dataset(**self.http.get(f"/datasets/{dataset_id}/"))
+        return self.__model(Dataset, self.http.get(f"/datasets/{dataset_id}/"))
+
+    def dataset_get_many(
+        self, dataset_ids: Iterable[str], workers: int = 8
+    ) -> BatchResult:
+        """Return multiple datasets by their IDs.
+
+        Duplicate IDs are fetched only once and the datasets are fetched
+        concurrently. The datasets that could not be fetched are reported in
+        the batch result errors instead of raising an exception.
+
+        Args:
+            dataset_ids (iterable): IDs of the datasets.
+            workers (int): Number of datasets fetched concurrently. Default: 8.
+
+        Returns:
+            BatchResult: Dataset objects and errors keyed by the dataset ID.
+        """
+        return get_many(self.dataset_get, dataset_ids, workers=workers)
 
     @handler
     def dataset_add(self, dataset: DatasetCreateRequest) -> Dataset:
@@ -828,9 +1117,12 @@ class PapersWithCodeClient:
         Returns:
             Dataset: Created dataset.
         """
-        return Dataset(**self.http.post("/datasets/", data=dataset))
+        return self.__model(
+            Dataset, self.http.post("/datasets/", data=dataset)
+        )
 
     @handler
+    @invalidate("dataset", "dataset_id")
     def dataset_update(
         self, dataset_id: str, dataset: DatasetUpdateRequest
     ) -> Dataset:
@@ -843,11 +1135,12 @@ class PapersWithCodeClient:
         Returns:
             Dataset: Updated dataset.
         """
-        return Dataset(
-            **self.http.patch(f"/datasets/{dataset_id}/", data=dataset)
+        return self.__model(
+            Dataset, self.http.patch(f"/datasets/{dataset_id}/", data=dataset)
         )
 
     @handler
+    @invalidate("dataset", "dataset_id")
     def dataset_delete(self, dataset_id: str):
         """Delete a dataset.
 
@@ -916,6 +1209,7 @@ class PapersWithCodeClient:
         )
 
     @handler
+    @memoize("method")
     def method_get(self, method_id) -> Method:
         """Return a method by it's ID.
 
@@ -925,7 +1219,25 @@ class PapersWithCodeClient:
         Returns:
             Method: Method object.
         """
-        return Method(**self.http.get(f"/methods/{method_id}/"))
+        return self.__model(Method, self.http.get(f"/methods/{method_id}/"))
+
+    def method_get_many(
+        self, method_ids: Iterable[str], workers: int = 8
+    ) -> BatchResult:
+        """Return multiple methods by their IDs.
+
+        Duplicate IDs are fetched only once and the methods are fetched
+        concurrently. The methods that could not be fetched are reported in
+        the batch result errors instead of raising an exception.
+
+        Args:
+            method_ids (iterable): IDs of the methods.
+            workers (int): Number of methods fetched concurrently. Default: 8.
+
+        Returns:
+            BatchResult: Method objects and errors keyed by the method ID.
+        """
+        return get_many(self.method_get, method_ids, workers=workers)
 
     @handler
     def evaluation_list(
@@ -947,6 +1259,7 @@ class PapersWithCodeClient:
         )
 
     @handler
+    @memoize("evaluation")
     def evaluation_get(self, evaluation_id: str) -> EvaluationTable:
         """Return a evaluation table by it's ID.
 
@@ -956,10 +1269,31 @@ class PapersWithCodeClient:
         Returns:
             EvaluationTable: Evaluation table object.
         """
-        return EvaluationTable(
-            **self.http.get(f"/evaluations/{evaluation_id}/")
+        return self.__model(
+            EvaluationTable, self.http.get(f"/evaluations/{evaluation_id}/")
         )
 
+    def evaluation_get_many(
+        self, evaluation_ids: Iterable[str], workers: int = 8
+    ) -> BatchResult:
+        """Return multiple evaluation tables by their IDs.
+
+        Duplicate IDs are fetched only once and the evaluation tables are
+        fetched concurrently. The evaluation tables that could not be fetched
+        are reported in the batch result errors instead of raising an
+        exception.
+
+        Args:
+            evaluation_ids (iterable): IDs of the evaluation tables.
+            workers (int): Number of evaluation tables fetched concurrently.
+                Default: 8.
+
+        Returns:
+            BatchResult: EvaluationTable objects and errors keyed by the
+                evaluation table ID.
+        """
+        return get_many(self.evaluation_get, evaluation_ids, workers=workers)
+
     @handler
     def evaluation_create(
         self, evaluation: EvaluationTableCreateRequest
@@ -973,11 +1307,12 @@ class PapersWithCodeClient:
         Returns:
             EvaluationTable: The new created evaluation table.
         """
-        return EvaluationTable(
-            **self.http.post("/evaluations/", data=evaluation)
+        return self.__model(
+            EvaluationTable, self.http.post("/evaluations/", data=evaluation)
         )
 
     @handler
+    @invalidate("evaluation", "evaluation_id")
     def evaluation_update(
         self, evaluation_id: str, evaluation: EvaluationTableUpdateRequest
     ) -> EvaluationTable:
@@ -991,13 +1326,13 @@ class PapersWithCodeClient:
         Returns:
             EvaluationTable: The updated evaluation table.
         """
-        return EvaluationTable(
-            **self.http.patch(
-                f"/evaluations/{evaluation_id}/", data=evaluation
-            )
+        return self.__model(
+            EvaluationTable,
+            self.http.patch(f"/evaluations/{evaluation_id}/", data=evaluation),
         )
 
     @handler
+    @invalidate("evaluation", "evaluation_id")
     def evaluation_delete(self, evaluation_id: str):
         """Delete an evaluation table.
 
@@ -1030,6 +1365,7 @@ class PapersWithCodeClient:
         )
 
     @handler
+    @memoize("metric")
     def evaluation_metric_get(
         self, evaluation_id: str, metric_id: str
     ) -> Metric:
@@ -1042,10 +1378,11 @@ class PapersWithCodeClient:
         Returns:
             Metric: Requested metric.
         """
-        return Metric(
-            **self.http.get(
+        return self.__model(
+            Metric,
+            self.http.get(
                 f"/evaluations/{evaluation_id}/metrics/{metric_id}/"
-            )
+            ),
         )
 
     @handler
@@ -1061,13 +1398,15 @@ class PapersWithCodeClient:
         Returns:
             Metric: Created metric.
         """
-        return Metric(
-            **self.http.post(
+        return self.__model(
+            Metric,
+            self.http.post(
                 f"/evaluations/{evaluation_id}/metrics/", data=metric
-            )
+            ),
         )
 
     @handler
+    @invalidate("metric", "evaluation_id", "metric_id")
     def evaluation_metric_update(
         self, evaluation_id: str, metric_id: str, metric: MetricUpdateRequest
     ) -> Metric:
@@ -1081,14 +1420,16 @@ class PapersWithCodeClient:
         Returns:
             Metric: Updated metric.
         """
-        return Metric(
-            **self.http.patch(
+        return self.__model(
+            Metric,
+            self.http.patch(
                 f"/evaluations/{evaluation_id}/metrics/{metric_id}/",
                 data=metric,
-            )
+            ),
         )
 
     @handler
+    @invalidate("metric", "evaluation_id", "metric_id")
     def evaluation_metric_delete(self, evaluation_id: str, metric_id: str):
         """Delete a metrics from the evaluation table.
 
@@ -1121,7 +1462,72 @@ class PapersWithCodeClient:
             Results,
         )
 
+    def evaluation_result_frame(
+        self,
+        evaluation_id: str,
+        items_per_page: int = 500,
+        workers: int = 1,
+    ) -> ResultFrame:
+        """Return all the results of the evaluation table in columns.
+
+        All the pages of `evaluation_result_list` are fetched and the results
+        are converted to a `ResultFrame`, with one array of floats per metric
+        and the evaluation dates parsed. Requires numpy, and pandas for
+        `ResultFrame.to_pandas`.
+
+        Args:
+            evaluation_id (str): ID of the evaluation table.
+            items_per_page (int): Number of results fetched per request.
+                Default: 500.
+            workers (int): Number of pages fetched concurrently. Default: 1.
+
+        Returns:
+            ResultFrame: Results of the evaluation table.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        return ResultFrame.from_results(
+            iterate(
+                self.evaluation_result_list,
+                evaluation_id,
+                items_per_page=items_per_page,
+                workers=workers,
+            )
+        )
+
+    def evaluation_ranking(
+        self,
+        evaluation_id: str,
+        items_per_page: int = 500,
+        workers: int = 1,
+    ) -> Ranking:
+        """Return the local ranking of the results of the evaluation table.
+
+        The ranks are computed locally from the metric values and the
+        `is_loss` flag of the metrics, see `Ranking`, and can be used to
+        preview the ranks of new results before adding them.
+
+        Args:
+            evaluation_id (str): ID of the evaluation table.
+            items_per_page (int): Number of results fetched per request.
+                Default: 500.
+            workers (int): Number of pages fetched concurrently. Default: 1.
+
+        Returns:
+            Ranking: Ranking of the results of the evaluation table.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        metrics = list(iterate(self.evaluation_metric_list, evaluation_id))
+        frame = self.evaluation_result_frame(
+            evaluation_id, items_per_page=items_per_page, workers=workers
+        )
+        return Ranking.from_frame(frame, metrics)
+
     @handler
+    @memoize("result")
     def evaluation_result_get(
         self, evaluation_id: str, result_id: str
     ) -> Result:
@@ -1134,10 +1540,11 @@ class PapersWithCodeClient:
         Returns:
             Result: Requested result.
         """
-        return Result(
-            **self.http.get(
+        return self.__model(
+            Result,
+            self.http.get(
                 f"/evaluations/{evaluation_id}/results/{result_id}/"
-            )
+            ),
         )
 
     @handler
@@ -1153,13 +1560,15 @@ class PapersWithCodeClient:
         Returns:
             Result: Created result.
         """
-        return Result(
-            **self.http.post(
+        return self.__model(
+            Result,
+            self.http.post(
                 f"/evaluations/{evaluation_id}/results/", data=result
-            )
+            ),
         )
 
     @handler
+    @invalidate("result", "evaluation_id", "result_id")
     def evaluation_result_update(
         self, evaluation_id: str, result_id: str, result: ResultUpdateRequest
     ) -> Result:
@@ -1173,14 +1582,16 @@ class PapersWithCodeClient:
         Returns:
             Result: Updated result.
         """
-        return Result(
-            **self.http.patch(
+        return self.__model(
+            Result,
+            self.http.patch(
                 f"/evaluations/{evaluation_id}/results/{result_id}/",
                 data=result,
-            )
+            ),
         )
 
     @handler
+    @invalidate("result", "evaluation_id", "result_id")
     def evaluation_result_delete(self, evaluation_id: str, result_id: str):
         """Delete a result from the evaluation table.
 
@@ -1191,9 +1602,149 @@ class PapersWithCodeClient:
         self.http.delete(f"/evaluations/{evaluation_id}/results/{result_id}/")
 
     @handler
+    @invalidate("evaluation")
+    @invalidate("metric")
+    @invalidate("result")
     def evaluation_synchronize(
-        self, evaluation: EvaluationTableSyncRequest
+        self,
+        evaluation: EvaluationTableSyncRequest,
+        chunk_size: Optional[int] = None,
+        retries: int = 3,
+        progress: Optional[Callable[[int, int], None]] = None,
+        state: Optional[SyncState] = None,
+        delta: Optional[SyncDelta] = None,
+        validate: bool = False,
     ) -> EvaluationTableSyncResponse:
-        d = self.http.post("/rpc/evaluation-synchronize/", data=evaluation)
-        d["results"] = [result for result in d["results"]]
-        return EvaluationTableSyncResponse(**d)
+        """Synchronize an evaluation table.
+
+        By default the table is sent with all its results in one request.
+        Very large tables can be sent in chunks of `chunk_size` results
+        instead. Every chunk has the table and the metrics and a slice of
+        the results, so the server must match the results by their
+        `external_id`, which every result must have. Chunks that fail with
+        a timeout, a connection error, a 429 or a 5xx response are retried.
+        If a chunk still fails, the error is raised and calling the method
+        again with the same `state` sends only the chunks that did not
+        succeed.
+
+        With a `SyncDelta`, only the results that are new or changed since
+        the last synchronization are sent, and the response contains only
+        those results.
+
+        Example:
+            >>> state = SyncState()
+            >>> try:
+            ...     client.evaluation_synchronize(
+            ...         evaluation, chunk_size=1000, state=state
+            ...     )
+            ... except PapersWithCodeError:
+            ...     client.evaluation_synchronize(
+            ...         evaluation, chunk_size=1000, state=state
+            ...     )
+
+        Args:
+            evaluation (EvaluationTableSyncRequest): Evaluation table to
+                synchronize.
+            chunk_size (int, optional): Maximal number of results per
+                request. Default: all results in one request.
+            retries (int): Maximal number of retries of a chunk. Used only
+                with `chunk_size`. Default: 3.
+            progress (callable, optional): Called with the number of
+                synchronized results and the total number of results after
+                every chunk.
+            state (SyncState, optional): State of a previous failed chunked
+                synchronization to resume.
+            delta (SyncDelta, optional): Record of the synchronized results.
+                A failed synchronization with a delta is resumed by calling
+                the method again with the same delta, so it can't be
+                combined with `state`.
+            validate (bool): If True, the table is checked with
+                `validate_evaluation` before anything is sent, and all the
+                problems found are raised together. Default: False.
+
+        Returns:
+            EvaluationTableSyncResponse: Synchronized evaluation table.
+
+        Raises:
+            ValueError: If both `state` and `delta` are given, or if
+                `chunk_size` is given and a result has no `external_id`.
+            SyncValidationError: If `validate` is True and the table is not
+                valid.
+        """
+        if state is not None and delta is not None:
+            raise ValueError("A delta synchronization can't use a state.")
+        if validate:
+            report = validate_evaluation(evaluation)
+            if not report.ok:
+                raise SyncValidationError(report)
+        if delta is not None:
+            evaluation = delta.changed(evaluation)
+
+        def post(chunk):
+            d = self.http.post("/rpc/evaluation-synchronize/", data=chunk)
+            if delta is not None:
+                delta.commit(chunk)
+            return d
+
+        if chunk_size is None:
+            d = post(evaluation)
+        else:
+            d = synchronize_chunked(
+                post,
+                evaluation,
+                chunk_size,
+                retries=retries,
+                progress=progress,
+                state=state,
+            )
+        return self.__model(EvaluationTableSyncResponse, d)
+
+    def evaluation_synchronize_many(
+        self,
+        evaluations: Iterable[EvaluationTableSyncRequest],
+        workers: int = 4,
+        chunk_size: Optional[int] = None,
+        retries: int = 3,
+        delta: Optional[SyncDelta] = None,
+        validate: bool = False,
+    ) -> BatchResult:
+        """Synchronize multiple evaluation tables concurrently.
+
+        The tables are synchronized with `evaluation_synchronize`. The tables
+        that could not be synchronized are reported in the batch result
+        errors instead of raising an exception, and don't stop the other
+        tables from being synchronized.
+
+        Args:
+            evaluations (iterable): Evaluation tables to synchronize.
+            workers (int): Number of tables synchronized concurrently.
+                Default: 4.
+            chunk_size (int, optional): Maximal number of results per
+                request. Default: all results of a table in one request.
+            retries (int): Maximal number of retries of a chunk. Used only
+                with `chunk_size`. Default: 3.
+            delta (SyncDelta, optional): Record of the synchronized results,
+                to send only the new and changed results.
+            validate (bool): If True, every table is validated before it is
+                sent. Default: False.
+
+        Returns:
+            BatchResult: Synchronized evaluation tables and errors keyed by
+                the position of the table in `evaluations`.
+
+        Raises:
+            ValueError: If an evaluation table is given more than once.
+        """
+        evaluations = list(evaluations)
+        _check_unique(evaluations)
+        return get_many(
+            lambda index: self.evaluation_synchronize(
+                evaluations[index],
+                chunk_size=chunk_size,
+                retries=retries,
+                delta=delta,
+                validate=validate,
+            ),
+            range(len(evaluations)),
+            workers=workers,
+        )
@@ -1,3 +1,6 @@
 __all__ = ["app"]
 
 from paperswithcode.commands.app import app
+
+# Register the commands on the app.
+from paperswithcode.commands import mirror  # noqa: F401, E402
@@ -2,8 +2,17 @@ import typer
 
 from tea_console.commands.config import app as config_app
 
+from paperswithcode.config import get_config
+
 
 app = typer.Typer(name="pwc", help="PapersWithCode client.")
 
 # Add tea-console apps
 app.add_typer(config_app)
+
+
+@app.callback()
+def load_config():
+    # The configuration is read only when a command runs, the tea-console
+    # commands find it through the application config class.
+    get_config()
@@ -0,0 +1,74 @@
+from pathlib import Path
+from typing import List, Optional
+
+import typer
+from rich.console import Console
+from tea_console.console import command
+
+from paperswithcode.commands.app import app
+from paperswithcode.config import get_config
+
+
+@command(app, name="mirror")
+def mirror(
+    path: Path = typer.Argument(
+        "paperswithcode.sqlite", help="Path to the mirror database."
+    ),
+    resource: Optional[List[str]] = typer.Option(
+        None,
+        "--resource",
+        "-r",
+        help="Resource to crawl, e.g. papers. Default: all resources.",
+    ),
+    items_per_page: int = typer.Option(
+        500, help="Number of items requested per page."
+    ),
+    workers: int = typer.Option(8, help="Number of concurrent requests."),
+    restart: bool = typer.Option(
+        False, help="Ignore the checkpoints and crawl everything again."
+    ),
+    refresh: bool = typer.Option(
+        False, help="Fetch only the pages changed since the last crawl."
+    ),
+    full: bool = typer.Option(
+        False, help="With --refresh, check every page for changes."
+    ),
+):
+    """Crawl the PapersWithCode catalog into a local SQLite database."""
+    # Imported here so that the other commands start without loading the
+    # client and the models.
+    from paperswithcode.client import PapersWithCodeClient
+    from paperswithcode.mirror import Mirror
+
+    unknown = set(resource or ()) - set(Mirror.RESOURCES)
+    if unknown:
+        raise typer.BadParameter(
+            f"Unknown resources: {', '.join(sorted(unknown))}. "
+            f"Choose from: {', '.join(Mirror.RESOURCES)}.",
+            param_hint="--resource",
+        )
+    console = Console()
+
+    def progress(name, done, total):
+        console.print(f"{name}: {done}/{total}", highlight=False)
+
+    client = PapersWithCodeClient(token=get_config().token_access)
+    with client, Mirror(path, client=client) as m:
+        if not refresh:
+            m.crawl(
+                resources=resource or None,
+                items_per_page=items_per_page,
+                workers=workers,
+                restart=restart,
+                progress=progress,
+            )
+            return
+        updated = m.refresh(
+            resources=resource or None,
+            items_per_page=items_per_page,
+            workers=workers,
+            full=full,
+            progress=progress,
+        )
+        for name, count in updated.items():
+            console.print(f"{name}: {count} updated", highlight=False)
@@ -28,4 +28,17 @@ class Config(TeaConsoleConfig, TeaClientConfig):
         )
 
 
-config = Config()
+def get_config() -> Config:
+    """Return the configuration.
+
+    The configuration file is read on the first call, later calls return the
+    same instance.
+    """
+    return Config()
+
+
+def __getattr__(name):
+    # Kept for backwards compatibility, `config` is loaded on first use.
+    if name == "config":
+        return get_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
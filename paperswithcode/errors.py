@@ -1,6 +1,30 @@
-__all__ = ["PapersWithCodeError"]
+__all__ = ["PapersWithCodeError", "SyncValidationError"]
 
 from tea_client.errors import TeaClientError
 
 
 PapersWithCodeError = TeaClientError
+
+
+class SyncValidationError(PapersWithCodeError):
+    """Evaluation table failed the validation before synchronization.
+
+    Attributes:
+        report (ValidationReport): All the problems found in the table.
+    """
+
+    # Number of problems listed in the message.
+    MAX_LISTED = 10
+
+    def __init__(self, report):
+        lines = [str(issue) for issue in report.issues[: self.MAX_LISTED]]
+        if len(report) > self.MAX_LISTED:
+            lines.append(f"... and {len(report) - self.MAX_LISTED} more.")
+        super().__init__(
+            message=(
+                f"Found {len(report)} problems in the evaluation table:\n"
+                + "\n".join(lines)
+            ),
+            status_code=400,
+        )
+        self.report = report
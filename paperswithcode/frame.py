@@ -0,0 +1,230 @@
+__all__ = ["ResultFrame", "parse_metric_values", "parse_dates"]
+
+import operator
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Tuple, Union
+
+from paperswithcode.models import Result
+from paperswithcode.validation import _parse_number, _valid_date
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy
+    import pandas
+
+
+def _import(module: str):
+    """Import an optional dependency of the result frames."""
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(
+            f"Result frames require {module}. Install it with "
+            f"`pip install paperswithcode-client[frame]`."
+        ) from e
+
+
+def _factorize(values: Iterable[Any]):
+    """Return the distinct values and the index of every value in them.
+
+    Values of different types are distinct, e.g. True, 1 and 1.0, since they
+    are not parsed in the same way. Unhashable values are never merged.
+    """
+    numpy = _import("numpy")
+    codes: Dict[Any, int] = {}
+    get = codes.get
+    uniques = []
+    inverse = []
+    for value in values:
+        key = (value.__class__, value)
+        try:
+            code = get(key)
+        except TypeError:
+            key = code = None
+        if code is None:
+            code = len(uniques)
+            uniques.append(value)
+            if key is not None:
+                codes[key] = code
+        inverse.append(code)
+    return uniques, numpy.array(inverse, dtype=numpy.intp)
+
+
+def parse_metric_values(values: Iterable[Any]) -> "numpy.ndarray":
+    """Parse metric values into an array of floats.
+
+    Metric values are returned by the API as strings, e.g. `"85"`,
+    `"85.3%"` or `"95.1 ± 0.2"`. The leading number of every value is
+    parsed, so percent signs, confidence intervals, units and other
+    suffixes are ignored, and percentages are not divided by 100. Thousands
+    separators are removed. Values without a number, e.g. `"-"` or None,
+    are NaN.
+
+    Every distinct value is parsed only once. Leaderboards repeat the same
+    values a lot, so this is much faster than parsing row by row.
+
+    Args:
+        values (iterable): Metric values, strings or numbers.
+
+    Returns:
+        numpy.ndarray: Array of float64 values.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    numpy = _import("numpy")
+    uniques, inverse = _factorize(values)
+    parsed = numpy.fromiter(
+        map(_parse_number, uniques), dtype=numpy.float64, count=len(uniques)
+    )
+    return parsed[inverse]
+
+
+def parse_dates(values: Iterable[Any]) -> "numpy.ndarray":
+    """Parse dates in the YYYY-MM-DD format into an array of dates.
+
+    Args:
+        values (iterable): Dates, e.g. the `evaluated_on` field of the
+            results.
+
+    Returns:
+        numpy.ndarray: Array of `datetime64[D]` values, NaT for the missing
+            and invalid dates.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    numpy = _import("numpy")
+    uniques, inverse = _factorize(values)
+    parsed = numpy.array(
+        [value if _valid_date(value) else "NaT" for value in uniques],
+        dtype="datetime64[D]",
+    )
+    return parsed[inverse]
+
+
+class ResultFrame:
+    """Columnar representation of the results of an evaluation table.
+
+    Every field of the results is stored as a numpy array with one element
+    per result, and every metric as an array of floats, so leaderboards can
+    be analysed without looping over the results.
+
+    Example:
+        >>> frame = client.evaluation_result_frame("imagenet")
+        >>> frame.metrics["Top 1 Accuracy"].max()
+        90.2
+        >>> df = frame.to_pandas()
+
+    Attributes:
+        id (numpy.ndarray): Result ids.
+        methodology (numpy.ndarray): Methodologies.
+        paper (numpy.ndarray): Paper ids, None for results without a paper.
+        uses_additional_data (numpy.ndarray): Boolean array.
+        best_rank (numpy.ndarray): Best ranks as floats, NaN if missing.
+        evaluated_on (numpy.ndarray): Evaluation dates as `datetime64[D]`,
+            NaT if missing.
+        metrics (dict): Mapping from the metric name to the array of metric
+            values parsed with `parse_metric_values`. NaN for the results
+            without the metric. Metrics are in the order of their first
+            appearance.
+    """
+
+    __slots__ = (
+        "id",
+        "methodology",
+        "paper",
+        "uses_additional_data",
+        "best_rank",
+        "evaluated_on",
+        "metrics",
+    )
+
+    # Columns for the result fields, in the order of `to_pandas`.
+    FIELDS = __slots__[:-1]
+
+    def __init__(self, **columns: Any):
+        for name in self.__slots__:
+            setattr(self, name, columns[name])
+
+    def __repr__(self):
+        return (
+            f"ResultFrame(results={len(self)}, "
+            f"metrics={list(self.metrics)})"
+        )
+
+    def __len__(self):
+        return len(self.id)
+
+    @classmethod
+    def from_results(
+        cls, results: Iterable[Union[Result, Dict[str, Any]]]
+    ) -> "ResultFrame":
+        """Create the frame from results.
+
+        Args:
+            results (iterable): `Result` objects, or dictionaries from the
+                raw client.
+
+        Returns:
+            ResultFrame: Results in columns.
+
+        Raises:
+            ImportError: If numpy is not installed.
+        """
+        numpy = _import("numpy")
+        get_fields = operator.itemgetter(*cls.FIELDS)
+        records: List[Tuple[Any, ...]] = []
+        # Rows and values of every metric, the results don't all have the
+        # same metrics.
+        rows: Dict[str, List[int]] = {}
+        values: Dict[str, List[Any]] = {}
+        for index, result in enumerate(results):
+            if not isinstance(result, dict):
+                result = result.__dict__
+            records.append(get_fields(result))
+            for name, value in (result["metrics"] or {}).items():
+                if name not in rows:
+                    rows[name] = []
+                    values[name] = []
+                rows[name].append(index)
+                values[name].append(value)
+
+        columns = zip(*records) if records else [()] * len(cls.FIELDS)
+        fields = dict(zip(cls.FIELDS, columns))
+        metrics = {}
+        for name in rows:
+            column = numpy.full(len(records), numpy.nan)
+            column[rows[name]] = parse_metric_values(values[name])
+            metrics[name] = column
+        return cls(
+            id=numpy.array(fields["id"], dtype=object),
+            methodology=numpy.array(fields["methodology"], dtype=object),
+            paper=numpy.array(fields["paper"], dtype=object),
+            uses_additional_data=numpy.array(
+                fields["uses_additional_data"], dtype=bool
+            ),
+            best_rank=numpy.array(fields["best_rank"], dtype=numpy.float64),
+            evaluated_on=parse_dates(fields["evaluated_on"]),
+            metrics=metrics,
+        )
+
+    def to_pandas(self) -> "pandas.DataFrame":
+        """Return the results as a pandas data frame.
+
+        The data frame has one column per result field, followed by one
+        column per metric. Metrics named like a result field are prefixed
+        with `metrics.`.
+
+        Returns:
+            pandas.DataFrame: Data frame with one row per result.
+
+        Raises:
+            ImportError: If pandas is not installed.
+        """
+        pandas = _import("pandas")
+        columns = {name: getattr(self, name) for name in self.FIELDS}
+        for name, column in self.metrics.items():
+            columns[
+                f"metrics.{name}" if name in self.FIELDS else name
+            ] = column
+        return pandas.DataFrame(columns)
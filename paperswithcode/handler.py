@@ -0,0 +1,22 @@
+__all__ = ["async_handler"]
+
+import functools
+
+from tea_client.errors import PydanticValidationError, ValidationError
+
+
+def async_handler(func):
+    """Coroutine counterpart of the `tea_client.handler.handler` decorator.
+
+    Converts pydantic validation errors raised while building the request or
+    the response models into client validation errors.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        try:
+            return await func(self, *args, **kwargs)
+        except PydanticValidationError as e:
+            raise ValidationError(error=e)
+
+    return wrapper
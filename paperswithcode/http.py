@@ -0,0 +1,931 @@
+__all__ = ["PoolLimits", "HttpClient", "AsyncHttpClient"]
+
+import copy
+import gzip
+import time
+import asyncio
+import threading
+import contextvars
+from contextlib import asynccontextmanager, contextmanager
+from concurrent.futures import CancelledError, Future
+from typing import AsyncIterator, Dict, Iterator, Optional, Tuple
+
+import httpcore
+import httpx
+from tea_client import errors, http
+from tea_client.models import TeaClientModel
+
+from paperswithcode.cache import CacheEntry, DiskCache
+from paperswithcode.codec import JsonCodec, default_codec
+from paperswithcode.ratelimit import RateLimiter
+
+
+class PoolLimits:
+    """Connection pool configuration.
+
+    All the requests made by one client go to the same server, so the limits
+    are effectively per host limits.
+
+    Attributes:
+        max_connections (int, optional): Maximal number of concurrent
+            connections. None means no limit. Default: 100.
+        max_keepalive_connections (int, optional): Maximal number of idle
+            connections kept alive in the pool. Default: 20.
+        keepalive_expiry (float, optional): Number of seconds after which an
+            idle connection is evicted from the pool. None means that idle
+            connections are never evicted. Default: 5.0.
+    """
+
+    __slots__ = (
+        "max_connections",
+        "max_keepalive_connections",
+        "keepalive_expiry",
+    )
+
+    def __init__(
+        self,
+        max_connections: Optional[int] = 100,
+        max_keepalive_connections: Optional[int] = 20,
+        keepalive_expiry: Optional[float] = 5.0,
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+
+    def __repr__(self):
+        return (
+            f"PoolLimits(max_connections={self.max_connections}, "
+            f"max_keepalive_connections={self.max_keepalive_connections}, "
+            f"keepalive_expiry={self.keepalive_expiry})"
+        )
+
+
+class _Flight:
+    """GET request in flight, shared by the identical concurrent requests.
+
+    Attributes:
+        future (Future): Response of the request, a `concurrent.futures` or
+            an `asyncio` future.
+        waiters (int): Number of identical requests waiting for the
+            response.
+    """
+
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future):
+        self.future = future
+        self.waiters = 0
+
+
+class _BaseHttpClient(http.HttpClient):
+    """Base class for the pooled HTTP clients.
+
+    Unlike the `tea_client` HTTP client, that opens a new connection for
+    every request, these clients keep a pool of persistent connections which
+    are reused between requests.
+    """
+
+    METHODS = ("GET", "POST", "PATCH", "DELETE")
+
+    # Responses to a compressed request after which the request is sent
+    # again uncompressed.
+    COMPRESSION_REJECTED = frozenset((400, 415))
+
+    def __init__(
+        self,
+        url: str,
+        token: str = "",
+        authorization_method: http.AuthorizationMethod = (
+            http.AuthorizationMethod.jwt
+        ),
+        timeout: int = 10,
+        pool_limits: Optional[PoolLimits] = None,
+        cache: Optional[DiskCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalesce: bool = True,
+        codec: Optional[JsonCodec] = None,
+        compress_threshold: Optional[int] = None,
+    ):
+        """Initialize.
+
+        Args:
+            url (str): URL to the server.
+            token (str): Authentication token.
+            authorization_method (AuthorizationMethod): Authorization method.
+            timeout (int): Request timeout time.
+            pool_limits (PoolLimits, optional): Connection pool
+                configuration.
+            cache (DiskCache, optional): Cache for the GET responses.
+            rate_limiter (RateLimiter, optional): Client side rate limiter.
+            coalesce (bool): Share the response between identical GET
+                requests that are in flight at the same time. Default: True.
+            codec (JsonCodec, optional): JSON codec used for the request
+                bodies and the responses. Default: orjson if it is installed,
+                otherwise the standard library.
+            compress_threshold (int, optional): Request bodies of at least
+                this many bytes are sent gzip compressed. Default: None, the
+                bodies are not compressed.
+        """
+        super().__init__(
+            url=url,
+            token=token,
+            authorization_method=authorization_method,
+            timeout=timeout,
+        )
+        self.pool_limits = pool_limits or PoolLimits()
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.coalesce = coalesce
+        self.codec = codec or default_codec()
+        self.compress_threshold = compress_threshold
+        # Cleared when the server turns out not to accept compressed bodies.
+        self.compression_accepted = True
+        self._client = None
+        self._in_flight = {}
+
+    def _pool_options(self) -> dict:
+        # The number of connections is limited by limiting the number of
+        # concurrent requests instead of in the httpcore pool. The pool
+        # blocks the reuse of idle connections while a request is waiting
+        # for a free slot, which ends in a pool timeout under contention.
+        return {
+            "ssl_context": httpx.create_ssl_context(),
+            "max_keepalive_connections": (
+                self.pool_limits.max_keepalive_connections
+            ),
+            "keepalive_expiry": self.pool_limits.keepalive_expiry,
+        }
+
+    def _request_options(
+        self,
+        method: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, str]],
+        data: Optional[TeaClientModel],
+        timeout: Optional[float],
+    ) -> dict:
+        """Build httpx request keyword arguments."""
+        if method not in self.METHODS:
+            raise errors.HttpClientError(
+                f"Unsupported method: {method}", status_code=405
+            )
+
+        headers = {**self.headers, **(headers or {})}
+
+        # Set authorization token
+        if self.token.strip() != "":
+            headers[
+                "Authorization"
+            ] = f"{self.authorization_method.value} {self.token}"
+
+        body = None
+        if data is not None and method in ("POST", "PATCH"):
+            try:
+                body = self.codec.dumps(data.dict())
+            except (TypeError, ValueError) as e:
+                raise errors.HttpClientError(
+                    f"Error while serializing request body: {e!r}",
+                    status_code=400,
+                ) from e
+
+        return {
+            "headers": headers,
+            "params": params,
+            "data": body,
+            "timeout": timeout or self.timeout,
+        }
+
+    def _compressed(self, options: dict) -> Optional[dict]:
+        """Return the request options with a compressed body, or None.
+
+        None is returned if the body should be sent uncompressed.
+        """
+        body = options["data"]
+        if (
+            body is None
+            or self.compress_threshold is None
+            or not self.compression_accepted
+            or len(body) < self.compress_threshold
+        ):
+            return None
+        return {
+            **options,
+            "headers": {**options["headers"], "Content-Encoding": "gzip"},
+            "data": gzip.compress(body, compresslevel=6),
+        }
+
+    def _compression_rejected(
+        self, response: httpx.Response, fallback: httpx.Response
+    ):
+        """Disable the compression if the server does not accept it.
+
+        Args:
+            response (httpx.Response): Response to the compressed request.
+            fallback (httpx.Response): Response to the same request sent
+                uncompressed.
+        """
+        if response.status_code == 415 or 200 <= fallback.status_code <= 299:
+            self.compression_accepted = False
+
+    def _flight_key(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, str]],
+        timeout: Optional[float],
+    ) -> Optional[Tuple]:
+        """Return the key identifying identical requests, or None.
+
+        Only GET requests are coalesced.
+        """
+        if method != "GET" or not self.coalesce:
+            return None
+        return (
+            url,
+            tuple(sorted((params or {}).items())),
+            tuple(sorted((headers or {}).items())),
+            timeout,
+        )
+
+    def _throttle(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+    ) -> Optional[float]:
+        """Update the rate limiter and return the delay before a retry.
+
+        Returns None if the request should not be retried.
+        """
+        if self.rate_limiter is None:
+            return None
+        if response is not None:
+            self.rate_limiter.update(url, response)
+        return self.rate_limiter.retry_delay(method, attempt, response)
+
+    def _cache_lookup(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, str]],
+        headers: Dict[str, str],
+    ) -> Tuple[Optional[str], Optional[CacheEntry]]:
+        """Return the cache key and the cached entry for a GET request."""
+        if method != "GET" or self.cache is None:
+            return None, None
+        key = self.cache.key(
+            f"{self.url}{url}", params, headers.get("Authorization")
+        )
+        return key, self.cache.get(key)
+
+    def _invalidate_cache(self, method: str):
+        """Remove the cached responses a write request could make stale.
+
+        Called after the write requests even when they fail, the server
+        might have applied a request that timed out.
+        """
+        if method != "GET" and self.cache is not None and self.cache.max_age:
+            self.cache.invalidate(self.url)
+
+    def _cached_result(
+        self,
+        key: Optional[str],
+        entry: Optional[CacheEntry],
+        response: httpx.Response,
+    ):
+        """Deserialize the response and update the cache."""
+        if entry is not None and response.status_code == 304:
+            self.cache.revalidated(key, response)
+            return self.codec.loads(entry.body) if entry.body else {}
+        result = self._result(response)
+        if key is not None:
+            self.cache.store(key, response)
+        return result
+
+    def _result(self, response: httpx.Response):
+        """Deserialize the response or raise the matching client error."""
+        if 200 <= response.status_code <= 299:
+            try:
+                return (
+                    self.codec.loads(response.content)
+                    if response.content
+                    else {}
+                )
+            except Exception as e:
+                raise errors.HttpClientError(
+                    f"Error while parsing server response: {e!r}",
+                    response=response,
+                ) from e
+
+        # Check rate limit
+        limit = response.headers.get("X-Ratelimit-Limit", None)
+        if limit is not None:
+            remaining = response.headers["X-Ratelimit-Remaining"]
+            reset = response.headers["X-Ratelimit-Reset"]
+            retry = response.headers["X-Ratelimit-Retry"]
+
+            if remaining == 0:
+                raise errors.HttpRateLimitExceeded(
+                    response=response,
+                    limit=limit,
+                    remaining=remaining,
+                    reset=reset,
+                    retry=retry,
+                )
+
+        # Try known error messages
+        message = self.ERRORS.get(response.status_code, None)
+        if message is not None:
+            raise errors.HttpClientError(message, response=response)
+
+        if response.status_code == 400:
+            try:
+                message = response.json()["error"]
+            except Exception:
+                message = "Bad Request."
+            raise errors.HttpClientError(message, response=response)
+
+        # Generalize unknown messages.
+        try:
+            message = response.json()["message"]
+        except Exception:
+            message = "Unknown error."
+        raise errors.HttpClientError(message, response=response)
+
+
+class HttpClient(_BaseHttpClient):
+    """HTTP client with a persistent connection pool.
+
+    The client can be shared between multiple threads. The connection pool
+    is created on first use and is shared by all the threads. The base
+    client stores the last response on the instance, this client keeps the
+    last response per thread instead, so concurrent requests don't overwrite
+    each other's responses.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+        max_connections = self.pool_limits.max_connections
+        self._slots = (
+            None
+            if max_connections is None
+            else threading.BoundedSemaphore(max_connections)
+        )
+
+    @property
+    def response(self):
+        """Last response received by the current thread."""
+        return getattr(self._local, "response", None)
+
+    @response.setter
+    def response(self, value):
+        self._local.response = value
+
+    @property
+    def client(self) -> httpx.Client:
+        """Underlying httpx client, created on first use."""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = httpx.Client(
+                        base_url=self.url,
+                        headers=self.headers,
+                        transport=httpcore.SyncConnectionPool(
+                            **self._pool_options()
+                        ),
+                    )
+        return self._client
+
+    def close(self):
+        """Close all the connections in the connection pool."""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        data: Optional[TeaClientModel] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Request method.
+
+        Args:
+            method (str): Method for the request - GET, POST, PATCH or DELETE.
+            url (str): Partial url of the request. It is added to the base url
+            headers (dict): Dictionary of additional HTTP headers
+            params (dict): Dictionary of query parameters for the request
+            data (BaseModel): A JSON serializable Python object to send in the
+                body of the request. Used only in POST and PATCH requests.
+            timeout (float): How many seconds to wait for the server to send
+                data before giving up.
+
+        Returns:
+            dict: Deserialized json response.
+        """
+        method = method.upper()
+        flight_key = self._flight_key(method, url, headers, params, timeout)
+        if flight_key is None:
+            return self._request(method, url, headers, params, data, timeout)
+
+        # If an identical request is already in flight, wait for its result
+        # instead of making a new one.
+        while True:
+            with self._lock:
+                flight = self._in_flight.get(flight_key)
+                if flight is None:
+                    flight = self._in_flight[flight_key] = _Flight(Future())
+                    break
+                flight.waiters += 1
+            try:
+                result, self.response = flight.future.result()
+            except CancelledError:
+                # The request was interrupted, make it again.
+                continue
+            # Every caller gets its own copy, they might modify it.
+            return copy.deepcopy(result)
+
+        try:
+            result = self._request(method, url, headers, params, data, timeout)
+        except BaseException as e:
+            with self._lock:
+                del self._in_flight[flight_key]
+            if isinstance(e, Exception):
+                flight.future.set_exception(e)
+            else:
+                # E.g. KeyboardInterrupt, the waiting callers retry.
+                flight.future.cancel()
+            raise
+        with self._lock:
+            # No waiters are added once the flight is removed.
+            del self._in_flight[flight_key]
+        flight.future.set_result((result, self.response))
+        # The waiters copy the shared result, which must not be modified
+        # until they are done.
+        return copy.deepcopy(result) if flight.waiters else result
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, str]],
+        data: Optional[TeaClientModel],
+        timeout: Optional[float],
+    ):
+        options = self._request_options(method, headers, params, data, timeout)
+        key, entry = self._cache_lookup(
+            method, url, params, options["headers"]
+        )
+        if entry is not None:
+            if self.cache.is_fresh(entry):
+                return self.codec.loads(entry.body) if entry.body else {}
+            options["headers"].update(entry.validators)
+        compressed = self._compressed(options)
+        try:
+            if compressed is None:
+                self.response = self._send(method, url, options)
+            else:
+                response = self._send(method, url, compressed)
+                self.response = response
+                if response.status_code in self.COMPRESSION_REJECTED:
+                    self.response = self._send(method, url, options)
+                    self._compression_rejected(response, self.response)
+            return self._cached_result(key, entry, self.response)
+        finally:
+            self._invalidate_cache(method)
+
+    @contextmanager
+    def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Iterator[httpx.Response]:
+        """Make a request without reading the response body.
+
+        The response body can be read incrementally, e.g. with
+        `response.iter_bytes()`, inside the `with` block. The connection is
+        held until the block exits. Streamed responses are neither cached
+        nor coalesced.
+
+        Example:
+            >>> with http.stream("GET", "/papers/") as response:
+            ...     for chunk in response.iter_bytes():
+            ...         ...
+
+        Args:
+            method (str): Method for the request.
+            url (str): Partial url of the request. It is added to the base url
+            headers (dict): Dictionary of additional HTTP headers
+            params (dict): Dictionary of query parameters for the request
+            timeout (float): How many seconds to wait for the server to send
+                data before giving up.
+
+        Yields:
+            httpx.Response: Successful response, other responses raise the
+                same errors as `request`.
+        """
+        method = method.upper()
+        options = self._request_options(method, headers, params, None, timeout)
+        if self._slots is not None:
+            self._slots.acquire()
+        try:
+            response = self._send(method, url, options, stream=True)
+            try:
+                if not 200 <= response.status_code <= 299:
+                    response.read()
+                    self._result(response)
+                self.response = response
+                yield response
+            finally:
+                response.close()
+        finally:
+            if self._slots is not None:
+                self._slots.release()
+
+    def _send(
+        self, method: str, url: str, options: dict, stream: bool = False
+    ) -> httpx.Response:
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                time.sleep(self.rate_limiter.acquire(url))
+            try:
+                response = self._send_once(method, url, options, stream)
+            except errors.HttpClientTimeout:
+                delay = self._throttle(method, url, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._throttle(method, url, attempt, response)
+                if delay is None:
+                    return response
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    def _send_once(
+        self, method: str, url: str, options: dict, stream: bool = False
+    ) -> httpx.Response:
+        try:
+            if stream:
+                # The slot is held by `stream` until the body is read.
+                request = self.client.build_request(
+                    method,
+                    url,
+                    headers=options["headers"],
+                    params=options["params"],
+                    data=options["data"],
+                )
+                return self.client.send(
+                    request, stream=True, timeout=options["timeout"]
+                )
+            if self._slots is None:
+                return self.client.request(method, url, **options)
+            with self._slots:
+                return self.client.request(method, url, **options)
+        except httpx.TimeoutException as e:
+            # If request timed out, let upper level handle it they way it sees
+            # fit one place might want to retry another might not.
+            raise errors.HttpClientTimeout() from e
+
+        except ConnectionError as e:
+            raise errors.HttpClientError("Server not reachable.") from e
+
+        except Exception as e:
+            raise errors.HttpClientError(f"Unknown error. {e!r}") from e
+
+
+class AsyncHttpClient(_BaseHttpClient):
+    """Non-blocking HTTP client with a persistent connection pool.
+
+    All requests made by one client instance go through a single
+    `httpx.AsyncClient`, so the connections are pooled and reused between
+    the requests. Call `aclose` when the client is no longer needed.
+
+    The client can be shared between multiple tasks. Like the synchronous
+    client keeps the last response per thread, this client keeps it per
+    task, so concurrent requests don't overwrite each other's responses.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self._response = contextvars.ContextVar(
+            f"response-{id(self)}", default=None
+        )
+        super().__init__(*args, **kwargs)
+        self._slots = None
+
+    @property
+    def response(self):
+        """Last response received by the current task."""
+        return self._response.get()
+
+    @response.setter
+    def response(self, value):
+        self._response.set(value)
+
+    @property
+    def slots(self) -> Optional[asyncio.Semaphore]:
+        """Semaphore limiting the number of concurrent requests."""
+        max_connections = self.pool_limits.max_connections
+        if self._slots is None and max_connections is not None:
+            self._slots = asyncio.Semaphore(max_connections)
+        return self._slots
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Underlying httpx client, created on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                base_url=self.url,
+                headers=self.headers,
+                transport=httpcore.AsyncConnectionPool(**self._pool_options()),
+            )
+        return self._client
+
+    async def aclose(self):
+        """Close all the connections in the connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._slots = None
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        data: Optional[TeaClientModel] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Request method.
+
+        Args:
+            method (str): Method for the request - GET, POST, PATCH or DELETE.
+            url (str): Partial url of the request. It is added to the base url
+            headers (dict): Dictionary of additional HTTP headers
+            params (dict): Dictionary of query parameters for the request
+            data (BaseModel): A JSON serializable Python object to send in the
+                body of the request. Used only in POST and PATCH requests.
+            timeout (float): How many seconds to wait for the server to send
+                data before giving up.
+
+        Returns:
+            dict: Deserialized json response.
+        """
+        method = method.upper()
+        flight_key = self._flight_key(method, url, headers, params, timeout)
+        if flight_key is None:
+            return await self._request(
+                method, url, headers, params, data, timeout
+            )
+
+        # If an identical request is already in flight, wait for its result
+        # instead of making a new one.
+        while flight_key in self._in_flight:
+            flight = self._in_flight[flight_key]
+            flight.waiters += 1
+            try:
+                result, self.response = await asyncio.shield(flight.future)
+            except asyncio.CancelledError:
+                if not flight.future.cancelled():
+                    # This caller was cancelled.
+                    raise
+                # The caller making the request was cancelled, make it again.
+                continue
+            # Every caller gets its own copy, they might modify it.
+            return copy.deepcopy(result)
+
+        flight = self._in_flight[flight_key] = _Flight(
+            asyncio.get_event_loop().create_future()
+        )
+        try:
+            result = await self._request(
+                method, url, headers, params, data, timeout
+            )
+        except asyncio.CancelledError:
+            # Cancelling one caller must not cancel the others waiting for
+            # the same request, one of them makes it again.
+            del self._in_flight[flight_key]
+            flight.future.cancel()
+            raise
+        except Exception as e:
+            del self._in_flight[flight_key]
+            flight.future.set_exception(e)
+            # Mark the exception as retrieved, nobody might be waiting.
+            flight.future.exception()
+            raise
+        except BaseException:
+            del self._in_flight[flight_key]
+            flight.future.cancel()
+            raise
+        del self._in_flight[flight_key]
+        flight.future.set_result((result, self.response))
+        # The waiters resume after this caller, which might modify the result
+        # in the meantime.
+        return copy.deepcopy(result) if flight.waiters else result
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, str]],
+        data: Optional[TeaClientModel],
+        timeout: Optional[float],
+    ):
+        options = self._request_options(method, headers, params, data, timeout)
+        key, entry = self._cache_lookup(
+            method, url, params, options["headers"]
+        )
+        if entry is not None:
+            if self.cache.is_fresh(entry):
+                return self.codec.loads(entry.body) if entry.body else {}
+            options["headers"].update(entry.validators)
+        compressed = self._compressed(options)
+        try:
+            if compressed is None:
+                self.response = await self._send(method, url, options)
+            else:
+                response = await self._send(method, url, compressed)
+                self.response = response
+                if response.status_code in self.COMPRESSION_REJECTED:
+                    self.response = await self._send(method, url, options)
+                    self._compression_rejected(response, self.response)
+            return self._cached_result(key, entry, self.response)
+        finally:
+            self._invalidate_cache(method)
+
+    @asynccontextmanager
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[httpx.Response]:
+        """Make a request without reading the response body.
+
+        The response body can be read incrementally, e.g. with
+        `response.aiter_bytes()`, inside the `async with` block. The
+        connection is held until the block exits. Streamed responses are
+        neither cached nor coalesced.
+
+        Example:
+            >>> async with http.stream("GET", "/papers/") as response:
+            ...     async for chunk in response.aiter_bytes():
+            ...         ...
+
+        Args:
+            method (str): Method for the request.
+            url (str): Partial url of the request. It is added to the base url
+            headers (dict): Dictionary of additional HTTP headers
+            params (dict): Dictionary of query parameters for the request
+            timeout (float): How many seconds to wait for the server to send
+                data before giving up.
+
+        Yields:
+            httpx.Response: Successful response, other responses raise the
+                same errors as `request`.
+        """
+        method = method.upper()
+        options = self._request_options(method, headers, params, None, timeout)
+        slots = self.slots
+        if slots is not None:
+            await slots.acquire()
+        try:
+            response = await self._send(method, url, options, stream=True)
+            try:
+                if not 200 <= response.status_code <= 299:
+                    await response.aread()
+                    self._result(response)
+                self.response = response
+                yield response
+            finally:
+                await response.aclose()
+        finally:
+            if slots is not None:
+                slots.release()
+
+    async def _send(
+        self, method: str, url: str, options: dict, stream: bool = False
+    ) -> httpx.Response:
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await asyncio.sleep(self.rate_limiter.acquire(url))
+            try:
+                response = await self._send_once(method, url, options, stream)
+            except errors.HttpClientTimeout:
+                delay = self._throttle(method, url, attempt)
+                if delay is None:
+                    raise
+            else:
+                delay = self._throttle(method, url, attempt, response)
+                if delay is None:
+                    return response
+                await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def _send_once(
+        self, method: str, url: str, options: dict, stream: bool = False
+    ) -> httpx.Response:
+        try:
+            if stream:
+                # The slot is held by `stream` until the body is read.
+                request = self.client.build_request(
+                    method,
+                    url,
+                    headers=options["headers"],
+                    params=options["params"],
+                    data=options["data"],
+                )
+                return await self.client.send(
+                    request, stream=True, timeout=options["timeout"]
+                )
+            if self.slots is None:
+                return await self.client.request(method, url, **options)
+            async with self.slots:
+                return await self.client.request(method, url, **options)
+        except httpx.TimeoutException as e:
+            raise errors.HttpClientTimeout() from e
+
+        except ConnectionError as e:
+            raise errors.HttpClientError("Server not reachable.") from e
+
+        except Exception as e:
+            raise errors.HttpClientError(f"Unknown error. {e!r}") from e
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Perform get request."""
+        return await self.request(
+            "get", url, headers=headers, params=params, timeout=timeout
+        )
+
+    async def patch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        data: Optional[TeaClientModel] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Perform patch request."""
+        return await self.request(
+            "patch",
+            url,
+            headers=headers,
+            params=params,
+            data=data,
+            timeout=timeout,
+        )
+
+    async def post(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        data: Optional[TeaClientModel] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Perform post request."""
+        return await self.request(
+            "post",
+            url,
+            headers=headers,
+            params=params,
+            data=data,
+            timeout=timeout,
+        )
+
+    async def delete(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Perform delete request."""
+        return await self.request(
+            "delete", url, headers=headers, params=params, timeout=timeout
+        )
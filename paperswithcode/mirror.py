@@ -0,0 +1,1015 @@
+__all__ = ["Mirror"]
+
+import re
+import math
+import sqlite3
+import hashlib
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from tea_client.models import TeaClientModel
+
+from paperswithcode.client import PapersWithCodeClient
+from paperswithcode.models import Paper, Papers
+from paperswithcode.pagination import iterate_pages
+
+
+class _Table:
+    """Mirrored resource.
+
+    Attributes:
+        name (str): Name of the table and of the resource.
+        method (str): Name of the client list method.
+        columns (tuple): `(column, attribute)` pairs of the columns filled
+            from the item attributes. The first column is the primary key.
+        parent (str, optional): Name of the parent table for resources that
+            are listed per parent object, e.g. metrics of an evaluation.
+        data (bool): Store the whole item as JSON in the `data` column.
+    """
+
+    __slots__ = ("name", "method", "columns", "parent", "data")
+
+    def __init__(
+        self,
+        name: str,
+        method: str,
+        columns: Tuple[Tuple[str, str], ...],
+        parent: Optional[str] = None,
+        data: bool = True,
+    ):
+        self.name = name
+        self.method = method
+        self.columns = columns
+        self.parent = parent
+        self.data = data
+
+    @property
+    def parent_column(self) -> Optional[str]:
+        if self.parent is None:
+            return None
+        # Parent tables are plural, e.g. "evaluations" -> "evaluation".
+        return self.parent[:-1]
+
+    @property
+    def column_names(self) -> List[str]:
+        names = [column for column, _ in self.columns]
+        if self.parent is not None:
+            names.insert(0, self.parent_column)
+        if self.data:
+            names.append("data")
+        return names
+
+    def row(self, item: TeaClientModel, parent_id: Optional[str] = None):
+        values = []
+        if self.parent is not None:
+            values.append(parent_id)
+        for _, attribute in self.columns:
+            value = getattr(item, attribute)
+            if not isinstance(value, (str, int, float, type(None))):
+                value = str(value)
+            values.append(value)
+        if self.data:
+            values.append(item.json())
+        return values
+
+
+_TABLES = (
+    _Table(
+        "papers",
+        "paper_list",
+        (
+            ("id", "id"),
+            ("arxiv_id", "arxiv_id"),
+            ("title", "title"),
+            ("published", "published"),
+            ("conference", "conference"),
+            ("proceeding", "proceeding"),
+        ),
+    ),
+    _Table(
+        "repositories",
+        "repository_list",
+        (
+            ("url", "url"),
+            ("owner", "owner"),
+            ("name", "name"),
+            ("stars", "stars"),
+            ("framework", "framework"),
+        ),
+    ),
+    _Table(
+        "authors", "author_list", (("id", "id"), ("full_name", "full_name"))
+    ),
+    _Table("conferences", "conference_list", (("id", "id"), ("name", "name"))),
+    _Table(
+        "proceedings",
+        "proceeding_list",
+        (("id", "id"), ("year", "year"), ("month", "month")),
+        parent="conferences",
+    ),
+    _Table("areas", "area_list", (("id", "id"), ("name", "name"))),
+    _Table(
+        "area_tasks",
+        "area_task_list",
+        (("task", "id"),),
+        parent="areas",
+        data=False,
+    ),
+    _Table("tasks", "task_list", (("id", "id"), ("name", "name"))),
+    _Table(
+        "datasets",
+        "dataset_list",
+        (("id", "id"), ("name", "name"), ("full_name", "full_name")),
+    ),
+    _Table(
+        "methods",
+        "method_list",
+        (("id", "id"), ("name", "name"), ("paper", "paper")),
+    ),
+    _Table(
+        "evaluations",
+        "evaluation_list",
+        (("id", "id"), ("task", "task"), ("dataset", "dataset")),
+    ),
+    _Table(
+        "metrics",
+        "evaluation_metric_list",
+        (("id", "id"), ("name", "name"), ("is_loss", "is_loss")),
+        parent="evaluations",
+    ),
+    _Table(
+        "results",
+        "evaluation_result_list",
+        (
+            ("id", "id"),
+            ("paper", "paper"),
+            ("methodology", "methodology"),
+            ("best_rank", "best_rank"),
+            ("evaluated_on", "evaluated_on"),
+        ),
+        parent="evaluations",
+    ),
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS papers (
+    id TEXT PRIMARY KEY,
+    arxiv_id TEXT,
+    title TEXT NOT NULL,
+    published TEXT,
+    conference TEXT REFERENCES conferences (id),
+    proceeding TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS papers_arxiv_id ON papers (arxiv_id);
+CREATE INDEX IF NOT EXISTS papers_conference
+    ON papers (conference, proceeding);
+
+CREATE TABLE IF NOT EXISTS repositories (
+    url TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    name TEXT NOT NULL,
+    stars INTEGER,
+    framework TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS repositories_owner ON repositories (owner, name);
+
+CREATE TABLE IF NOT EXISTS authors (
+    id TEXT PRIMARY KEY,
+    full_name TEXT,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS conferences (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS proceedings (
+    conference TEXT NOT NULL REFERENCES conferences (id),
+    id TEXT NOT NULL,
+    year INTEGER,
+    month INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (conference, id)
+);
+
+CREATE TABLE IF NOT EXISTS areas (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS area_tasks (
+    area TEXT NOT NULL REFERENCES areas (id),
+    task TEXT NOT NULL REFERENCES tasks (id),
+    PRIMARY KEY (area, task)
+);
+CREATE INDEX IF NOT EXISTS area_tasks_task ON area_tasks (task);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS datasets (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    full_name TEXT,
+    data TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS methods (
+    id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    paper TEXT REFERENCES papers (id),
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS methods_paper ON methods (paper);
+
+CREATE TABLE IF NOT EXISTS evaluations (
+    id TEXT PRIMARY KEY,
+    task TEXT NOT NULL REFERENCES tasks (id),
+    dataset TEXT NOT NULL REFERENCES datasets (id),
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS evaluations_task ON evaluations (task);
+CREATE INDEX IF NOT EXISTS evaluations_dataset ON evaluations (dataset);
+
+CREATE TABLE IF NOT EXISTS metrics (
+    evaluation TEXT NOT NULL REFERENCES evaluations (id),
+    id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    is_loss INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (evaluation, id)
+);
+
+CREATE TABLE IF NOT EXISTS results (
+    evaluation TEXT NOT NULL REFERENCES evaluations (id),
+    id TEXT NOT NULL,
+    paper TEXT REFERENCES papers (id),
+    methodology TEXT,
+    best_rank INTEGER,
+    evaluated_on TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (evaluation, id)
+);
+CREATE INDEX IF NOT EXISTS results_paper ON results (paper);
+
+CREATE TABLE IF NOT EXISTS checkpoints (
+    name TEXT PRIMARY KEY,
+    page INTEGER NOT NULL DEFAULT 0,
+    count INTEGER,
+    completed INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS pages (
+    name TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    items_per_page INTEGER NOT NULL,
+    hash TEXT NOT NULL,
+    PRIMARY KEY (name, page)
+);
+"""
+
+# Full-text index over the paper titles and abstracts. The index is kept up
+# to date by triggers, so every paper stored by a crawl or a refresh is
+# searchable right away.
+_SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS papers_search USING fts5 (
+    title,
+    abstract,
+    tokenize = 'porter unicode61'
+);
+
+CREATE TRIGGER IF NOT EXISTS papers_search_insert AFTER INSERT ON papers
+BEGIN
+    INSERT INTO papers_search (rowid, title, abstract)
+    VALUES (new.rowid, new.title, json_extract(new.data, '$.abstract'));
+END;
+
+CREATE TRIGGER IF NOT EXISTS papers_search_delete AFTER DELETE ON papers
+BEGIN
+    DELETE FROM papers_search WHERE rowid = old.rowid;
+END;
+
+CREATE TRIGGER IF NOT EXISTS papers_search_update AFTER UPDATE ON papers
+BEGIN
+    DELETE FROM papers_search WHERE rowid = old.rowid;
+    INSERT INTO papers_search (rowid, title, abstract)
+    VALUES (new.rowid, new.title, json_extract(new.data, '$.abstract'));
+END;
+"""
+
+# Relative weights of the title and abstract columns in the BM25 ranking.
+_SEARCH_WEIGHTS = (2.0, 1.0)
+
+
+def _match(
+    q: Optional[str], title: Optional[str], abstract: Optional[str]
+) -> str:
+    """Translate the search arguments into an FTS5 query.
+
+    All the words have to match. The last word of `q` also matches longer
+    words, so that results are available while the query is being typed.
+    """
+    terms = []
+    for column, text, prefix in (
+        (None, q, True),
+        ("title", title, False),
+        ("abstract", abstract, False),
+    ):
+        words = re.findall(r"\w+", text or "")
+        for i, word in enumerate(words):
+            term = f'"{word}"'
+            if prefix and i == len(words) - 1:
+                term += "*"
+            if column is not None:
+                term = f"{column} : {term}"
+            terms.append(term)
+    return " AND ".join(terms)
+
+
+def _hash(rows: List[list]) -> str:
+    return hashlib.sha1(repr(rows).encode("utf-8")).hexdigest()
+
+
+def _window(
+    executor: ThreadPoolExecutor,
+    func: Callable,
+    items: Iterable,
+    size: int,
+) -> Iterator:
+    """Like `executor.map`, but with at most `size` calls in flight."""
+    items = iter(items)
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= size:
+                break
+        while pending:
+            result = pending.popleft().result()
+            for item in items:
+                pending.append(executor.submit(func, item))
+                break
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+class Mirror:
+    """Local snapshot of the PapersWithCode catalog in an SQLite database.
+
+    Every resource is stored in its own table with the ID, the foreign keys
+    and the most commonly queried fields as indexed columns, and the whole
+    object as JSON in the `data` column. Resources that are listed per
+    parent object (conference proceedings, area tasks, evaluation metrics
+    and results) are stored together with the ID of the parent.
+
+    The crawl is checkpointed after every page, so an interrupted crawl
+    continues where it stopped when it is started again.
+
+    Paper titles and abstracts are indexed in a full-text index, see
+    `paper_search`.
+
+    Example:
+        >>> from paperswithcode.mirror import Mirror
+        >>> with Mirror("paperswithcode.sqlite") as mirror:
+        ...     mirror.crawl(resources=["tasks", "evaluations"])
+        ...     rows = mirror.execute(
+        ...         "SELECT id FROM evaluations WHERE task = ?", ("speech",)
+        ...     ).fetchall()
+
+    Args:
+        path (str or Path): Path to the mirror database.
+        client (PapersWithCodeClient, optional): Client used for the crawl.
+            Default: anonymous client.
+    """
+
+    RESOURCES = tuple(table.name for table in _TABLES)
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        client: Optional[PapersWithCodeClient] = None,
+    ):
+        self.path = Path(path).expanduser().absolute()
+        self.client = client or PapersWithCodeClient()
+        # Objects are decoded with the same codec as the client responses.
+        self.codec = self.client.http.codec
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        # Fire the delete triggers for rows replaced by INSERT OR REPLACE.
+        self._db.execute("PRAGMA recursive_triggers=ON")
+        self._db.executescript(_SCHEMA)
+        self.searchable = self._create_search_index()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the mirror database."""
+        with self._lock:
+            self._db.close()
+
+    def _create_search_index(self) -> bool:
+        exists = self._db.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'papers_search'"
+        ).fetchone()
+        try:
+            self._db.executescript(_SEARCH_SCHEMA)
+        except sqlite3.OperationalError:
+            # SQLite was compiled without the FTS5 extension.
+            return False
+        if not exists:
+            with self._db:
+                self._db.execute(
+                    "INSERT INTO papers_search (rowid, title, abstract) "
+                    "SELECT rowid, title, json_extract(data, '$.abstract') "
+                    "FROM papers"
+                )
+        return True
+
+    def execute(self, sql: str, parameters: Iterable = ()) -> sqlite3.Cursor:
+        """Execute an SQL query on the mirror database."""
+        with self._lock:
+            return self._db.execute(sql, tuple(parameters))
+
+    def paper_search(
+        self,
+        q: Optional[str] = None,
+        arxiv_id: Optional[str] = None,
+        title: Optional[str] = None,
+        abstract: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Papers:
+        """Search the mirrored papers.
+
+        Local counterpart of `PapersWithCodeClient.paper_list` search. Papers
+        are matched by words, ignoring case and word endings (e.g. "network"
+        matches "networks"), and ordered by relevance using the BM25 ranking
+        function, with matches in the title weighted higher than matches in
+        the abstract.
+
+        Args:
+            q (str, optional): Words searched in the paper title and
+                abstract. The last word also matches longer words, e.g.
+                "trans" matches "transformer".
+            arxiv_id (str, optional): Filter papers by arxiv id.
+            title (str, optional): Words searched in the paper title.
+            abstract (str, optional): Words searched in the paper abstract.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+
+        Returns:
+            Papers: Papers object.
+        """
+        count, items = self.search(
+            q, arxiv_id, title, abstract, page, items_per_page
+        )
+        return Papers(
+            count=count,
+            next_page=page + 1 if page * items_per_page < count else None,
+            previous_page=page - 1 if page > 1 else None,
+            results=[Paper(**item) for item in items],
+        )
+
+    def search(
+        self,
+        q: Optional[str] = None,
+        arxiv_id: Optional[str] = None,
+        title: Optional[str] = None,
+        abstract: Optional[str] = None,
+        page: int = 1,
+        items_per_page: int = 50,
+    ) -> Tuple[int, List[dict]]:
+        """Search the mirrored papers.
+
+        Same as `paper_search`, but returns the papers as dictionaries.
+
+        Returns:
+            tuple: Number of the matching papers and the list of papers on
+                the page.
+        """
+        if not self.searchable:
+            raise RuntimeError(
+                "Search is not available, SQLite was compiled without the "
+                "FTS5 extension."
+            )
+        conditions = []
+        parameters = []
+        if arxiv_id is not None:
+            conditions.append("arxiv_id = ?")
+            parameters.append(arxiv_id)
+        match = _match(q, title, abstract)
+        if not match:
+            return self.select(
+                "papers",
+                " AND ".join(conditions),
+                parameters,
+                page=page,
+                items_per_page=items_per_page,
+            )
+        conditions.append("papers_search MATCH ?")
+        parameters.append(match)
+        return self.select(
+            "papers_search JOIN papers ON papers.rowid = papers_search.rowid",
+            " AND ".join(conditions),
+            parameters,
+            page=page,
+            items_per_page=items_per_page,
+            order="bm25(papers_search, {}, {})".format(*_SEARCH_WEIGHTS),
+        )
+
+    def select(
+        self,
+        source: str,
+        where: str = "",
+        parameters: Iterable = (),
+        page: int = 1,
+        items_per_page: int = 50,
+        order: Optional[str] = None,
+    ) -> Tuple[int, List[dict]]:
+        """Return one page of the mirrored objects.
+
+        Example:
+            >>> count, evaluations = mirror.select(
+            ...     "evaluations", "task = ?", ("image-classification",)
+            ... )
+
+        Args:
+            source (str): Table, or join of tables, with the `data` column.
+            where (str): SQL condition the objects have to match.
+            parameters (iterable): Values of the condition placeholders.
+            page (int): Desired page.
+            items_per_page (int): Desired number of items per page.
+                Default: 50.
+            order (str, optional): SQL ordering of the objects. Default:
+                order in which the objects were stored.
+
+        Returns:
+            tuple: Number of the matching objects and the list of objects on
+                the page.
+        """
+        where = f" WHERE {where}" if where else ""
+        order = order or f"{source.split()[0]}.rowid"
+        parameters = tuple(parameters)
+        with self._lock:
+            (count,) = self._db.execute(
+                f"SELECT COUNT(*) FROM {source}{where}", parameters
+            ).fetchone()
+            rows = self._db.execute(
+                f"SELECT data FROM {source}{where} "
+                f"ORDER BY {order} LIMIT ? OFFSET ?",
+                parameters + (items_per_page, (page - 1) * items_per_page),
+            ).fetchall()
+        return count, [self.codec.loads(data) for data, in rows]
+
+    def crawl(
+        self,
+        resources: Optional[Iterable[str]] = None,
+        items_per_page: int = 500,
+        workers: int = 8,
+        restart: bool = False,
+        progress: Optional[Callable[[str, int, Optional[int]], None]] = None,
+    ):
+        """Crawl the resources into the mirror.
+
+        Top level resources are fetched `workers` pages at a time. Resources
+        listed per parent object are fetched for `workers` parents at a time,
+        after their parent resource has been crawled.
+
+        Args:
+            resources (iterable, optional): Names of the resources to crawl,
+                any of `Mirror.RESOURCES`. Default: all resources.
+            items_per_page (int): Number of items requested per page.
+                Default: 500.
+            workers (int): Number of concurrent requests. Default: 8.
+            restart (bool): If True, ignore the checkpoints of the previous
+                crawls and crawl everything again. Default: False.
+            progress (callable, optional): Called as
+                `progress(resource, done, total)` after every stored page,
+                or every crawled parent object for nested resources.
+        """
+        names = self._resources(resources)
+        if restart:
+            with self._lock, self._db:
+                self._db.execute("DELETE FROM checkpoints")
+                self._db.execute("DELETE FROM pages")
+        for table in _TABLES:
+            if table.name not in names:
+                continue
+            if table.parent is None:
+                self._crawl(table, items_per_page, workers, progress)
+            else:
+                self._crawl_nested(table, items_per_page, workers, progress)
+
+    def refresh(
+        self,
+        resources: Optional[Iterable[str]] = None,
+        items_per_page: int = 500,
+        workers: int = 8,
+        full: bool = False,
+        progress: Optional[Callable[[str, int, Optional[int]], None]] = None,
+    ) -> Dict[str, int]:
+        """Update the mirror with the changes made since the last crawl.
+
+        For every top level resource the first page is fetched and its
+        content hash and the total number of objects are compared with the
+        ones stored during the last crawl. If they match and the last page
+        is unchanged too, the resource is skipped. Otherwise, since objects
+        inserted into or removed from a list shift all the following pages,
+        the first changed page is found with a binary search and only the
+        pages from it onward are fetched. Only the pages whose content hash
+        changed are written to the database.
+
+        Resources listed per parent object are checked for every parent
+        object: the first page of the list is fetched and its content hash
+        and the total number of objects are compared with the ones stored
+        during the last crawl, and the whole list is fetched again only if
+        they differ. New parent objects and the ones whose crawl did not
+        finish are crawled. With `full=True` all the pages and the whole
+        lists of all the parent objects are fetched, which also finds objects
+        that were modified in place or removed. Resources that have not been
+        crawled completely yet are crawled instead.
+
+        Args:
+            resources (iterable, optional): Names of the resources to
+                refresh, any of `Mirror.RESOURCES`. Default: all resources.
+            items_per_page (int): Number of items requested per page for the
+                resources that are crawled for the first time. Refreshed
+                resources use the page size of their last crawl.
+                Default: 500.
+            workers (int): Number of concurrent requests. Default: 8.
+            full (bool): Check every page and every parent object.
+                Default: False.
+            progress (callable, optional): Called as
+                `progress(resource, done, total)` after every checked page,
+                or every checked parent object for nested resources.
+
+        Returns:
+            dict: Number of updated pages, or parent objects for nested
+                resources, keyed by the resource name.
+        """
+        names = self._resources(resources)
+        updated = {}
+        for table in _TABLES:
+            if table.name not in names:
+                continue
+            if table.parent is None:
+                updated[table.name] = self._refresh(
+                    table, items_per_page, workers, full, progress
+                )
+            else:
+                updated[table.name] = self._crawl_nested(
+                    table,
+                    items_per_page,
+                    workers,
+                    progress,
+                    refresh=True,
+                    full=full,
+                )
+        return updated
+
+    def _resources(self, resources: Optional[Iterable[str]]) -> Set[str]:
+        names = set(self.RESOURCES if resources is None else resources)
+        unknown = names - set(self.RESOURCES)
+        if unknown:
+            raise ValueError(
+                f"Unknown resources: {', '.join(sorted(unknown))}."
+            )
+        return names
+
+    def _checkpoint(self, name: str) -> Tuple[int, Optional[int], bool]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT page, count, completed FROM checkpoints "
+                "WHERE name = ?",
+                (name,),
+            ).fetchone()
+        if row is None:
+            return 0, None, False
+        return row[0], row[1], bool(row[2])
+
+    def _hashes(self, name: str) -> Tuple[Optional[int], Dict[int, str]]:
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT page, items_per_page, hash FROM pages "
+                "WHERE name = ?",
+                (name,),
+            ).fetchall()
+        if not rows:
+            return None, {}
+        return rows[0][1], {page: page_hash for page, _, page_hash in rows}
+
+    def _incomplete_parents(self, table: _Table) -> List[str]:
+        return [
+            parent_id
+            for parent_id, in self._db.execute(
+                # The checkpoint names are matched exactly, parent ids can
+                # contain LIKE wildcards like "_".
+                f"SELECT id FROM {table.parent} WHERE NOT EXISTS ("
+                "SELECT 1 FROM checkpoints "
+                "WHERE name = ? || id AND completed)",
+                (f"{table.name}:",),
+            )
+        ]
+
+    def _store(
+        self,
+        table: _Table,
+        rows: List[list],
+        checkpoint: str,
+        page: int,
+        count: Optional[int],
+        completed: bool,
+        items_per_page: int,
+        parent_id: Optional[str] = None,
+        first_page_hash: Optional[str] = None,
+    ):
+        columns = table.column_names
+        sql = (
+            f"INSERT OR REPLACE INTO {table.name} ({', '.join(columns)}) "
+            f"VALUES ({', '.join('?' * len(columns))})"
+        )
+        with self._lock, self._db:
+            if parent_id is not None:
+                # Nested resources are replaced as a whole, so that the
+                # objects removed from the parent are removed locally too.
+                self._db.execute(
+                    f"DELETE FROM {table.name} "
+                    f"WHERE {table.parent_column} = ?",
+                    (parent_id,),
+                )
+            self._db.executemany(sql, rows)
+            self._db.execute(
+                "INSERT OR REPLACE INTO checkpoints "
+                "(name, page, count, completed) VALUES (?, ?, ?, ?)",
+                (checkpoint, page, count, int(completed)),
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages "
+                "(name, page, items_per_page, hash) VALUES (?, ?, ?, ?)",
+                (checkpoint, page, items_per_page, _hash(rows)),
+            )
+            if first_page_hash is not None:
+                # Nested resources are stored as page 0, the hash of their
+                # first page is used to detect changes in `refresh`.
+                self._db.execute(
+                    "INSERT OR REPLACE INTO pages "
+                    "(name, page, items_per_page, hash) VALUES (?, 1, ?, ?)",
+                    (checkpoint, items_per_page, first_page_hash),
+                )
+
+    def _crawl(
+        self,
+        table: _Table,
+        items_per_page: int,
+        workers: int,
+        progress: Optional[Callable],
+    ) -> int:
+        page, _, completed = self._checkpoint(table.name)
+        if completed:
+            return 0
+        method = getattr(self.client, table.method)
+        if page > 0:
+            # Resume with the page size used before the interruption.
+            items_per_page = self._hashes(table.name)[0] or items_per_page
+            pages = iterate_pages(
+                method,
+                page=page + 1,
+                items_per_page=items_per_page,
+                workers=workers,
+            )
+        else:
+            first = method(page=1, items_per_page=items_per_page)
+            pages = [first]
+            if first.next_page is not None and first.results:
+                # Servers can return fewer items per page than requested.
+                # The pages are stored with the size the server used, so
+                # that resumed crawls and `refresh` number them like the
+                # server does.
+                items_per_page = len(first.results)
+                pages = itertools.chain(
+                    pages,
+                    iterate_pages(
+                        method,
+                        page=2,
+                        items_per_page=items_per_page,
+                        workers=workers,
+                    ),
+                )
+        number = page
+        for number, result in enumerate(pages, start=page + 1):
+            self._store(
+                table,
+                [table.row(item) for item in result.results],
+                table.name,
+                number,
+                result.count,
+                result.next_page is None,
+                items_per_page,
+            )
+            if progress is not None:
+                done = min(number * items_per_page, result.count)
+                progress(table.name, done, result.count)
+        return number - page
+
+    def _refresh(
+        self,
+        table: _Table,
+        items_per_page: int,
+        workers: int,
+        full: bool,
+        progress: Optional[Callable],
+    ) -> int:
+        _, old_count, completed = self._checkpoint(table.name)
+        stored_items_per_page, hashes = self._hashes(table.name)
+        if not completed or not hashes:
+            return self._crawl(table, items_per_page, workers, progress)
+        items_per_page = stored_items_per_page
+        method = getattr(self.client, table.method)
+        probed = {}
+
+        def is_changed(number):
+            if number not in probed:
+                result = method(page=number, items_per_page=items_per_page)
+                rows = [table.row(item) for item in result.results]
+                probed[number] = (result.count, _hash(rows))
+            return probed[number][1] != hashes.get(number)
+
+        changed_first = is_changed(1)
+        count = probed[1][0]
+        last = max(1, math.ceil(count / items_per_page))
+        if full or changed_first:
+            start = 1
+        elif count == old_count and (last == 1 or not is_changed(last)):
+            start = last + 1
+        else:
+            # The pages before the first inserted or removed object are
+            # unchanged and all the pages after it are shifted.
+            low, high = 2, last + 1
+            while low < high:
+                middle = (low + high) // 2
+                if is_changed(middle):
+                    high = middle
+                else:
+                    low = middle + 1
+            start = low
+
+        updated = 0
+        seen = set()
+        if start <= last:
+            for number, result in enumerate(
+                iterate_pages(
+                    method,
+                    page=start,
+                    items_per_page=items_per_page,
+                    workers=workers,
+                ),
+                start=start,
+            ):
+                rows = [table.row(item) for item in result.results]
+                seen.update(row[0] for row in rows)
+                if _hash(rows) != hashes.get(number):
+                    self._store(
+                        table,
+                        rows,
+                        table.name,
+                        number,
+                        result.count,
+                        result.next_page is None,
+                        items_per_page,
+                    )
+                    updated += 1
+                if progress is not None:
+                    done = min(number * items_per_page, result.count)
+                    progress(table.name, done, result.count)
+                last = number
+
+        key_column = table.columns[0][0]
+        with self._lock, self._db:
+            self._db.execute(
+                "DELETE FROM pages WHERE name = ? AND page > ?",
+                (table.name, last),
+            )
+            self._db.execute(
+                "UPDATE checkpoints SET page = ?, count = ?, completed = 1 "
+                "WHERE name = ?",
+                (last, count, table.name),
+            )
+            if full:
+                # Objects that were not listed anymore were removed.
+                stale = [
+                    (key,)
+                    for key, in self._db.execute(
+                        f"SELECT {key_column} FROM {table.name}"
+                    )
+                    if key not in seen
+                ]
+                self._db.executemany(
+                    f"DELETE FROM {table.name} WHERE {key_column} = ?", stale
+                )
+        return updated
+
+    def _crawl_nested(
+        self,
+        table: _Table,
+        items_per_page: int,
+        workers: int,
+        progress: Optional[Callable],
+        refresh: bool = False,
+        full: bool = False,
+    ) -> int:
+        with self._lock:
+            if refresh:
+                parent_ids = [
+                    parent_id
+                    for parent_id, in self._db.execute(
+                        f"SELECT id FROM {table.parent}"
+                    )
+                ]
+            else:
+                parent_ids = self._incomplete_parents(table)
+        # Unless all the lists are fetched, the lists of the crawled parents
+        # are fetched again only if their first page or count changed.
+        probe = refresh and not full
+        method = getattr(self.client, table.method)
+
+        def fetch(parent_id):
+            checkpoint = f"{table.name}:{parent_id}"
+            _, count, completed = self._checkpoint(checkpoint)
+            page_size, hashes = self._hashes(checkpoint)
+            # The stored first page hash is comparable only for the same
+            # page size.
+            page_size = page_size or items_per_page
+            pages = iterate_pages(method, parent_id, items_per_page=page_size)
+            first = next(pages)
+            rows = [table.row(item, parent_id) for item in first.results]
+            first_page_hash = _hash(rows)
+            if (
+                probe
+                and completed
+                and first.count == count
+                and first_page_hash == hashes.get(1)
+            ):
+                pages.close()
+                return parent_id, page_size, None, first_page_hash, hashes
+            for result in pages:
+                rows.extend(
+                    table.row(item, parent_id) for item in result.results
+                )
+            return parent_id, page_size, rows, first_page_hash, hashes
+
+        updated = 0
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            for done, result in enumerate(
+                _window(executor, fetch, parent_ids, max(1, workers)), start=1
+            ):
+                parent_id, page_size, rows, first_page_hash, hashes = result
+                if rows is not None and (
+                    _hash(rows) != hashes.get(0)
+                    or first_page_hash != hashes.get(1)
+                ):
+                    self._store(
+                        table,
+                        rows,
+                        f"{table.name}:{parent_id}",
+                        0,
+                        len(rows),
+                        True,
+                        page_size,
+                        parent_id=parent_id,
+                        first_page_hash=first_page_hash,
+                    )
+                    updated += 1
+                if progress is not None:
+                    progress(table.name, done, len(parent_ids))
+        return updated
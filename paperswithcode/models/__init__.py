@@ -44,49 +44,64 @@ __all__ = [
     "EvaluationTableSyncResponse",
 ]
 
-from paperswithcode.models.page import Page
-from paperswithcode.models.paper import Paper, Papers
-from paperswithcode.models.repository import Repository, Repositories
-from paperswithcode.models.paper_repo import PaperRepo, PaperRepos
-from paperswithcode.models.author import Author, Authors
-from paperswithcode.models.conference import (
-    Conference,
-    Conferences,
-    Proceeding,
-    Proceedings,
-)
-from paperswithcode.models.task import (
-    Area,
-    Areas,
-    Task,
-    TaskCreateRequest,
-    TaskUpdateRequest,
-    Tasks,
-)
-from paperswithcode.models.dataset import (
-    Dataset,
-    DatasetCreateRequest,
-    DatasetUpdateRequest,
-    Datasets,
-)
-from paperswithcode.models.method import Method, Methods
-from paperswithcode.models.evaluation import (
-    EvaluationTable,
-    EvaluationTables,
-    EvaluationTableCreateRequest,
-    EvaluationTableUpdateRequest,
-    Metric,
-    Metrics,
-    MetricCreateRequest,
-    MetricUpdateRequest,
-    Result,
-    Results,
-    ResultCreateRequest,
-    ResultUpdateRequest,
-    ResultSyncRequest,
-    MetricSyncRequest,
-    EvaluationTableSyncRequest,
-    ResultSyncResponse,
-    MetricSyncResponse,
-    EvaluationTableSyncResponse,
-)
+from importlib import import_module
+
+# Module defining each model, the models are imported on first use.
+_MODULES = {
+    "Page": "page",
+    "Paper": "paper",
+    "Papers": "paper",
+    "Repository": "repository",
+    "Repositories": "repository",
+    "PaperRepo": "paper_repo",
+    "PaperRepos": "paper_repo",
+    "Author": "author",
+    "Authors": "author",
+    "Conference": "conference",
+    "Conferences": "conference",
+    "Proceeding": "conference",
+    "Proceedings": "conference",
+    "Area": "task",
+    "Areas": "task",
+    "Task": "task",
+    "TaskCreateRequest": "task",
+    "TaskUpdateRequest": "task",
+    "Tasks": "task",
+    "Dataset": "dataset",
+    "DatasetCreateRequest": "dataset",
+    "DatasetUpdateRequest": "dataset",
+    "Datasets": "dataset",
+    "Method": "method",
+    "Methods": "method",
+    "EvaluationTable": "evaluation",
+    "EvaluationTables": "evaluation",
+    "EvaluationTableCreateRequest": "evaluation",
+    "EvaluationTableUpdateRequest": "evaluation",
+    "Metric": "evaluation",
+    "Metrics": "evaluation",
+    "MetricCreateRequest": "evaluation",
+    "MetricUpdateRequest": "evaluation",
+    "Result": "evaluation",
+    "Results": "evaluation",
+    "ResultCreateRequest": "evaluation",
+    "ResultUpdateRequest": "evaluation",
+    "ResultSyncRequest": "evaluation",
+    "MetricSyncRequest": "evaluation",
+    "EvaluationTableSyncRequest": "evaluation",
+    "ResultSyncResponse": "evaluation",
+    "MetricSyncResponse": "evaluation",
+    "EvaluationTableSyncResponse": "evaluation",
+}
+
+
+def __getattr__(name):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
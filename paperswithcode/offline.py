@@ -0,0 +1,322 @@
+__all__ = ["OfflineHttpClient", "OfflinePapersWithCodeClient"]
+
+import re
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from tea_client import errors, http
+from tea_client.models import TeaClientModel
+
+from paperswithcode.cache import MemoryCache
+from paperswithcode.client import PapersWithCodeClient
+from paperswithcode.mirror import Mirror
+
+
+def _contains(value: str) -> str:
+    return f"%{value}%"
+
+
+def _page(count: int, items: List[dict], page: int, items_per_page: int):
+    """Return the page in the format of the server responses."""
+    return {
+        "count": count,
+        "next": (
+            f"?page={page + 1}" if page * items_per_page < count else None
+        ),
+        "previous": f"?page={page - 1}" if page > 1 else None,
+        "results": items,
+    }
+
+
+def _pagination(params: Dict[str, str]) -> Tuple[int, int]:
+    return int(params.get("page", 1)), int(params.get("items_per_page", 50))
+
+
+def _get(source: str, *columns: str) -> Callable:
+    """Return a single object matching the path arguments."""
+
+    def route(mirror: Mirror, args: Tuple[str, ...], params: Dict[str, str]):
+        where = " AND ".join(f"{column} = ?" for column in columns)
+        _, items = mirror.select(source, where, args, items_per_page=1)
+        if not items:
+            raise errors.HttpClientError("Not found.", status_code=404)
+        return items[0]
+
+    return route
+
+
+def _list(
+    source: str,
+    *columns: str,
+    filters: Optional[Dict[str, Tuple[str, Callable]]] = None,
+) -> Callable:
+    """Return a page of objects matching the path arguments and filters.
+
+    Args:
+        source (str): Mirror table or join.
+        *columns (str): Columns compared with the path arguments.
+        filters (dict, optional): Mapping from the query parameter to the
+            SQL condition and the function converting the parameter value.
+    """
+
+    def route(mirror: Mirror, args: Tuple[str, ...], params: Dict[str, str]):
+        conditions = [f"{column} = ?" for column in columns]
+        parameters = list(args)
+        for name, (condition, convert) in (filters or {}).items():
+            if name in params:
+                conditions.append(condition)
+                value = convert(params[name])
+                parameters.extend([value] * condition.count("?"))
+        page, items_per_page = _pagination(params)
+        count, items = mirror.select(
+            source,
+            " AND ".join(conditions),
+            parameters,
+            page=page,
+            items_per_page=items_per_page,
+        )
+        return _page(count, items, page, items_per_page)
+
+    return route
+
+
+def _paper_list(mirror: Mirror, args: Tuple[str, ...], params: Dict[str, str]):
+    page, items_per_page = _pagination(params)
+    count, items = mirror.search(
+        q=params.get("q"),
+        arxiv_id=params.get("arxiv_id"),
+        title=params.get("title"),
+        abstract=params.get("abstract"),
+        page=page,
+        items_per_page=items_per_page,
+    )
+    return _page(count, items, page, items_per_page)
+
+
+_NAME = {
+    "q": ("name LIKE ?", _contains),
+    "name": ("name LIKE ?", _contains),
+}
+_FULL_NAME = {
+    "q": ("(name LIKE ? OR full_name LIKE ?)", _contains),
+    "name": ("name LIKE ?", _contains),
+    "full_name": ("full_name LIKE ?", _contains),
+}
+
+# Routes of the GET requests, the path arguments are passed to the routes in
+# the order of the path regex groups.
+_ROUTES = [
+    (r"papers", _paper_list),
+    (r"papers/([^/]+)", _get("papers", "id")),
+    (r"papers/([^/]+)/results", _list("results", "paper")),
+    (
+        r"repositories",
+        _list(
+            "repositories",
+            filters={
+                "q": ("(owner LIKE ? OR name LIKE ?)", _contains),
+                "owner": ("owner = ?", str),
+                "name": ("name LIKE ?", _contains),
+                "stars": ("stars >= ?", int),
+                "framework": ("framework = ?", str),
+            },
+        ),
+    ),
+    (r"repositories/([^/]+)", _list("repositories", "owner")),
+    (r"repositories/([^/]+)/([^/]+)", _get("repositories", "owner", "name")),
+    (
+        r"authors",
+        _list(
+            "authors",
+            filters={
+                "q": ("full_name LIKE ?", _contains),
+                "full_name": ("full_name LIKE ?", _contains),
+            },
+        ),
+    ),
+    (r"authors/([^/]+)", _get("authors", "id")),
+    (r"conferences", _list("conferences", filters=_NAME)),
+    (r"conferences/([^/]+)", _get("conferences", "id")),
+    (r"conferences/([^/]+)/proceedings", _list("proceedings", "conference")),
+    (
+        r"conferences/([^/]+)/proceedings/([^/]+)",
+        _get("proceedings", "conference", "id"),
+    ),
+    (
+        r"conferences/([^/]+)/proceedings/([^/]+)/papers",
+        _list("papers", "conference", "proceeding"),
+    ),
+    (r"areas", _list("areas", filters=_NAME)),
+    (r"areas/([^/]+)", _get("areas", "id")),
+    (
+        r"areas/([^/]+)/tasks",
+        _list("tasks JOIN area_tasks ON area_tasks.task = tasks.id", "area"),
+    ),
+    (r"tasks", _list("tasks", filters=_NAME)),
+    (r"tasks/([^/]+)", _get("tasks", "id")),
+    (r"tasks/([^/]+)/evaluations", _list("evaluations", "task")),
+    (r"datasets", _list("datasets", filters=_FULL_NAME)),
+    (r"datasets/([^/]+)", _get("datasets", "id")),
+    (r"datasets/([^/]+)/evaluations", _list("evaluations", "dataset")),
+    (r"methods", _list("methods", filters=_NAME)),
+    (r"methods/([^/]+)", _get("methods", "id")),
+    (r"evaluations", _list("evaluations")),
+    (r"evaluations/([^/]+)", _get("evaluations", "id")),
+    (r"evaluations/([^/]+)/metrics", _list("metrics", "evaluation")),
+    (
+        r"evaluations/([^/]+)/metrics/([^/]+)",
+        _get("metrics", "evaluation", "id"),
+    ),
+    (r"evaluations/([^/]+)/results", _list("results", "evaluation")),
+    (
+        r"evaluations/([^/]+)/results/([^/]+)",
+        _get("results", "evaluation", "id"),
+    ),
+]
+_ROUTES = [(re.compile(pattern), route) for pattern, route in _ROUTES]
+
+
+class OfflineHttpClient:
+    """HTTP client replacement that answers the requests from a mirror.
+
+    GET requests are translated into indexed queries on the mirror database
+    and return the same data as the server. Lists are paginated in the
+    database. Endpoints whose data is not mirrored (e.g. `/search/` or the
+    paper repositories) raise an `HttpClientError` with status code 501, and
+    all other requests methods raise an `HttpClientError` with status code
+    405 since the mirror is read-only.
+
+    Args:
+        mirror (Mirror): Mirror used to answer the requests.
+    """
+
+    Authorization = http.AuthorizationMethod
+
+    def __init__(self, mirror: Mirror):
+        self.mirror = mirror
+        self.authorization_method = http.AuthorizationMethod.token
+        self.response = None
+
+    def close(self):
+        """Close the mirror database."""
+        self.mirror.close()
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        data: Optional[TeaClientModel] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Request method.
+
+        Args:
+            method (str): Method for the request. Only GET is supported.
+            url (str): Partial url of the request.
+            headers (dict): Ignored.
+            params (dict): Dictionary of query parameters for the request.
+            data (BaseModel): Ignored.
+            timeout (float): Ignored.
+
+        Returns:
+            dict: Deserialized json response.
+        """
+        if method.upper() != "GET":
+            raise errors.HttpClientError(
+                "The offline client is read-only.", status_code=405
+            )
+        path = url.strip("/")
+        for pattern, route in _ROUTES:
+            match = pattern.fullmatch(path)
+            if match is not None:
+                return route(self.mirror, match.groups(), params or {})
+        raise errors.HttpClientError("Not available offline.", status_code=501)
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Make a GET request."""
+        return self.request("GET", url, params=params, timeout=timeout)
+
+    def post(
+        self,
+        url: str,
+        data: Optional[TeaClientModel] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Make a POST request."""
+        return self.request("POST", url, data=data, timeout=timeout)
+
+    def patch(
+        self,
+        url: str,
+        data: Optional[TeaClientModel] = None,
+        timeout: Optional[float] = None,
+    ):
+        """Make a PATCH request."""
+        return self.request("PATCH", url, data=data, timeout=timeout)
+
+    def delete(self, url: str, timeout: Optional[float] = None):
+        """Make a DELETE request."""
+        return self.request("DELETE", url, timeout=timeout)
+
+
+class OfflinePapersWithCodeClient(PapersWithCodeClient):
+    """PapersWithCode client backed by a local mirror.
+
+    Has the same methods as the `PapersWithCodeClient` and returns the same
+    models, but reads the data from a mirror database created with
+    `pwc mirror` instead of the server. Lookups by ID use the database
+    indexes and lists are paginated in the database, so there is no network
+    latency and the results don't change between runs.
+
+    Methods that modify data raise an `HttpClientError` with status code
+    405. Methods that read data which is not mirrored (`search`, paper
+    datasets, methods, repositories and tasks, repository papers, author
+    papers and task relations) raise an `HttpClientError` with status code
+    501.
+
+    Example:
+        >>> from paperswithcode.offline import OfflinePapersWithCodeClient
+        >>> client = OfflinePapersWithCodeClient("paperswithcode.sqlite")
+        >>> papers = client.paper_list(q="graph neural network")
+
+    Args:
+        mirror (str, Path or Mirror): Path to the mirror database, or a
+            mirror.
+        memory_cache (MemoryCache, optional): In-process cache for the
+            objects returned by the single object getters.
+        trusted (bool): If True, the models are built without validating the
+            values that already have the right type. The mirrored objects
+            were validated when they were crawled. Default: True.
+    """
+
+    def __init__(
+        self,
+        mirror: Union[str, Path, Mirror],
+        memory_cache: Optional[MemoryCache] = None,
+        trusted: bool = True,
+    ):
+        if not isinstance(mirror, Mirror):
+            if not Path(mirror).expanduser().exists():
+                raise FileNotFoundError(f"Mirror not found: {mirror}")
+            mirror = Mirror(mirror)
+        self.http = OfflineHttpClient(mirror)
+        self.memory_cache = memory_cache
+        self.trusted = trusted
+
+    @property
+    def streaming(self) -> "OfflinePapersWithCodeClient":
+        """Return this client.
+
+        The mirror is paginated in the database, so only the requested page
+        is ever held in memory and there is nothing to stream. The list
+        methods return regular pages, which can be used in the same way as
+        the streamed pages, e.g. with the pagination helpers.
+        """
+        return self
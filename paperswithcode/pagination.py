@@ -0,0 +1,447 @@
+__all__ = ["iterate", "iterate_pages", "aiterate", "aiterate_pages"]
+
+import asyncio
+import math
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait
+from typing import AsyncIterator, Awaitable, Callable, Container, Dict
+from typing import Iterator, Optional, Set
+
+from tea_client.models import TeaClientModel
+
+from paperswithcode.models import Page
+from paperswithcode.streaming import AsyncPageStream, PageStream
+
+_STREAMED = (PageStream, AsyncPageStream)
+
+
+def _field(page, name: str):
+    """Return a page field, pages of the raw client are dictionaries."""
+    if isinstance(page, dict):
+        return page[name]
+    return getattr(page, name)
+
+
+class _Plan:
+    """Pages to fetch concurrently after the first page.
+
+    Servers can return fewer items per page than requested, so the pages are
+    numbered with the size of the first page that came back, not with the
+    requested size. The results of streamed pages are read only after the
+    page is yielded, so they are planned with the requested size and checked
+    with the count and the next page link only.
+    """
+
+    __slots__ = ("size", "count", "last_page")
+
+    def __init__(self, first, items_per_page: int):
+        if isinstance(first, _STREAMED):
+            self.size = items_per_page
+        else:
+            self.size = len(_field(first, "results"))
+        self.count = _field(first, "count")
+        self.last_page = math.ceil(self.count / self.size) if self.size else 0
+
+    def matches(self, result, number: int) -> bool:
+        """Return True if the page has the size implied by the first page.
+
+        Otherwise the pages are not numbered as planned, e.g. because
+        objects were added or removed during the iteration.
+        """
+        next_page = _field(result, "next_page")
+        if isinstance(result, _STREAMED):
+            return result.count == self.count and next_page == (
+                number + 1 if number < self.last_page else None
+            )
+        size = len(_field(result, "results"))
+        if number < self.last_page:
+            return size == self.size and next_page == number + 1
+        return (
+            size == self.count - (self.last_page - 1) * self.size
+            and next_page is None
+        )
+
+
+def _max_streams(method: Callable[..., Page]) -> Optional[int]:
+    """Return how many streamed pages the client can hold open at once.
+
+    Every streamed page holds a connection until it is read, so fetching
+    more pages ahead than the pool has connections would block forever.
+    """
+    http = getattr(getattr(method, "__self__", None), "http", None)
+    pool_limits = getattr(http, "pool_limits", None)
+    return None if pool_limits is None else pool_limits.max_connections
+
+
+def _discard(result):
+    """Release the connection of a page that is not yielded."""
+    if isinstance(result, PageStream):
+        result.close()
+
+
+async def _adiscard(result):
+    """Release the connection of a page that is not yielded."""
+    if isinstance(result, AsyncPageStream):
+        await result.aclose()
+
+
+def _follow(
+    method: Callable[..., Page],
+    args: tuple,
+    kwargs: dict,
+    page: Optional[int],
+    items_per_page: int,
+    skip: Container[int] = (),
+) -> Iterator[Page]:
+    """Fetch the pages one by one following the next page links."""
+    while page is not None:
+        result = method(
+            *args, page=page, items_per_page=items_per_page, **kwargs
+        )
+        number, page = page, _field(result, "next_page")
+        if number in skip:
+            _discard(result)
+        else:
+            yield result
+
+
+def _fan_out(
+    method: Callable[..., Page],
+    args: tuple,
+    kwargs: dict,
+    page: int,
+    items_per_page: int,
+    workers: int,
+    ordered: bool,
+) -> Iterator[Page]:
+    first = method(*args, page=page, items_per_page=items_per_page, **kwargs)
+    yield first
+    next_page = _field(first, "next_page")
+    if next_page is None:
+        return
+    plan = _Plan(first, items_per_page)
+    if isinstance(first, PageStream):
+        workers = min(workers, _max_streams(method) or workers)
+    del first
+    if plan.last_page < next_page:
+        yield from _follow(method, args, kwargs, next_page, items_per_page)
+        return
+    pages = iter(range(next_page, plan.last_page + 1))
+
+    def submit(executor, pending):
+        for number in pages:
+            future = executor.submit(
+                method,
+                *args,
+                page=number,
+                items_per_page=items_per_page,
+                **kwargs,
+            )
+            pending[future] = number
+            if len(pending) >= workers:
+                break
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    # Futures in submission order, mapped to their page number.
+    pending: Dict[Future, int] = {}
+    yielded: Set[int] = set()
+    fallback = None
+    try:
+        submit(executor, pending)
+        while pending:
+            if ordered:
+                future = next(iter(pending))
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+            number = pending.pop(future)
+            result = future.result()
+            yielded.add(number)
+            if not plan.matches(result, number):
+                # Follow the links instead, the pages that are still pending
+                # might not have the planned content. Unordered pages before
+                # this one might still be pending, the links are followed
+                # from the first page that was not yielded.
+                fallback = min(
+                    (
+                        n
+                        for n in (
+                            _field(result, "next_page"),
+                            *pending.values(),
+                        )
+                        if n is not None
+                    ),
+                    default=None,
+                )
+                yield result
+                break
+            # Keep at most `workers` pages in flight, so that the memory
+            # stays bounded even if the consumer is slower than the network.
+            submit(executor, pending)
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+        for future in pending:
+            if not future.cancelled() and future.exception() is None:
+                _discard(future.result())
+    yield from _follow(
+        method, args, kwargs, fallback, items_per_page, skip=yielded
+    )
+
+
+def iterate_pages(
+    method: Callable[..., Page],
+    *args,
+    page: int = 1,
+    items_per_page: int = 50,
+    workers: int = 1,
+    ordered: bool = True,
+    **kwargs,
+) -> Iterator[Page]:
+    """Lazily iterate over all pages returned by a list method.
+
+    By default pages are requested one by one, only when the previous page
+    has been consumed, so at most one page is held in memory at any time.
+
+    If `workers` is greater than 1, the first page is fetched to find out the
+    total number of pages and the remaining pages are fetched concurrently
+    using a pool of `workers` threads. At most `workers` pages are fetched
+    ahead of the consumer. The number of pages is computed with the number
+    of items the server actually returned in the first page, which can be
+    smaller than `items_per_page`. If a page does not have the expected
+    number of items, e.g. because objects were added or removed during the
+    iteration, the remaining pages are fetched one by one following the
+    next page links.
+
+    Pages of the streaming client hold a connection until their results are
+    read or the page is closed, so at most `max_connections` of the pool
+    limits are fetched ahead, and every page must be read or closed before
+    the next one is requested.
+
+    Args:
+        method (callable): Any of the client list methods that accept the
+            `page` and `items_per_page` arguments, e.g. `client.paper_list`.
+        *args: Positional arguments passed to the list method.
+        page (int): Page from which to start the iteration. Default: 1.
+        items_per_page (int): Desired number of items per page.
+            Default: 50.
+        workers (int): Number of pages to fetch concurrently. Default: 1.
+        ordered (bool): If True pages are yielded in page order, otherwise
+            they are yielded as soon as they are fetched. Used only when
+            `workers` is greater than 1. Default: True.
+        **kwargs: Keyword arguments passed to the list method.
+
+    Yields:
+        Page: Page objects returned by the list method.
+    """
+    if workers > 1:
+        yield from _fan_out(
+            method, args, kwargs, page, items_per_page, workers, ordered
+        )
+    else:
+        yield from _follow(method, args, kwargs, page, items_per_page)
+
+
+def iterate(
+    method: Callable[..., Page],
+    *args,
+    page: int = 1,
+    items_per_page: int = 50,
+    workers: int = 1,
+    ordered: bool = True,
+    **kwargs,
+) -> Iterator[TeaClientModel]:
+    """Lazily iterate over all items returned by a list method.
+
+    Example:
+        >>> from paperswithcode import PapersWithCodeClient
+        >>> from paperswithcode.pagination import iterate
+        >>> client = PapersWithCodeClient()
+        >>> for paper in iterate(client.paper_list, q="transformer"):
+        ...     print(paper.title)
+
+    Args:
+        method (callable): Any of the client list methods that accept the
+            `page` and `items_per_page` arguments, e.g. `client.paper_list`.
+        *args: Positional arguments passed to the list method.
+        page (int): Page from which to start the iteration. Default: 1.
+        items_per_page (int): Desired number of items per page.
+            Default: 50.
+        workers (int): Number of pages to fetch concurrently. Default: 1.
+        ordered (bool): If True items are yielded in page order, otherwise
+            pages are yielded as soon as they are fetched. Used only when
+            `workers` is greater than 1. Default: True.
+        **kwargs: Keyword arguments passed to the list method.
+
+    Yields:
+        TeaClientModel: Items from all the pages, dictionaries for the raw
+            client.
+    """
+    for result in iterate_pages(
+        method,
+        *args,
+        page=page,
+        items_per_page=items_per_page,
+        workers=workers,
+        ordered=ordered,
+        **kwargs,
+    ):
+        yield from _field(result, "results")
+
+
+async def aiterate_pages(
+    method: Callable[..., Awaitable[Page]],
+    *args,
+    page: int = 1,
+    items_per_page: int = 50,
+    workers: int = 1,
+    **kwargs,
+) -> AsyncIterator[Page]:
+    """Lazily iterate over all pages returned by an async list method.
+
+    Asynchronous counterpart of `iterate_pages` for the
+    `AsyncPapersWithCodeClient`. If `workers` is greater than 1, up to
+    `workers` pages are requested concurrently, planned like in
+    `iterate_pages`. Pages are always yielded in page order. Pages of the
+    streaming client are fetched ahead like in `iterate_pages`.
+
+    Args:
+        method (callable): Any of the async client list methods that accept
+            the `page` and `items_per_page` arguments.
+        *args: Positional arguments passed to the list method.
+        page (int): Page from which to start the iteration. Default: 1.
+        items_per_page (int): Desired number of items per page.
+            Default: 50.
+        workers (int): Number of pages to fetch concurrently. Default: 1.
+        **kwargs: Keyword arguments passed to the list method.
+
+    Yields:
+        Page: Page objects returned by the list method.
+    """
+    result = await method(
+        *args, page=page, items_per_page=items_per_page, **kwargs
+    )
+    yield result
+    next_page = _field(result, "next_page")
+    if workers <= 1 or next_page is None:
+        async for result in _afollow(
+            method, args, kwargs, next_page, items_per_page
+        ):
+            yield result
+        return
+
+    plan = _Plan(result, items_per_page)
+    if isinstance(result, AsyncPageStream):
+        workers = min(workers, _max_streams(method) or workers)
+    del result
+    pages = iter(range(next_page, plan.last_page + 1))
+
+    def submit(pending):
+        for number in pages:
+            future = asyncio.ensure_future(
+                method(
+                    *args,
+                    page=number,
+                    items_per_page=items_per_page,
+                    **kwargs,
+                )
+            )
+            pending.append((number, future))
+            if len(pending) >= workers:
+                break
+
+    pending = deque()
+    # Without planned pages, e.g. if the first page is empty, the links are
+    # followed from the first page.
+    fallback = next_page if plan.last_page < next_page else None
+    try:
+        submit(pending)
+        while pending:
+            number, future = pending.popleft()
+            result = await future
+            if not plan.matches(result, number):
+                # Follow the links from this page instead, see `_fan_out`.
+                fallback = _field(result, "next_page")
+                yield result
+                break
+            submit(pending)
+            yield result
+    finally:
+        for _, future in pending:
+            future.cancel()
+        # Pages fetched before they were cancelled hold their connection.
+        results = await asyncio.gather(
+            *(future for _, future in pending), return_exceptions=True
+        )
+        for result in results:
+            await _adiscard(result)
+    async for result in _afollow(
+        method, args, kwargs, fallback, items_per_page
+    ):
+        yield result
+
+
+async def _afollow(
+    method: Callable[..., Awaitable[Page]],
+    args: tuple,
+    kwargs: dict,
+    page: Optional[int],
+    items_per_page: int,
+) -> AsyncIterator[Page]:
+    """Fetch the pages one by one following the next page links."""
+    while page is not None:
+        result = await method(
+            *args, page=page, items_per_page=items_per_page, **kwargs
+        )
+        page = _field(result, "next_page")
+        yield result
+
+
+async def aiterate(
+    method: Callable[..., Awaitable[Page]],
+    *args,
+    page: int = 1,
+    items_per_page: int = 50,
+    workers: int = 1,
+    **kwargs,
+) -> AsyncIterator[TeaClientModel]:
+    """Lazily iterate over all items returned by an async list method.
+
+    Example:
+        >>> from paperswithcode.async_client import AsyncPapersWithCodeClient
+        >>> from paperswithcode.pagination import aiterate
+        >>> async with AsyncPapersWithCodeClient() as client:
+        ...     async for paper in aiterate(client.paper_list, q="bert"):
+        ...         print(paper.title)
+
+    Args:
+        method (callable): Any of the async client list methods that accept
+            the `page` and `items_per_page` arguments.
+        *args: Positional arguments passed to the list method.
+        page (int): Page from which to start the iteration. Default: 1.
+        items_per_page (int): Desired number of items per page.
+            Default: 50.
+        workers (int): Number of pages to fetch concurrently. Default: 1.
+        **kwargs: Keyword arguments passed to the list method.
+
+    Yields:
+        TeaClientModel: Items from all the pages, in page order. Dictionaries
+            for the raw client.
+    """
+    async for result in aiterate_pages(
+        method,
+        *args,
+        page=page,
+        items_per_page=items_per_page,
+        workers=workers,
+        **kwargs,
+    ):
+        if isinstance(result, AsyncPageStream):
+            async for item in result.results:
+                yield item
+        else:
+            for item in _field(result, "results"):
+                yield item
@@ -0,0 +1,240 @@
+__all__ = ["Ranks", "Ranking", "competition_rank"]
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple
+from typing import Union
+
+from paperswithcode.frame import ResultFrame, _import, parse_metric_values
+from paperswithcode.models import Metric, Result, ResultCreateRequest
+
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy
+
+Candidate = Union[ResultCreateRequest, Result, Dict[str, Any]]
+
+
+def _keys(values: "numpy.ndarray", is_loss: bool) -> "numpy.ndarray":
+    """Return the sort keys, lower keys are better."""
+    return values if is_loss else -values
+
+
+def _rank(ordered: "numpy.ndarray", keys: "numpy.ndarray") -> "numpy.ndarray":
+    """Return the ranks of the keys among the sorted valid keys."""
+    numpy = _import("numpy")
+    # The rank is one more than the number of strictly better keys, so equal
+    # keys share the lowest rank and the next rank is skipped.
+    ranks = numpy.searchsorted(ordered, keys, side="left") + 1.0
+    ranks[numpy.isnan(keys)] = numpy.nan
+    return ranks
+
+
+def competition_rank(
+    values: Iterable[float], is_loss: bool = False
+) -> "numpy.ndarray":
+    """Rank values with the standard competition ranking.
+
+    Equal values share the best rank, and as many ranks as there are equal
+    values are skipped after them, e.g. the values 90, 85, 85, 80 are ranked
+    1, 2, 2, 4.
+
+    Args:
+        values (iterable): Metric values, NaN for the missing values.
+        is_loss (bool): If True lower values are better. Default: False.
+
+    Returns:
+        numpy.ndarray: Ranks as floats, NaN for the missing values.
+
+    Raises:
+        ImportError: If numpy is not installed.
+    """
+    numpy = _import("numpy")
+    keys = _keys(numpy.asarray(values, dtype=numpy.float64), is_loss)
+    return _rank(numpy.sort(keys[~numpy.isnan(keys)]), keys)
+
+
+class Ranks:
+    """Ranks of results in an evaluation table.
+
+    Attributes:
+        ranks (dict): Mapping from the metric name to the array of ranks of
+            the results for the metric, NaN if a result has no value for the
+            metric.
+        best_rank (numpy.ndarray): Best rank of every result over all the
+            metrics, NaN if a result has no ranked metric.
+        best_metric (numpy.ndarray): Name of the metric with the best rank
+            for every result, the first one in the table metrics order on
+            ties, None if a result has no ranked metric.
+    """
+
+    __slots__ = ("ranks", "best_rank", "best_metric")
+
+    def __init__(self, ranks: Dict[str, "numpy.ndarray"], size: int):
+        numpy = _import("numpy")
+        self.ranks = ranks
+        if not ranks:
+            self.best_rank = numpy.full(size, numpy.nan)
+            self.best_metric = numpy.full(size, None, dtype=object)
+            return
+        stacked = numpy.stack(list(ranks.values()))
+        best = numpy.argmin(
+            numpy.where(numpy.isnan(stacked), numpy.inf, stacked), axis=0
+        )
+        self.best_rank = stacked[best, numpy.arange(size)]
+        self.best_metric = numpy.array(list(ranks), dtype=object)[best]
+        self.best_metric[numpy.isnan(self.best_rank)] = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(results={len(self.best_rank)})"
+
+    def __len__(self):
+        return len(self.best_rank)
+
+
+class Ranking(Ranks):
+    """Local ranking of the results of an evaluation table.
+
+    Ranks the results for every metric of the table with the standard
+    competition ranking, see `competition_rank`, higher values being better
+    unless the metric is a loss. Results without a value for a metric are
+    not ranked for that metric.
+
+    The ranking can preview the ranks of candidate results without
+    submitting them: `preview` ranks every candidate as if it was the only
+    one added to the table, and `insert` returns the ranking of the table
+    with all the candidates added.
+
+    Example:
+        >>> ranking = client.evaluation_ranking("imagenet")
+        >>> preview = ranking.preview(candidates)
+        >>> preview.best_rank.min()
+        3.0
+
+    Args:
+        values (dict): Mapping from the metric name to the array of metric
+            values of the results, e.g. `ResultFrame.metrics`.
+        is_loss (dict): Mapping from the metric name to True if lower values
+            are better. Only these metrics are ranked, in this order.
+        size (int, optional): Number of results. Default: the length of the
+            metric value arrays.
+
+    Attributes:
+        values (dict): Metric values of the ranked metrics.
+        is_loss (dict): Mapping from the metric name to True if lower values
+            are better.
+    """
+
+    __slots__ = ("values", "is_loss", "_ordered")
+
+    def __init__(
+        self,
+        values: Dict[str, "numpy.ndarray"],
+        is_loss: Dict[str, bool],
+        size: Optional[int] = None,
+    ):
+        numpy = _import("numpy")
+        if size is None:
+            size = len(next(iter(values.values()), ()))
+        self.values = {
+            name: numpy.asarray(
+                values.get(name, numpy.full(size, numpy.nan)),
+                dtype=numpy.float64,
+            )
+            for name in is_loss
+        }
+        self.is_loss = dict(is_loss)
+        self._ordered = {}
+        ranks = {}
+        for name, column in self.values.items():
+            keys = _keys(column, self.is_loss[name])
+            self._ordered[name] = numpy.sort(keys[~numpy.isnan(keys)])
+            ranks[name] = _rank(self._ordered[name], keys)
+        super().__init__(ranks, size)
+
+    @classmethod
+    def from_frame(
+        cls,
+        frame: ResultFrame,
+        metrics: Iterable[Union[Metric, Dict[str, Any]]],
+    ) -> "Ranking":
+        """Create the ranking of the results in a frame.
+
+        Args:
+            frame (ResultFrame): Results of the evaluation table.
+            metrics (iterable): `Metric` objects of the evaluation table, or
+                dictionaries from the raw client.
+
+        Returns:
+            Ranking: Ranking of the results.
+        """
+        is_loss = {}
+        for metric in metrics:
+            if isinstance(metric, dict):
+                is_loss[metric["name"]] = metric["is_loss"]
+            else:
+                is_loss[metric.name] = metric.is_loss
+        return cls(frame.metrics, is_loss, size=len(frame))
+
+    def _candidate_values(
+        self, candidates: Iterable[Candidate]
+    ) -> Tuple[int, Dict[str, "numpy.ndarray"]]:
+        """Return the number and the parsed metric values of candidates."""
+        rows: List[dict] = [
+            (
+                candidate["metrics"]
+                if isinstance(candidate, dict)
+                else candidate.metrics
+            )
+            or {}
+            for candidate in candidates
+        ]
+        return len(rows), {
+            name: parse_metric_values([row.get(name) for row in rows])
+            for name in self.is_loss
+        }
+
+    def preview(self, candidates: Iterable[Candidate]) -> Ranks:
+        """Rank every candidate as if it was the only one added to the table.
+
+        The rank of a candidate is the rank it would get if it was added to
+        the table alone, so a candidate with the same value as a result of
+        the table shares its rank. The ranks of the results of the table are
+        not changed.
+
+        Args:
+            candidates (iterable): `ResultCreateRequest` or `Result`
+                objects, or dictionaries with a `metrics` key.
+
+        Returns:
+            Ranks: Ranks of the candidates, in the order of `candidates`.
+        """
+        size, values = self._candidate_values(candidates)
+        return Ranks(
+            {
+                name: _rank(
+                    self._ordered[name], _keys(column, self.is_loss[name])
+                )
+                for name, column in values.items()
+            },
+            size,
+        )
+
+    def insert(self, candidates: Iterable[Candidate]) -> "Ranking":
+        """Return the ranking with all the candidates added to the table.
+
+        Args:
+            candidates (iterable): `ResultCreateRequest` or `Result`
+                objects, or dictionaries with a `metrics` key.
+
+        Returns:
+            Ranking: Ranking of the results of the table followed by the
+                candidates, in the order of `candidates`.
+        """
+        numpy = _import("numpy")
+        size, values = self._candidate_values(candidates)
+        return Ranking(
+            {
+                name: numpy.concatenate([self.values[name], values[name]])
+                for name in self.is_loss
+            },
+            self.is_loss,
+            size=len(self) + size,
+        )
@@ -0,0 +1,200 @@
+__all__ = ["RateLimiter"]
+
+import time
+import random
+import threading
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import httpx
+
+
+class _Bucket:
+    """Token bucket for a single endpoint group."""
+
+    __slots__ = ("rate", "max_rate", "burst", "tokens", "updated_at")
+
+    def __init__(self, rate: float, max_rate: float, burst: float):
+        self.rate = rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated_at = time.monotonic()
+
+    def refill(self, now: float):
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+            self.updated_at = now
+
+
+class RateLimiter:
+    """Adaptive client side rate limiter.
+
+    Requests are throttled using a token bucket per endpoint group. The
+    endpoint group is the first segment of the request path, e.g. `papers`
+    for `/papers/{paper_id}/`, `evaluations` or `rpc`.
+
+    The rate adapts to the server: every successful response increases the
+    rate of its group by `increase` requests per second, up to `max_rate`,
+    and every `429 Too Many Requests` response multiplies it by `decrease`
+    and pauses the group for the time requested in the `Retry-After` header.
+
+    Idempotent GET requests that fail with 429, 502, 503 or 504, or time out,
+    are retried up to `max_retries` times, waiting an exponentially growing,
+    randomly jittered time between the attempts.
+
+    Args:
+        rate (float): Initial number of requests per second. Default: 10.
+        burst (float, optional): Maximal number of requests that can be made
+            at once after a period of inactivity. Default: same as `rate`.
+        max_rate (float, optional): Maximal rate the limiter can increase
+            to. Default: 4 times the initial rate.
+        min_rate (float): Minimal rate the limiter can decrease to.
+            Default: 0.1.
+        increase (float): Rate increase after a successful response.
+            Default: 0.1.
+        decrease (float): Rate multiplier after a 429 response. Default: 0.5.
+        group_rates (dict, optional): Initial rates for specific endpoint
+            groups, e.g. `{"search": 1}`.
+        max_retries (int): Maximal number of retries of a GET request.
+            Default: 5.
+        backoff (float): Base retry delay in seconds. Default: 0.5.
+        max_backoff (float): Maximal retry delay in seconds. Default: 60.
+    """
+
+    RETRY_STATUS_CODES = frozenset((429, 502, 503, 504))
+
+    def __init__(
+        self,
+        rate: float = 10,
+        burst: Optional[float] = None,
+        max_rate: Optional[float] = None,
+        min_rate: float = 0.1,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+        group_rates: Optional[Dict[str, float]] = None,
+        max_retries: int = 5,
+        backoff: float = 0.5,
+        max_backoff: float = 60,
+    ):
+        self.rate = rate
+        self.burst = burst
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.group_rates = group_rates or {}
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, _Bucket] = {}
+
+    @staticmethod
+    def group(url: str) -> str:
+        """Return the endpoint group of the request path."""
+        return url.strip("/").split("/", 1)[0]
+
+    def _bucket(self, group: str) -> _Bucket:
+        bucket = self._buckets.get(group)
+        if bucket is None:
+            rate = self.group_rates.get(group, self.rate)
+            bucket = _Bucket(
+                rate=rate,
+                max_rate=(
+                    rate * 4 if self.max_rate is None else self.max_rate
+                ),
+                burst=max(1.0, rate if self.burst is None else self.burst),
+            )
+            self._buckets[group] = bucket
+        return bucket
+
+    def current_rate(self, url: str) -> float:
+        """Return the current rate of the endpoint group of the URL."""
+        with self._lock:
+            return self._bucket(self.group(url)).rate
+
+    def acquire(self, url: str) -> float:
+        """Reserve a request slot.
+
+        Args:
+            url (str): Request path.
+
+        Returns:
+            float: Number of seconds the caller has to wait before making the
+                request.
+        """
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(self.group(url))
+            bucket.refill(now)
+            bucket.tokens -= 1
+            if bucket.tokens >= 0:
+                return 0.0
+            return -bucket.tokens / bucket.rate
+
+    def update(self, url: str, response: httpx.Response):
+        """Adapt the rate of the endpoint group to the server response."""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._bucket(self.group(url))
+            if response.status_code == 429:
+                bucket.refill(now)
+                bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+                # Pause the whole group until the server is ready again.
+                pause = self.retry_after(response) or 1 / bucket.rate
+                bucket.tokens = min(bucket.tokens, 0) - pause * bucket.rate
+            elif response.status_code < 400:
+                bucket.rate = min(bucket.max_rate, bucket.rate + self.increase)
+
+    def retry_delay(
+        self,
+        method: str,
+        attempt: int,
+        response: Optional[httpx.Response] = None,
+    ) -> Optional[float]:
+        """Return the delay before retrying a request, or None.
+
+        Args:
+            method (str): Request method. Only GET requests are retried.
+            attempt (int): Number of retries already made.
+            response (httpx.Response, optional): Failed response, or None if
+                the request timed out.
+
+        Returns:
+            float, optional: Number of seconds to wait before the retry, or
+                None if the request should not be retried.
+        """
+        if method != "GET" or attempt >= self.max_retries:
+            return None
+        if (
+            response is not None
+            and response.status_code not in self.RETRY_STATUS_CODES
+        ):
+            return None
+        delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+        # Full jitter, so that the clients don't retry in lockstep.
+        delay = random.uniform(0, delay)
+        if response is not None:
+            delay = max(delay, self.retry_after(response) or 0)
+        return delay
+
+    @staticmethod
+    def retry_after(response: httpx.Response) -> Optional[float]:
+        """Parse the `Retry-After` header into seconds."""
+        value = response.headers.get("Retry-After")
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
@@ -0,0 +1,549 @@
+__all__ = [
+    "PageStream",
+    "AsyncPageStream",
+    "DeferredRequest",
+    "AsyncDeferredRequest",
+    "StreamingHttpClient",
+    "AsyncStreamingHttpClient",
+]
+
+import re
+import json
+import codecs
+from contextlib import AsyncExitStack, ExitStack, contextmanager
+from typing import Any, AsyncContextManager, AsyncIterable, AsyncIterator
+from typing import Callable, ContextManager, Dict, Iterable, Iterator
+from typing import Optional
+
+import httpx
+from tea_client import errors
+
+from paperswithcode.http import AsyncHttpClient, HttpClient
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _BaseReader:
+    """Buffer of the incremental JSON readers.
+
+    Only the text between the current position and the end of the last
+    chunk is kept in memory. Values are decoded with the standard library
+    decoder, so they are identical to the values in the fully decoded
+    document.
+    """
+
+    __slots__ = ("_chunks", "_decoder", "_raw_decode", "_buffer", "_pos")
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._raw_decode = json.JSONDecoder().raw_decode
+        self._buffer = ""
+        self._pos = 0
+
+    def _append(self, chunk: bytes, final: bool = False) -> bool:
+        """Append a chunk to the buffer, return False if it had no text."""
+        text = self._decoder.decode(chunk, final=final)
+        if not text:
+            return False
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        return True
+
+    def _skip(self) -> str:
+        """Skip the whitespace, return the next character or ""."""
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        return self._buffer[self._pos : self._pos + 1]
+
+    def _consume(self, character: str, characters: str) -> str:
+        if character == "" or character not in characters:
+            raise json.JSONDecodeError(
+                f"Expecting one of {characters!r}", self._buffer, self._pos
+            )
+        self._pos += 1
+        return character
+
+
+class _Reader(_BaseReader):
+    """Incremental JSON reader over chunks of UTF-8 encoded bytes."""
+
+    __slots__ = ()
+
+    def __init__(self, chunks: Iterable[bytes]):
+        super().__init__(iter(chunks))
+
+    def _fill(self) -> bool:
+        """Append the next chunk to the buffer, return False at the end."""
+        for chunk in self._chunks:
+            if self._append(chunk):
+                return True
+        return self._append(b"", final=True)
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character, or "" at the end."""
+        while True:
+            character = self._skip()
+            if character or not self._fill():
+                return character
+
+    def expect(self, characters: str) -> str:
+        """Consume and return the next character, one of `characters`."""
+        return self._consume(self.peek(), characters)
+
+    def value(self) -> Any:
+        """Decode and consume the next value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # The value might be cut at the end of the buffer.
+                if self._fill():
+                    continue
+                raise
+            # A number at the end of the buffer might continue in the next
+            # chunk.
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+class _AsyncReader(_BaseReader):
+    """Incremental JSON reader over asynchronous chunks of bytes."""
+
+    __slots__ = ()
+
+    def __init__(self, chunks: AsyncIterable[bytes]):
+        super().__init__(chunks.__aiter__())
+
+    async def _fill(self) -> bool:
+        """Append the next chunk to the buffer, return False at the end."""
+        async for chunk in self._chunks:
+            if self._append(chunk):
+                return True
+        return self._append(b"", final=True)
+
+    async def peek(self) -> str:
+        """Return the next non-whitespace character, or "" at the end."""
+        while True:
+            character = self._skip()
+            if character or not await self._fill():
+                return character
+
+    async def expect(self, characters: str) -> str:
+        """Consume and return the next character, one of `characters`."""
+        return self._consume(await self.peek(), characters)
+
+    async def value(self) -> Any:
+        """Decode and consume the next value."""
+        await self.peek()
+        while True:
+            try:
+                value, end = self._raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # The value might be cut at the end of the buffer.
+                if await self._fill():
+                    continue
+                raise
+            # A number at the end of the buffer might continue in the next
+            # chunk.
+            if end == len(self._buffer) and await self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+class _BasePageStream:
+    """Page fields and error handling of the streamed pages."""
+
+    def __init__(self, build: Callable[[dict], Any], parse_page):
+        self.count = None
+        self.next_page = None
+        self.previous_page = None
+        self._build = build
+        self._parse_page = parse_page
+        self._response = None
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(count={self.count}, "
+            f"next_page={self.next_page}, "
+            f"previous_page={self.previous_page})"
+        )
+
+    @contextmanager
+    def _parsing(self):
+        """Convert the errors while reading the page into client errors."""
+        try:
+            yield
+        except httpx.TimeoutException as e:
+            raise errors.HttpClientTimeout() from e
+        except httpx.HTTPError as e:
+            raise errors.HttpClientError(f"Unknown error. {e!r}") from e
+        except ValueError as e:
+            # JSON and UTF-8 decoding errors.
+            raise errors.HttpClientError(
+                f"Error while parsing server response: {e!r}",
+                response=self._response,
+            ) from e
+
+    def _set(self, name: str, value: Any):
+        if name == "count":
+            self.count = value
+        elif name == "next" and value is not None:
+            self.next_page = self._parse_page(value)
+        elif name == "previous" and value is not None:
+            self.previous_page = self._parse_page(value)
+
+
+class PageStream(_BasePageStream):
+    """Page whose results are decoded while they are read from the server.
+
+    Returned by the list methods of the streaming client. The `count`,
+    `next_page` and `previous_page` fields are read when the page is
+    created, and the results are decoded and built one at a time while
+    iterating over `results`, so only the item being built is held in memory
+    no matter how large the page is. The results can be iterated only once.
+
+    The connection is released when all the results have been read. Call
+    `close` or use the page as a context manager when the iteration can stop
+    early. An invalid or truncated page raises an `HttpClientError` while
+    iterating, like the regular client does for the whole page.
+
+    Example:
+        >>> with client.streaming.paper_list(items_per_page=1000) as page:
+        ...     for paper in page.results:
+        ...         print(paper.title)
+
+    Attributes:
+        count (int): Total number of items.
+        next_page (int, optional): Number of the next page.
+        previous_page (int, optional): Number of the previous page.
+        results (Iterator): Items of the page.
+    """
+
+    def __init__(
+        self,
+        response: ContextManager[httpx.Response],
+        build: Callable[[dict], Any],
+        parse_page: Callable[[str], int],
+    ):
+        super().__init__(build, parse_page)
+        self._exit = ExitStack()
+        try:
+            self._response = self._exit.enter_context(response)
+            with self._parsing():
+                self._reader = _Reader(self._response.iter_bytes())
+                self._reader.expect("{")
+                self._first = True
+                streaming = self._read_fields()
+        except BaseException:
+            self.close()
+            raise
+        self.results = self._results(streaming)
+
+    def __iter__(self) -> Iterator[Any]:
+        return self.results
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Release the connection without reading the remaining results."""
+        self._exit.close()
+
+    def _read_fields(self) -> bool:
+        """Read the page fields up to the results or the end of the page.
+
+        Returns True if the reader stopped at the start of the results.
+        """
+        reader = self._reader
+        while True:
+            if self._first:
+                self._first = False
+                if reader.peek() == "}":
+                    reader.expect("}")
+                    return False
+            elif reader.expect(",}") == "}":
+                return False
+            name = reader.value()
+            reader.expect(":")
+            if name == "results" and reader.peek() == "[":
+                reader.expect("[")
+                return True
+            self._set(name, reader.value())
+
+    def _results(self, streaming: bool) -> Iterator[Any]:
+        reader = self._reader
+        try:
+            if streaming:
+                with self._parsing():
+                    end = reader.peek() == "]"
+                    if end:
+                        reader.expect("]")
+                while not end:
+                    with self._parsing():
+                        item = reader.value()
+                    # Building errors are not parsing errors.
+                    yield self._build(item)
+                    with self._parsing():
+                        end = reader.expect(",]") == "]"
+                with self._parsing():
+                    # Fields sent after the results.
+                    self._read_fields()
+        finally:
+            self.close()
+
+
+class AsyncPageStream(_BasePageStream):
+    """Asynchronous counterpart of `PageStream`.
+
+    Returned by the list methods of the asynchronous streaming client, with
+    the `count`, `next_page` and `previous_page` fields already read. The
+    results are decoded and built one at a time while iterating over
+    `results` with `async for`, and can be iterated only once.
+
+    The connection is released when all the results have been read. Call
+    `aclose` or use the page as an async context manager when the iteration
+    can stop early.
+
+    Example:
+        >>> page = await client.streaming.paper_list(items_per_page=1000)
+        >>> async with page:
+        ...     async for paper in page.results:
+        ...         print(paper.title)
+
+    Attributes:
+        count (int): Total number of items.
+        next_page (int, optional): Number of the next page.
+        previous_page (int, optional): Number of the previous page.
+        results (AsyncIterator): Items of the page.
+    """
+
+    def __init__(
+        self,
+        response: AsyncContextManager[httpx.Response],
+        build: Callable[[dict], Any],
+        parse_page: Callable[[str], int],
+    ):
+        super().__init__(build, parse_page)
+        self._exit = AsyncExitStack()
+        self._response_context = response
+        self._reader = None
+        self._first = True
+        self.results = None
+
+    def __aiter__(self) -> AsyncIterator[Any]:
+        return self.results
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def open(self) -> "AsyncPageStream":
+        """Make the request and read the page fields up to the results.
+
+        Returns:
+            AsyncPageStream: This page.
+        """
+        try:
+            self._response = await self._exit.enter_async_context(
+                self._response_context
+            )
+            with self._parsing():
+                self._reader = _AsyncReader(self._response.aiter_bytes())
+                await self._reader.expect("{")
+                streaming = await self._read_fields()
+        except BaseException:
+            await self.aclose()
+            raise
+        self.results = self._results(streaming)
+        return self
+
+    async def aclose(self):
+        """Release the connection without reading the remaining results."""
+        await self._exit.aclose()
+
+    async def _read_fields(self) -> bool:
+        """Read the page fields up to the results or the end of the page.
+
+        Returns True if the reader stopped at the start of the results.
+        """
+        reader = self._reader
+        while True:
+            if self._first:
+                self._first = False
+                if await reader.peek() == "}":
+                    await reader.expect("}")
+                    return False
+            elif await reader.expect(",}") == "}":
+                return False
+            name = await reader.value()
+            await reader.expect(":")
+            if name == "results" and await reader.peek() == "[":
+                await reader.expect("[")
+                return True
+            self._set(name, await reader.value())
+
+    async def _results(self, streaming: bool) -> AsyncIterator[Any]:
+        reader = self._reader
+        try:
+            if streaming:
+                with self._parsing():
+                    end = await reader.peek() == "]"
+                    if end:
+                        await reader.expect("]")
+                while not end:
+                    with self._parsing():
+                        item = await reader.value()
+                    # Building errors are not parsing errors.
+                    yield self._build(item)
+                    with self._parsing():
+                        end = await reader.expect(",]") == "]"
+                with self._parsing():
+                    # Fields sent after the results.
+                    await self._read_fields()
+        finally:
+            await self.aclose()
+
+
+class DeferredRequest:
+    """GET request made by the streaming client when its result is used.
+
+    Args:
+        http (HttpClient): HTTP client used for the request.
+        url (str): Partial url of the request.
+        params (dict, optional): Query parameters for the request.
+        timeout (float, optional): Request timeout.
+    """
+
+    __slots__ = ("http", "url", "params", "timeout")
+
+    def __init__(
+        self,
+        http: HttpClient,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.http = http
+        self.url = url
+        self.params = params
+        self.timeout = timeout
+
+    def stream(self) -> ContextManager[httpx.Response]:
+        """Return the streamed response."""
+        return self.http.stream(
+            "GET", self.url, params=self.params, timeout=self.timeout
+        )
+
+    def load(self) -> dict:
+        """Make the request as usual and return the deserialized response."""
+        return self.http.get(
+            self.url, params=self.params, timeout=self.timeout
+        )
+
+
+class AsyncDeferredRequest:
+    """GET request made by the async streaming client when its result is used.
+
+    Awaiting the request makes it as usual and returns the deserialized
+    response.
+
+    Args:
+        http (AsyncHttpClient): HTTP client used for the request.
+        url (str): Partial url of the request.
+        params (dict, optional): Query parameters for the request.
+        timeout (float, optional): Request timeout.
+    """
+
+    __slots__ = ("http", "url", "params", "timeout")
+
+    def __init__(
+        self,
+        http: AsyncHttpClient,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ):
+        self.http = http
+        self.url = url
+        self.params = params
+        self.timeout = timeout
+
+    def __await__(self):
+        return self.load().__await__()
+
+    def stream(self) -> AsyncContextManager[httpx.Response]:
+        """Return the streamed response."""
+        return self.http.stream(
+            "GET", self.url, params=self.params, timeout=self.timeout
+        )
+
+    async def load(self) -> dict:
+        """Make the request as usual and return the deserialized response."""
+        return await self.http.get(
+            self.url, params=self.params, timeout=self.timeout
+        )
+
+
+class StreamingHttpClient:
+    """HTTP client wrapper used by the streaming client.
+
+    GET requests return a `DeferredRequest`, so the client can stream the
+    pages and make the other requests as usual. Everything else is delegated
+    to the wrapped client.
+
+    Args:
+        http (HttpClient): Wrapped client.
+    """
+
+    def __init__(self, http: HttpClient):
+        self.http = http
+
+    def __getattr__(self, name):
+        return getattr(self.http, name)
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> DeferredRequest:
+        """Return the deferred GET request."""
+        return DeferredRequest(self.http, url, params=params, timeout=timeout)
+
+
+class AsyncStreamingHttpClient:
+    """HTTP client wrapper used by the asynchronous streaming client.
+
+    GET requests return an `AsyncDeferredRequest`, which the client streams
+    for the pages and awaits for the other requests. Everything else is
+    delegated to the wrapped client.
+
+    Args:
+        http (AsyncHttpClient): Wrapped client.
+    """
+
+    def __init__(self, http: AsyncHttpClient):
+        self.http = http
+
+    def __getattr__(self, name):
+        return getattr(self.http, name)
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncDeferredRequest:
+        """Return the deferred GET request."""
+        return AsyncDeferredRequest(
+            self.http, url, params=params, timeout=timeout
+        )
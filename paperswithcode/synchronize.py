@@ -0,0 +1,391 @@
+__all__ = [
+    "SyncState",
+    "SyncDelta",
+    "synchronize_chunked",
+    "asynchronize_chunked",
+]
+
+import json
+import time
+import random
+import asyncio
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Iterable, Iterator, Optional
+from typing import Tuple, Union
+
+from tea_client import errors
+
+from paperswithcode.models import EvaluationTableSyncRequest, ResultSyncRequest
+
+# Status codes of the failed chunks that are retried.
+_RETRY_STATUS_CODES = frozenset((429, 500, 502, 503, 504))
+
+
+class SyncState:
+    """Progress of a chunked evaluation table synchronization.
+
+    Records the server response for every synchronized chunk. Passing the
+    same state to `evaluation_synchronize` after a failure resumes the
+    synchronization, the chunks that already succeeded are not sent again.
+
+    Attributes:
+        chunk_size (int, optional): Number of results per chunk.
+        total (int, optional): Number of results to synchronize.
+        responses (dict): Mapping from the chunk index to the deserialized
+            server response for all the synchronized chunks.
+    """
+
+    __slots__ = ("chunk_size", "total", "responses")
+
+    def __init__(self):
+        self.chunk_size: Optional[int] = None
+        self.total: Optional[int] = None
+        self.responses: Dict[int, dict] = {}
+
+    def __repr__(self):
+        return (
+            f"SyncState(done={self.done}, total={self.total}, "
+            f"chunk_size={self.chunk_size})"
+        )
+
+    @property
+    def done(self) -> int:
+        """Number of synchronized results."""
+        return sum(
+            min(self.chunk_size, self.total - index * self.chunk_size)
+            for index in self.responses
+        )
+
+    @property
+    def complete(self) -> bool:
+        """True if all the chunks are synchronized."""
+        return self.total is not None and len(self.responses) == len(
+            range(0, max(self.total, 1), self.chunk_size)
+        )
+
+    def start(self, chunk_size: int, total: int):
+        """Start the synchronization, or check that it can be resumed.
+
+        Raises:
+            ValueError: If the state belongs to a synchronization with a
+                different chunk size or number of results.
+        """
+        if chunk_size < 1:
+            raise ValueError("The chunk size must be at least 1.")
+        if self.total is None:
+            self.chunk_size = chunk_size
+            self.total = total
+        elif (self.chunk_size, self.total) != (chunk_size, total):
+            raise ValueError(
+                f"Cannot resume a synchronization of {self.total} results "
+                f"in chunks of {self.chunk_size} with {total} results in "
+                f"chunks of {chunk_size}."
+            )
+
+    def chunks(
+        self, evaluation: EvaluationTableSyncRequest
+    ) -> Iterator[Tuple[int, EvaluationTableSyncRequest]]:
+        """Yield the index and request of every chunk not synchronized yet.
+
+        Every chunk has the table and the metrics of the evaluation and a
+        slice of its results. An evaluation without results is sent as one
+        chunk.
+        """
+        for index, start in enumerate(
+            range(0, max(self.total, 1), self.chunk_size)
+        ):
+            if index not in self.responses:
+                yield index, evaluation.copy(
+                    update={
+                        "results": evaluation.results[
+                            start : start + self.chunk_size
+                        ]
+                    }
+                )
+
+    def merge(self) -> dict:
+        """Return the synchronization result.
+
+        The table fields are taken from the last response, the results are
+        concatenated in the order of the chunks.
+        """
+        indices = sorted(self.responses)
+        merged = dict(self.responses[indices[-1]])
+        merged["results"] = [
+            result
+            for index in indices
+            for result in self.responses[index]["results"]
+        ]
+        return merged
+
+
+class SyncDelta:
+    """Local record of the synchronized results, for delta synchronization.
+
+    Stores a hash of the content of every synchronized result, keyed by the
+    evaluation table and the result `external_id`, in an SQLite database.
+    When passed to `evaluation_synchronize`, only the results that are new
+    or changed since the last synchronization are sent, together with the
+    table and the metrics. Results without an `external_id` are always
+    sent.
+
+    The hashes are recorded only after the server accepted the results, so
+    a failed synchronization sends the same results again next time. Call
+    `forget` to send all the results of a table again, e.g. after the
+    leaderboard was edited on the website.
+
+    Args:
+        path (str or Path, optional): Path to the state database. Default:
+            `~/.paperswithcode/sync.sqlite`.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None):
+        if path is None:
+            path = Path("~/.paperswithcode/sync.sqlite")
+        self.path = Path(path).expanduser().absolute()
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "evaluation TEXT NOT NULL, "
+            "external_id TEXT NOT NULL, "
+            "hash TEXT NOT NULL, "
+            "PRIMARY KEY (evaluation, external_id))"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the state database."""
+        with self._lock:
+            self._db.close()
+
+    @staticmethod
+    def key(evaluation: EvaluationTableSyncRequest) -> str:
+        """Return the key identifying the evaluation table."""
+        return json.dumps(
+            [evaluation.task, evaluation.dataset, evaluation.external_id or ""]
+        )
+
+    @staticmethod
+    def hash(result: ResultSyncRequest) -> str:
+        """Return the hash of the result content."""
+        content = json.dumps(result.dict(), sort_keys=True, default=str)
+        return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+    def changed(
+        self, evaluation: EvaluationTableSyncRequest
+    ) -> EvaluationTableSyncRequest:
+        """Return the evaluation with only the new and changed results."""
+        with self._lock:
+            hashes = dict(
+                self._db.execute(
+                    "SELECT external_id, hash FROM results "
+                    "WHERE evaluation = ?",
+                    (self.key(evaluation),),
+                )
+            )
+        return evaluation.copy(
+            update={
+                "results": [
+                    result
+                    for result in evaluation.results
+                    if not result.external_id
+                    or hashes.get(result.external_id) != self.hash(result)
+                ]
+            }
+        )
+
+    def commit(self, evaluation: EvaluationTableSyncRequest):
+        """Record the results of the evaluation as synchronized."""
+        key = self.key(evaluation)
+        rows = [
+            (key, result.external_id, self.hash(result))
+            for result in evaluation.results
+            if result.external_id
+        ]
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT OR REPLACE INTO results "
+                "(evaluation, external_id, hash) VALUES (?, ?, ?)",
+                rows,
+            )
+
+    def forget(self, evaluation: EvaluationTableSyncRequest):
+        """Forget the synchronized results of the evaluation table."""
+        with self._lock, self._db:
+            self._db.execute(
+                "DELETE FROM results WHERE evaluation = ?",
+                (self.key(evaluation),),
+            )
+
+
+def _check_unique(evaluations: Iterable[EvaluationTableSyncRequest]):
+    """Check that no evaluation table is synchronized twice in a batch.
+
+    The tables of a batch are synchronized concurrently, two requests for
+    the same table would race on the server and in the delta record.
+
+    Raises:
+        ValueError: If two evaluations have the same `SyncDelta.key`.
+    """
+    keys = set()
+    for evaluation in evaluations:
+        key = SyncDelta.key(evaluation)
+        if key in keys:
+            raise ValueError(
+                f"The evaluation table {key} is synchronized more than once."
+            )
+        keys.add(key)
+
+
+def _check_external_ids(evaluation: EvaluationTableSyncRequest):
+    """Check that every result can be matched by the server.
+
+    A chunk that timed out might have been applied by the server, so it is
+    sent again when it is retried or resumed. Results without an
+    `external_id` would then be created twice.
+
+    Raises:
+        ValueError: If a result has no `external_id`.
+    """
+    for index, result in enumerate(evaluation.results):
+        if not result.external_id:
+            raise ValueError(
+                f"Result {index} has no external_id, the results of a "
+                f"chunked synchronization must all have one."
+            )
+
+
+def _retry_delay(
+    error: errors.HttpClientError, attempt: int
+) -> Optional[float]:
+    """Return the delay before retrying a chunk, or None."""
+    # Timeouts and connection errors have the status code 500. Other client
+    # errors mean the chunk was rejected, sending it again will not help.
+    if error.status_code not in _RETRY_STATUS_CODES:
+        return None
+    # Full jitter, so that the clients don't retry in lockstep.
+    return random.uniform(0, min(60, 2 ** attempt))
+
+
+def synchronize_chunked(
+    post: Callable[[EvaluationTableSyncRequest], dict],
+    evaluation: EvaluationTableSyncRequest,
+    chunk_size: int,
+    retries: int = 3,
+    progress: Optional[Callable[[int, int], None]] = None,
+    state: Optional[SyncState] = None,
+) -> dict:
+    """Synchronize an evaluation table in chunks of results.
+
+    Chunks are sent one after the other. A chunk that fails with a timeout,
+    a connection error, a 429 or a 5xx response is retried up to `retries`
+    times, waiting an exponentially growing, randomly jittered time between
+    the attempts. Other errors are raised immediately. A chunk that timed
+    out might have been applied, so every result must have an
+    `external_id`, which the server uses to update the results sent twice
+    instead of creating them again.
+
+    Args:
+        post (callable): Function posting one chunk and returning the
+            deserialized response.
+        evaluation (EvaluationTableSyncRequest): Evaluation table to
+            synchronize.
+        chunk_size (int): Maximal number of results per chunk.
+        retries (int): Maximal number of retries of a chunk. Default: 3.
+        progress (callable, optional): Called with the number of synchronized
+            results and the total number of results after every chunk.
+        state (SyncState, optional): State of a previous failed
+            synchronization to resume.
+
+    Returns:
+        dict: Merged responses of all the chunks.
+
+    Raises:
+        ValueError: If a result has no `external_id`, or if the state
+            belongs to another synchronization.
+    """
+    _check_external_ids(evaluation)
+    state = state or SyncState()
+    state.start(chunk_size, len(evaluation.results))
+    for index, chunk in state.chunks(evaluation):
+        attempt = 0
+        while True:
+            try:
+                state.responses[index] = post(chunk)
+                break
+            except errors.HttpClientError as e:
+                delay = (
+                    None if attempt >= retries else _retry_delay(e, attempt)
+                )
+                if delay is None:
+                    raise
+            time.sleep(delay)
+            attempt += 1
+        if progress is not None:
+            progress(state.done, state.total)
+    return state.merge()
+
+
+async def asynchronize_chunked(
+    post: Callable[[EvaluationTableSyncRequest], Awaitable[dict]],
+    evaluation: EvaluationTableSyncRequest,
+    chunk_size: int,
+    retries: int = 3,
+    progress: Optional[Callable[[int, int], None]] = None,
+    state: Optional[SyncState] = None,
+) -> dict:
+    """Synchronize an evaluation table in chunks of results.
+
+    Asynchronous counterpart of `synchronize_chunked` for the
+    `AsyncPapersWithCodeClient`.
+
+    Args:
+        post (callable): Coroutine function posting one chunk and returning
+            the deserialized response.
+        evaluation (EvaluationTableSyncRequest): Evaluation table to
+            synchronize.
+        chunk_size (int): Maximal number of results per chunk.
+        retries (int): Maximal number of retries of a chunk. Default: 3.
+        progress (callable, optional): Called with the number of synchronized
+            results and the total number of results after every chunk.
+        state (SyncState, optional): State of a previous failed
+            synchronization to resume.
+
+    Returns:
+        dict: Merged responses of all the chunks.
+
+    Raises:
+        ValueError: If a result has no `external_id`, or if the state
+            belongs to another synchronization.
+    """
+    _check_external_ids(evaluation)
+    state = state or SyncState()
+    state.start(chunk_size, len(evaluation.results))
+    for index, chunk in state.chunks(evaluation):
+        attempt = 0
+        while True:
+            try:
+                state.responses[index] = await post(chunk)
+                break
+            except errors.HttpClientError as e:
+                delay = (
+                    None if attempt >= retries else _retry_delay(e, attempt)
+                )
+                if delay is None:
+                    raise
+            await asyncio.sleep(delay)
+            attempt += 1
+        if progress is not None:
+            progress(state.done, state.total)
+    return state.merge()
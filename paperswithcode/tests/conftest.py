@@ -0,0 +1,329 @@
+import gzip
+import hashlib
+import json
+import math
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from paperswithcode import PapersWithCodeClient
+from paperswithcode.models import (
+    EvaluationTableSyncRequest,
+    MetricSyncRequest,
+    ResultSyncRequest,
+)
+
+API_PREFIX = "/api/v1"
+
+# Called with the method, the path without the API prefix, the query
+# parameters and the request body. Returns None to let the fake API answer,
+# or the status code and the raw body of the response, optionally followed
+# by a dictionary of response headers.
+Hook = Callable[[str, str, Dict[str, str], bytes], Optional[tuple]]
+
+
+def result(evaluation_id: str, index: int) -> dict:
+    return {
+        "id": f"{evaluation_id}-r{index}",
+        "best_rank": None,
+        "metrics": {"Accuracy": f"{90 - index}%", "Error": str(10 + index)},
+        "methodology": f"Model {index}",
+        "uses_additional_data": False,
+        "paper": f"p{index}",
+        "best_metric": None,
+        "evaluated_on": "2020-01-01",
+        "external_source_url": None,
+    }
+
+
+def evaluation(results=10, dataset="d0"):
+    return EvaluationTableSyncRequest(
+        task="t0",
+        dataset=dataset,
+        metrics=[MetricSyncRequest(name="Accuracy", is_loss=False)],
+        results=[
+            ResultSyncRequest(
+                metrics={"Accuracy": str(50 + i)},
+                methodology=f"Model {i}",
+                paper=None,
+                external_id=f"x{i}",
+                evaluated_on="2020-01-01",
+            )
+            for i in range(results)
+        ],
+    )
+
+
+def catalog() -> Dict[str, List[dict]]:
+    """Return the objects of every list endpoint of the fake API."""
+    items = {
+        "/papers/": [
+            {
+                "id": f"p{i}",
+                "arxiv_id": f"2001.{i:05}",
+                "nips_id": None,
+                "url_abs": f"https://arxiv.org/abs/2001.{i:05}",
+                "url_pdf": f"https://arxiv.org/pdf/2001.{i:05}",
+                "title": f"Paper {i} about "
+                + ("transformers" if i % 3 == 0 else "convolutions"),
+                "abstract": f"Abstract {i}",
+                "authors": ["Author"],
+                "published": "2020-01-01",
+                "conference": None,
+                "conference_url_abs": None,
+                "conference_url_pdf": None,
+                "proceeding": None,
+            }
+            for i in range(23)
+        ],
+        "/repositories/": [
+            {
+                "url": f"https://github.com/owner/r{i}",
+                "owner": "owner",
+                "name": f"r{i}",
+                "description": "",
+                "stars": i,
+                "framework": "pytorch",
+            }
+            for i in range(7)
+        ],
+        "/authors/": [
+            {"id": f"a{i}", "full_name": f"Author {i}"} for i in range(5)
+        ],
+        "/conferences/": [
+            {"id": f"c{i}", "name": f"Conference {i}"} for i in range(3)
+        ],
+        "/areas/": [{"id": f"ar{i}", "name": f"Area {i}"} for i in range(2)],
+        "/tasks/": [
+            {"id": f"t{i}", "name": f"Task {i}", "description": ""}
+            for i in range(6)
+        ],
+        "/datasets/": [
+            {"id": f"d{i}", "name": f"D{i}", "full_name": None, "url": None}
+            for i in range(4)
+        ],
+        "/methods/": [
+            {
+                "id": f"m{i}",
+                "name": f"M{i}",
+                "full_name": f"Method {i}",
+                "description": "",
+                "paper": f"p{i}",
+            }
+            for i in range(3)
+        ],
+        # Parent ids with a LIKE wildcard, their nested lists must not be
+        # mistaken for each other.
+        "/evaluations/": [
+            {
+                "id": evaluation_id,
+                "task": "t0",
+                "dataset": "d0",
+                "description": "",
+                "mirror_url": None,
+            }
+            for evaluation_id in ("e_1", "ex1", "e2", "e3")
+        ],
+    }
+    for i, conference in enumerate(items["/conferences/"]):
+        items[f"/conferences/{conference['id']}/proceedings/"] = [
+            {"id": f"{conference['id']}-{year}", "year": year, "month": 6}
+            for year in range(2018, 2018 + i)
+        ]
+    for i, area in enumerate(items["/areas/"]):
+        items[f"/areas/{area['id']}/tasks/"] = items["/tasks/"][i::2]
+    for i, evaluation in enumerate(items["/evaluations/"]):
+        evaluation_id = evaluation["id"]
+        items[f"/evaluations/{evaluation_id}/metrics/"] = [
+            {
+                "id": f"{evaluation_id}-accuracy",
+                "name": "Accuracy",
+                "description": "",
+                "is_loss": False,
+            },
+            {
+                "id": f"{evaluation_id}-error",
+                "name": "Error",
+                "description": "",
+                "is_loss": True,
+            },
+        ]
+        items[f"/evaluations/{evaluation_id}/results/"] = [
+            result(evaluation_id, j) for j in range(3 * i)
+        ]
+    return items
+
+
+class FakeApi:
+    """PapersWithCode API answering from an in-memory catalog.
+
+    List endpoints are paginated like the server. Single objects are looked
+    up in the lists by id. The synchronization endpoint echoes the posted
+    table with ids added.
+
+    Attributes:
+        url (str): Server url to pass to the client.
+        catalog (dict): Objects of every list endpoint, keyed by the path.
+        requests (list): `(method, path, params, headers)` of every request,
+            with lowercase header names.
+        posts (list): Decoded bodies of the synchronization requests.
+        hooks (list): Functions called before answering a request, see
+            `Hook`.
+        max_items_per_page (int, optional): Maximal number of items per
+            page, larger page sizes are capped like the server does.
+        reject_gzip (int, optional): Status code of the response to the
+            gzip compressed requests. Default: None, they are accepted.
+        etags (bool): If True, the GET responses have an ETag header and are
+            answered with 304 Not Modified when the ETag matches.
+            Default: False.
+    """
+
+    def __init__(self):
+        self.catalog = catalog()
+        self.requests: List[Tuple[str, str, Dict[str, str], dict]] = []
+        self.posts: List[dict] = []
+        self.hooks: List[Hook] = []
+        self.max_items_per_page: Optional[int] = None
+        self.reject_gzip: Optional[int] = None
+        self.etags = False
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self._server.daemon_threads = True
+        self._server.api = self
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        # A short poll interval makes the shutdown fast.
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, args=(0.01,), daemon=True
+        )
+        self._thread.start()
+
+    def close(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def paths(self, method: str = "GET") -> List[str]:
+        """Return the paths of the requests made with the method."""
+        return [path for m, path, _, _ in self.requests if m == method]
+
+    def answer(
+        self, method: str, path: str, params: Dict[str, str], body: bytes
+    ) -> tuple:
+        for hook in list(self.hooks):
+            response = hook(method, path, params, body)
+            if response is not None:
+                return response
+        if method == "POST" and path == "/rpc/evaluation-synchronize/":
+            return self._synchronize(body)
+        if method != "GET":
+            return _json(405, {"detail": "Method not allowed."})
+        if path in self.catalog:
+            return _json(200, self._page(path, params))
+        parent, _, object_id = path.rstrip("/").rpartition("/")
+        for item in self.catalog.get(f"{parent}/", []):
+            if item.get("id") == object_id:
+                return _json(200, item)
+        return _json(404, {"detail": "Not found."})
+
+    def _page(self, path: str, params: Dict[str, str]) -> dict:
+        items = self.catalog[path]
+        page = int(params.get("page", 1))
+        items_per_page = min(
+            int(params.get("items_per_page", 50)),
+            self.max_items_per_page or math.inf,
+        )
+        url = f"{self.url}{API_PREFIX}{path}"
+        return {
+            "count": len(items),
+            "next": (
+                f"{url}?page={page + 1}&items_per_page={items_per_page}"
+                if page * items_per_page < len(items)
+                else None
+            ),
+            "previous": f"{url}?page={page - 1}" if page > 1 else None,
+            "results": items[(page - 1) * items_per_page :][:items_per_page],
+        }
+
+    def _synchronize(self, body: bytes) -> Tuple[int, bytes]:
+        evaluation = json.loads(body)
+        with self._lock:
+            self.posts.append(evaluation)
+        response = dict(evaluation, id="table")
+        response["results"] = [
+            dict(result, id=f"result-{result['external_id']}")
+            for result in evaluation["results"]
+        ]
+        return _json(200, response)
+
+
+def _json(status: int, data) -> Tuple[int, bytes]:
+    return status, json.dumps(data).encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # The headers and the body are written separately, don't wait for the
+    # acknowledgement of the headers.
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def _handle(self):
+        api: FakeApi = self.server.api
+        url = urlparse(self.path)
+        path = url.path[len(API_PREFIX) :]
+        params = {
+            key: values[0] for key, values in parse_qs(url.query).items()
+        }
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with api._lock:
+            api.requests.append(
+                (
+                    self.command,
+                    path,
+                    params,
+                    {
+                        key.lower(): value
+                        for key, value in self.headers.items()
+                    },
+                )
+            )
+        if self.headers.get("Content-Encoding") != "gzip":
+            answer = api.answer(self.command, path, params, body)
+        elif api.reject_gzip is not None:
+            answer = _json(api.reject_gzip, {"detail": "Rejected."})
+        else:
+            answer = api.answer(
+                self.command, path, params, gzip.decompress(body)
+            )
+        status, data, *headers = answer
+        headers = dict(headers[0]) if headers else {}
+        if api.etags and self.command == "GET" and status == 200:
+            headers["ETag"] = f'"{hashlib.sha1(data).hexdigest()}"'
+            if self.headers.get("If-None-Match") == headers["ETag"]:
+                status, data = 304, b""
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _handle
+
+
+@pytest.fixture
+def api():
+    api = FakeApi()
+    yield api
+    api.close()
+
+
+@pytest.fixture
+def client(api):
+    with PapersWithCodeClient(url=api.url) as client:
+        yield client
@@ -0,0 +1,91 @@
+import asyncio
+import inspect
+
+import pytest
+from tea_client import errors
+
+from paperswithcode import PapersWithCodeClient
+from paperswithcode.async_client import AsyncPapersWithCodeClient
+from paperswithcode.tests.conftest import API_PREFIX
+
+
+def public_methods(cls):
+    return {
+        name: getattr(cls, name)
+        for name in dir(cls)
+        if not name.startswith("_") and callable(getattr(cls, name))
+    }
+
+
+def run(api, name, *args, **kwargs):
+    """Call an async client method and return its result."""
+
+    async def main():
+        async with AsyncPapersWithCodeClient(url=api.url) as client:
+            return await getattr(client, name)(*args, **kwargs)
+
+    return asyncio.run(main())
+
+
+def test_same_methods_as_the_client():
+    methods = public_methods(PapersWithCodeClient)
+    methods["aclose"] = methods.pop("close")
+    async_methods = public_methods(AsyncPapersWithCodeClient)
+    assert methods.keys() == async_methods.keys()
+    for name, method in methods.items():
+        assert inspect.iscoroutinefunction(async_methods[name]), name
+        assert inspect.signature(async_methods[name]) == inspect.signature(
+            method
+        ), name
+
+
+@pytest.mark.parametrize(
+    "name, args, kwargs",
+    [
+        ("paper_get", ("p1",), {}),
+        ("paper_list", (), {"page": 2, "items_per_page": 5}),
+        ("proceeding_list", ("c2",), {}),
+        ("area_task_list", ("ar1",), {}),
+        ("evaluation_get", ("e2",), {}),
+        ("evaluation_metric_list", ("e2",), {}),
+        ("evaluation_result_list", ("e3",), {"items_per_page": 2}),
+    ],
+)
+def test_same_results_as_the_client(api, client, name, args, kwargs):
+    expected = getattr(client, name)(*args, **kwargs)
+    assert run(api, name, *args, **kwargs) == expected
+
+
+def test_same_errors_as_the_client(api, client):
+    with pytest.raises(errors.HttpClientError) as expected:
+        client.paper_get("missing")
+    with pytest.raises(errors.HttpClientError) as error:
+        run(api, "paper_get", "missing")
+    assert error.type is expected.type
+    assert error.value.status_code == expected.value.status_code == 404
+
+
+def test_response_per_task(api):
+    # Both requests complete before either task reads its response.
+    async def main():
+        async with AsyncPapersWithCodeClient(url=api.url) as client:
+            finished = []
+            both = asyncio.Event()
+
+            async def fetch(paper_id):
+                await client.paper_get(paper_id)
+                finished.append(paper_id)
+                if len(finished) == 2:
+                    both.set()
+                await both.wait()
+                return client.http.response.url.path
+
+            paths = await asyncio.gather(fetch("p1"), fetch("p2"))
+            # The responses of the tasks are not seen by their parent.
+            assert client.http.response is None
+            await client.paper_get("p3")
+            return paths + [client.http.response.url.path]
+
+    assert asyncio.run(main()) == [
+        f"{API_PREFIX}/papers/{paper_id}/" for paper_id in ("p1", "p2", "p3")
+    ]
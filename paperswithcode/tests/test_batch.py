@@ -0,0 +1,90 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from paperswithcode.async_client import AsyncPapersWithCodeClient
+from paperswithcode.batch import aget_many, get_many
+from paperswithcode.errors import PapersWithCodeError
+
+
+def test_get_many(api, client):
+    batch = client.paper_get_many(["p1", "p2", "p1", "missing", "p3", "p2"])
+    # Duplicate IDs are fetched once.
+    assert sorted(api.paths()) == [
+        "/papers/missing/",
+        "/papers/p1/",
+        "/papers/p2/",
+        "/papers/p3/",
+    ]
+    assert not batch.ok
+    assert len(batch) == 4
+    assert {key: paper.id for key, paper in batch.results.items()} == {
+        "p1": "p1",
+        "p2": "p2",
+        "p3": "p3",
+    }
+    assert list(batch.errors) == ["missing"]
+    assert batch.errors["missing"].status_code == 404
+    assert "missing" in batch
+    with pytest.raises(PapersWithCodeError):
+        batch["missing"]
+
+
+def test_workers():
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def getter(object_id):
+        with lock:
+            running.append(object_id)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(object_id)
+        return object_id
+
+    batch = get_many(getter, range(20), workers=3)
+    assert batch.ok
+    assert batch.results == {i: i for i in range(20)}
+    assert max(peak) == 3
+
+
+def test_unexpected_errors_are_raised():
+    def getter(object_id):
+        raise ValueError(object_id)
+
+    with pytest.raises(ValueError):
+        get_many(getter, ["a"])
+
+
+def test_async_get_many(api):
+    async def main():
+        async with AsyncPapersWithCodeClient(url=api.url) as client:
+            return await client.paper_get_many(["p1", "missing", "p1"])
+
+    batch = asyncio.run(main())
+    assert sorted(api.paths()) == ["/papers/missing/", "/papers/p1/"]
+    assert batch.results["p1"].id == "p1"
+    assert batch.errors["missing"].status_code == 404
+
+
+def test_async_workers():
+    running = []
+    peak = []
+
+    async def getter(object_id):
+        running.append(object_id)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(object_id)
+        if object_id == 3:
+            raise PapersWithCodeError("Failed.", status_code=503)
+        return object_id
+
+    batch = asyncio.run(aget_many(getter, [1, 2, 3, 1, 4, 5], workers=2))
+    assert max(peak) == 2
+    assert batch.results == {1: 1, 2: 2, 4: 4, 5: 5}
+    assert batch.errors[3].status_code == 503
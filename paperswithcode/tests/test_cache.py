@@ -0,0 +1,243 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from paperswithcode import PapersWithCodeClient, cache as cache_module
+from paperswithcode.async_client import AsyncPapersWithCodeClient
+from paperswithcode.cache import DiskCache, MemoryCache
+from paperswithcode.errors import PapersWithCodeError
+from paperswithcode.models import TaskUpdateRequest
+from paperswithcode.tests.conftest import evaluation
+
+
+def response(url, size):
+    return httpx.Response(
+        200,
+        content=b"x" * size,
+        headers={"ETag": '"1"'},
+        request=httpx.Request("GET", url),
+    )
+
+
+@pytest.fixture
+def make_cache(tmp_path):
+    """Return a function creating caches, closed after the test."""
+    caches = []
+
+    def make_cache(**kwargs):
+        caches.append(DiskCache(tmp_path / "cache.sqlite", **kwargs))
+        return caches[-1]
+
+    yield make_cache
+    for cache in caches:
+        cache.close()
+
+
+@pytest.fixture
+def cache(make_cache):
+    return make_cache()
+
+
+def etags(api):
+    return [headers.get("if-none-match") for _, _, _, headers in api.requests]
+
+
+def test_responses_are_revalidated(api, cache):
+    api.etags = True
+    with PapersWithCodeClient(url=api.url, cache=cache) as client:
+        task = client.task_get("t0")
+        assert client.task_get("t0") == task
+        assert client.http.response.status_code == 304
+        api.catalog["/tasks/"][0]["name"] = "Changed"
+        assert client.task_get("t0").name == "Changed"
+        assert client.http.response.status_code == 200
+        assert client.task_get("t0").name == "Changed"
+    first, second, third, fourth = etags(api)
+    assert first is None
+    assert second == third is not None
+    assert fourth not in (None, second)
+
+
+def test_responses_without_validators_are_not_stored(api, cache):
+    with PapersWithCodeClient(url=api.url, cache=cache) as client:
+        client.task_get("t0")
+        client.task_get("t0")
+    assert cache.size == 0
+    assert etags(api) == [None, None]
+
+
+def test_fresh_responses_are_not_revalidated(api, make_cache):
+    cache = make_cache(max_age=60)
+    with PapersWithCodeClient(url=api.url, cache=cache) as client:
+        task = client.task_get("t0")
+        assert client.task_get("t0") == task
+    assert api.paths() == ["/tasks/t0/"]
+
+
+def test_writes_remove_the_fresh_responses(api, make_cache):
+    cache = make_cache(max_age=60)
+    other = response("https://other.example/api/v1/tasks/", 10)
+    cache.store("other", other)
+    with PapersWithCodeClient(url=api.url, cache=cache) as client:
+        client.task_get("t0")
+        client.evaluation_synchronize(evaluation(1))
+        client.task_get("t0")
+        # Failed writes might have been applied.
+        with pytest.raises(PapersWithCodeError):
+            client.task_delete("t0")
+        client.task_get("t0")
+        client.task_get("t0")
+    # The responses of other servers are kept.
+    assert cache.get("other").body == other.content
+    assert api.paths() == ["/tasks/t0/"] * 3
+
+
+def test_least_recently_used_responses_are_evicted(make_cache):
+    cache = make_cache(max_size=250)
+    for key in ("a", "b"):
+        cache.store(key, response(f"https://example.com/{key}/", 100))
+    cache.get("a")
+    cache.store("c", response("https://example.com/c/", 100))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.size == 200
+    # Larger than the whole cache.
+    cache.store("d", response("https://example.com/d/", 251))
+    assert cache.get("d") is None
+    assert cache.size == 200
+
+
+def test_keys():
+    url = "https://paperswithcode.com/api/v1/papers/"
+    assert DiskCache.key(url, {"q": "bert", "page": "2"}) == DiskCache.key(
+        url, {"page": "2", "q": "bert"}
+    )
+    assert DiskCache.key(url, {"page": "2"}) != DiskCache.key(url)
+    assert DiskCache.key(url, None, "Token a") != DiskCache.key(
+        url, None, "Token b"
+    )
+    assert DiskCache.key(url, None, "Token a") != DiskCache.key(url)
+
+
+def test_responses_are_not_shared_between_tokens(api, make_cache):
+    cache = make_cache(max_age=60)
+    for token in ("a", "b", "a", "", "b", ""):
+        with PapersWithCodeClient(
+            token=token, url=api.url, cache=cache
+        ) as client:
+            client.task_get("t0")
+    assert [
+        headers.get("authorization") for _, _, _, headers in api.requests
+    ] == ["Token a", "Token b", None]
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the monotonic clock of the memory cache."""
+    now = [0.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def writable_tasks(api):
+    """Apply the task updates and deletions to the catalog."""
+    tasks = api.catalog["/tasks/"]
+
+    def hook(method, path, params, body):
+        if method not in ("PATCH", "DELETE") or not path.startswith("/tasks/"):
+            return None
+        index = next(
+            i
+            for i, task in enumerate(tasks)
+            if path == f"/tasks/{task['id']}/"
+        )
+        if method == "PATCH":
+            tasks[index].update(
+                {k: v for k, v in json.loads(body).items() if v is not None}
+            )
+            return 200, json.dumps(tasks[index]).encode()
+        del tasks[index]
+        return 204, b""
+
+    api.hooks.append(hook)
+
+
+def test_memory_cache_entries_expire(clock):
+    cache = MemoryCache(ttl=10, resource_ttl={"paper": 100})
+    cache.set("task", ("t0",), "task")
+    cache.set("paper", ("p0",), "paper")
+    clock[0] = 9.9
+    assert cache.get("task", ("t0",)) == (True, "task")
+    clock[0] = 10
+    assert cache.get("task", ("t0",)) == (False, None)
+    assert cache.get("paper", ("p0",)) == (True, "paper")
+    assert len(cache) == 1
+
+
+def test_memory_cache_evicts_least_recently_used_entries():
+    cache = MemoryCache(max_entries=2)
+    cache.set("task", "a", 1)
+    cache.set("task", "b", 2)
+    cache.get("task", "a")
+    cache.set("task", "c", 3)
+    assert len(cache) == 2
+    assert cache.get("task", "b") == (False, None)
+    assert cache.get("task", "a") == (True, 1)
+    assert cache.get("task", "c") == (True, 3)
+
+
+def test_memory_cache_invalidation():
+    cache = MemoryCache()
+    for key in ("a", "b"):
+        cache.set("task", key, key)
+        cache.set("paper", key, key)
+    cache.invalidate("task", "a")
+    assert cache.get("task", "a") == (False, None)
+    assert cache.get("task", "b") == (True, "b")
+    cache.invalidate("paper")
+    assert len(cache) == 1
+
+
+def test_memoized_getters(api, clock):
+    writable_tasks(api)
+    with PapersWithCodeClient(
+        url=api.url, memory_cache=MemoryCache(ttl=60)
+    ) as client:
+        task = client.task_get("t0")
+        assert client.task_get("t0") is task
+        assert client.task_get(task_id="t0") is task
+        client.task_get("t1")
+        assert api.paths() == ["/tasks/t0/", "/tasks/t1/"]
+
+        clock[0] = 60
+        assert client.task_get("t0") == task
+        assert api.paths().count("/tasks/t0/") == 2
+
+        # The updated and deleted objects are fetched again.
+        client.task_update("t0", TaskUpdateRequest(name="Changed"))
+        assert client.task_get("t0").name == "Changed"
+        client.task_delete("t1")
+        with pytest.raises(PapersWithCodeError) as error:
+            client.task_get("t1")
+        assert error.value.status_code == 404
+    assert api.paths().count("/tasks/t0/") == 3
+    assert api.paths().count("/tasks/t1/") == 2
+
+
+def test_async_memoized_getters(api):
+    writable_tasks(api)
+
+    async def main():
+        async with AsyncPapersWithCodeClient(
+            url=api.url, memory_cache=MemoryCache()
+        ) as client:
+            task = await client.task_get("t0")
+            assert await client.task_get("t0") is task
+            await client.task_update("t0", TaskUpdateRequest(name="Changed"))
+            assert (await client.task_get("t0")).name == "Changed"
+
+    asyncio.run(main())
+    assert api.paths() == ["/tasks/t0/"] * 2
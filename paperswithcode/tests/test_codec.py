@@ -0,0 +1,77 @@
+import math
+
+import pytest
+
+from paperswithcode import PapersWithCodeClient
+from paperswithcode.codec import JsonCodec, OrjsonCodec
+from paperswithcode.errors import PapersWithCodeError
+from paperswithcode.models import (
+    EvaluationTableSyncRequest,
+    MetricSyncRequest,
+    ResultSyncRequest,
+)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+requires_orjson = pytest.mark.skipif(orjson is None, reason="requires orjson")
+
+CODECS = [JsonCodec, pytest.param(OrjsonCodec, marks=requires_orjson)]
+
+
+@pytest.mark.parametrize("codec", CODECS)
+def test_codec_round_trip(codec):
+    obj = {"text": "ünïcode", "items": [1, 2.5, None, True], "nested": {}}
+    assert codec().loads(codec().dumps(obj)) == obj
+    assert math.isnan(codec().loads(b'{"value": NaN}')["value"])
+
+
+@requires_orjson
+def test_codecs_parse_the_same_data():
+    documents = [
+        b'{"a": [1, -2, 3.5, 1e300, "\\u00fc", null, false], "b": {}}',
+        b'{"value": Infinity}',
+        b'{"text": "\\ud800"}',
+        str(2 ** 63 - 1).encode(),
+    ]
+    for document in documents:
+        assert repr(OrjsonCodec().loads(document)) == repr(
+            JsonCodec().loads(document)
+        )
+
+
+@requires_orjson
+def test_orjson_parses_wide_integers_as_floats():
+    # The documented difference between the codecs.
+    assert JsonCodec().loads(str(2 ** 64).encode()) == 2 ** 64
+    assert isinstance(OrjsonCodec().loads(str(2 ** 64).encode()), float)
+    # Wide integers are serialized exactly.
+    assert OrjsonCodec().dumps([2 ** 64]) == JsonCodec().dumps([2 ** 64])
+
+
+@pytest.mark.parametrize("codec", CODECS)
+@pytest.mark.parametrize("value", [float("nan"), float("inf")])
+def test_non_finite_floats_are_rejected(api, codec, value):
+    with pytest.raises(ValueError):
+        codec().dumps({"results": [{"metrics": {"Accuracy": value}}]})
+
+    table = EvaluationTableSyncRequest(
+        task="t0",
+        dataset="d0",
+        metrics=[MetricSyncRequest(name="Accuracy", is_loss=False)],
+        results=[
+            ResultSyncRequest(
+                metrics={"Accuracy": value},
+                methodology="Model",
+                paper=None,
+                evaluated_on="2020-01-01",
+            )
+        ],
+    )
+    with PapersWithCodeClient(url=api.url, codec=codec()) as client:
+        with pytest.raises(PapersWithCodeError) as error:
+            client.evaluation_synchronize(table)
+    assert error.value.status_code == 400
+    assert api.posts == []
@@ -0,0 +1,103 @@
+import copy
+
+import pytest
+from pydantic import ValidationError
+
+from paperswithcode.construct import construct
+from paperswithcode.models import (
+    EvaluationTableSyncResponse,
+    Paper,
+    PaperRepos,
+    Papers,
+    Proceedings,
+    Repositories,
+    Results,
+)
+from paperswithcode.tests.conftest import catalog
+
+ITEMS = catalog()
+
+
+def page(items, **fields):
+    return dict(
+        {"count": len(items), "next_page": None, "previous_page": None},
+        results=items,
+        **fields,
+    )
+
+
+def paper(**fields):
+    return dict(ITEMS["/papers/"][0], **fields)
+
+
+PAYLOADS = [
+    (Papers, page(ITEMS["/papers/"], next_page=2)),
+    # Optional fields missing, set to None and set to a value.
+    (Paper, {k: v for k, v in paper().items() if k != "conference"}),
+    (Paper, paper(conference="c0", proceeding="c0-2019")),
+    # Values of the wrong type, validated and coerced.
+    (Paper, paper(published="2020-2-3", authors=("A", 1))),
+    (Paper, paper(published=1577836800, arxiv_id=2001)),
+    (Proceedings, page(ITEMS["/conferences/c2/proceedings/"])),
+    (Proceedings, page([{"id": "p", "year": "2020", "month": None}])),
+    (Repositories, page([dict(ITEMS["/repositories/"][0], stars="5")])),
+    (Results, page(ITEMS["/evaluations/e3/results/"], previous_page="1")),
+    (
+        PaperRepos,
+        page(
+            [
+                {
+                    "paper": paper(),
+                    "repository": ITEMS["/repositories/"][1],
+                    "is_official": True,
+                },
+                {
+                    "paper": paper(id="p1"),
+                    "repository": None,
+                    "is_official": 0,
+                },
+            ]
+        ),
+    ),
+    (
+        EvaluationTableSyncResponse,
+        {
+            "id": "table",
+            "task": "t0",
+            "dataset": "d0",
+            "metrics": [{"name": "Accuracy", "is_loss": False}],
+            "results": [
+                dict(result, external_id=f"x{i}")
+                for i, result in enumerate(ITEMS["/evaluations/e2/results/"])
+            ],
+        },
+    ),
+]
+
+
+@pytest.mark.parametrize("model, data", PAYLOADS)
+def test_same_as_validated(model, data):
+    expected = model(**copy.deepcopy(data))
+    trusted = construct(model, copy.deepcopy(data))
+    assert trusted == expected
+    # The types of the values, e.g. the dates, and the nested models.
+    assert repr(trusted) == repr(expected)
+    assert trusted.dict(exclude_unset=True) == expected.dict(
+        exclude_unset=True
+    )
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {k: v for k, v in paper().items() if k != "title"},
+        paper(published="2020-13-01"),
+        paper(authors=None),
+    ],
+)
+def test_invalid_data(data):
+    with pytest.raises(ValidationError) as expected:
+        Paper(**copy.deepcopy(data))
+    with pytest.raises(ValidationError) as error:
+        construct(Paper, copy.deepcopy(data))
+    assert error.value.errors() == expected.value.errors()
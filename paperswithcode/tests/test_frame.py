@@ -0,0 +1,76 @@
+import math
+
+import pytest
+
+from paperswithcode.frame import ResultFrame, parse_dates, parse_metric_values
+from paperswithcode.tests.conftest import result
+from paperswithcode.tests.test_validation import METRIC_VALUES
+
+numpy = pytest.importorskip("numpy")
+
+
+def test_parse_metric_values():
+    values, expected = zip(*METRIC_VALUES)
+    numpy.testing.assert_array_equal(
+        parse_metric_values(list(values) * 2), list(expected) * 2
+    )
+
+
+def test_values_of_different_types_are_parsed_separately():
+    numpy.testing.assert_array_equal(
+        parse_metric_values([True, 1, 1.0, 1, True]),
+        [math.nan, 1, 1, 1, math.nan],
+    )
+    numpy.testing.assert_array_equal(
+        parse_metric_values([1, True]), [1, math.nan]
+    )
+    numpy.testing.assert_array_equal(
+        parse_metric_values([[1], "2", [1], {"a": 1}]),
+        [math.nan, 2, math.nan, math.nan],
+    )
+
+
+def test_parse_dates():
+    dates = parse_dates(["2020-01-31", None, "2020-02-30", "tomorrow"] * 2)
+    assert dates.dtype == numpy.dtype("datetime64[D]")
+    assert str(dates[0]) == "2020-01-31"
+    assert numpy.isnat(dates[1:4]).all()
+
+
+def test_result_frame(client):
+    frame = client.evaluation_result_frame("e3", items_per_page=4)
+    assert len(frame) == 9
+    assert list(frame.id) == [f"e3-r{i}" for i in range(9)]
+    assert list(frame.metrics) == ["Accuracy", "Error"]
+    numpy.testing.assert_array_equal(
+        frame.metrics["Accuracy"], numpy.arange(90, 81, -1)
+    )
+    assert numpy.isnan(frame.best_rank).all()
+    assert (frame.evaluated_on == numpy.datetime64("2020-01-01")).all()
+
+
+def test_result_frame_with_missing_metrics():
+    results = [result("e", i) for i in range(3)]
+    results[1]["metrics"] = {"Top 5": "99"}
+    results[2]["metrics"] = None
+    frame = ResultFrame.from_results(results)
+    numpy.testing.assert_array_equal(
+        frame.metrics["Accuracy"], [90, math.nan, math.nan]
+    )
+    numpy.testing.assert_array_equal(
+        frame.metrics["Top 5"], [math.nan, 99, math.nan]
+    )
+    assert len(ResultFrame.from_results([])) == 0
+
+
+def test_to_pandas():
+    pytest.importorskip("pandas")
+    results = [result("e", i) for i in range(3)]
+    results[0]["metrics"]["id"] = "1"
+    df = ResultFrame.from_results(results).to_pandas()
+    assert list(df.columns) == list(ResultFrame.FIELDS) + [
+        "Accuracy",
+        "Error",
+        "metrics.id",
+    ]
+    assert len(df) == 3
@@ -0,0 +1,186 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from paperswithcode import PapersWithCodeClient
+from paperswithcode.async_client import AsyncPapersWithCodeClient
+from paperswithcode.errors import PapersWithCodeError
+from paperswithcode.tests.conftest import evaluation
+
+
+def encodings(api):
+    return [
+        headers.get("content-encoding")
+        for method, _, _, headers in api.requests
+        if method == "POST"
+    ]
+
+
+@pytest.fixture
+def compressing(api):
+    with PapersWithCodeClient(url=api.url, compress_threshold=1000) as client:
+        yield client
+
+
+def test_large_bodies_are_compressed(api, compressing):
+    compressing.evaluation_synchronize(evaluation(2))
+    compressing.evaluation_synchronize(evaluation(100))
+    assert encodings(api) == [None, "gzip"]
+    assert len(api.posts[1]["results"]) == 100
+
+
+@pytest.mark.parametrize("status", [400, 415])
+def test_rejected_compression_falls_back(api, compressing, status):
+    api.reject_gzip = status
+    response = compressing.evaluation_synchronize(evaluation(100))
+    assert len(response.results) == 100
+    assert not compressing.http.compression_accepted
+    # The next requests are not compressed.
+    compressing.evaluation_synchronize(evaluation(100))
+    assert encodings(api) == ["gzip", None, None]
+
+
+def test_invalid_bodies_keep_the_compression(api, compressing):
+    api.reject_gzip = 400
+    api.hooks.append(lambda *args: (400, b'{"detail": "Invalid."}'))
+    with pytest.raises(PapersWithCodeError) as error:
+        compressing.evaluation_synchronize(evaluation(100))
+    assert error.value.status_code == 400
+    assert compressing.http.compression_accepted
+    assert encodings(api) == ["gzip", None]
+
+
+def hold(api, path, status=None):
+    """Hold the requests for the path until the returned event is set."""
+    release = threading.Event()
+
+    def hook(method, request_path, params, body):
+        if request_path == path:
+            release.wait(5)
+            if status is not None:
+                return status, b'{"detail": "Failed."}'
+
+    api.hooks.append(hook)
+    return release
+
+
+def concurrently(release, *functions):
+    """Call the functions in threads while the requests are held.
+
+    Returns the results, or the raised errors, in the order of the
+    functions.
+    """
+    results = [None] * len(functions)
+
+    def call(index):
+        try:
+            results[index] = functions[index]()
+        except Exception as e:
+            results[index] = e
+
+    threads = [
+        threading.Thread(target=call, args=(i,), daemon=True)
+        for i in range(len(functions))
+    ]
+    for thread in threads:
+        thread.start()
+    # Let all the threads make their requests.
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+def test_identical_requests_are_coalesced(api, client):
+    release = hold(api, "/tasks/t0/")
+    tasks = concurrently(release, *[lambda: client.raw.task_get("t0")] * 8)
+    assert api.paths().count("/tasks/t0/") == 1
+    assert tasks == [api.catalog["/tasks/"][0]] * 8
+    # Every caller has its own copy.
+    assert len({id(task) for task in tasks}) == 8
+    tasks[0]["name"] = "Changed"
+    assert tasks[1]["name"] == "Task 0"
+
+
+def test_errors_are_shared(api, client):
+    release = hold(api, "/tasks/t0/", status=503)
+    errors = concurrently(release, *[lambda: client.task_get("t0")] * 8)
+    assert api.paths().count("/tasks/t0/") == 1
+    assert all(isinstance(e, PapersWithCodeError) for e in errors)
+    assert {e.status_code for e in errors} == {503}
+
+
+def test_different_requests_are_not_coalesced(api, client):
+    release = hold(api, "/tasks/")
+    pages = concurrently(
+        release,
+        lambda: client.task_list(page=1, items_per_page=3),
+        lambda: client.task_list(page=2, items_per_page=3),
+        lambda: client.task_list(page=1, items_per_page=3),
+    )
+    assert api.paths().count("/tasks/") == 2
+    assert [page.results[0].id for page in pages] == ["t0", "t3", "t0"]
+
+
+def test_coalescing_can_be_disabled(api):
+    release = hold(api, "/tasks/t0/")
+    with PapersWithCodeClient(url=api.url, coalesce=False) as client:
+        tasks = concurrently(release, *[lambda: client.task_get("t0")] * 8)
+    assert api.paths().count("/tasks/t0/") == 8
+    assert {task.id for task in tasks} == {"t0"}
+
+
+def test_async_identical_requests_are_coalesced(api):
+    release = hold(api, "/tasks/t0/")
+
+    async def main():
+        async with AsyncPapersWithCodeClient(url=api.url) as client:
+            first = asyncio.ensure_future(client.raw.task_get("t0"))
+            await asyncio.sleep(0.1)
+            waiters = [
+                asyncio.ensure_future(client.raw.task_get("t0"))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0.1)
+            release.set()
+            task = await first
+            # Modified before the waiters resume.
+            task["name"] = "Changed"
+            return task, await asyncio.gather(*waiters)
+
+    task, tasks = asyncio.run(main())
+    assert api.paths().count("/tasks/t0/") == 1
+    assert tasks == [api.catalog["/tasks/"][0]] * 3
+    assert len({id(task) for task in tasks}) == 3
+
+
+def test_async_cancellation(api):
+    release = hold(api, "/tasks/t0/")
+
+    async def main():
+        async with AsyncPapersWithCodeClient(url=api.url) as client:
+            first = asyncio.ensure_future(client.task_get("t0"))
+            await asyncio.sleep(0.1)
+            waiters = [
+                asyncio.ensure_future(client.task_get("t0")) for _ in range(3)
+            ]
+            await asyncio.sleep(0.1)
+            # A cancelled waiter does not cancel the request.
+            waiters[0].cancel()
+            await asyncio.sleep(0.1)
+            assert not first.done()
+            # The request is made again by one of the waiters when the
+            # caller making it is cancelled.
+            first.cancel()
+            release.set()
+            tasks = await asyncio.gather(*waiters[1:])
+            assert waiters[0].cancelled()
+            assert first.cancelled()
+            return tasks
+
+    tasks = asyncio.run(main())
+    assert [task.id for task in tasks] == ["t0", "t0"]
+    assert api.paths().count("/tasks/t0/") == 2
@@ -0,0 +1,50 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+HEAVY_MODULES = ("httpx", "pydantic", "tea_client")
+
+
+def imported(code: str) -> list:
+    """Return the heavy modules imported by the code in a new interpreter."""
+    script = (
+        f"{code}\n"
+        "import sys\n"
+        f"print(*[m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+    )
+    process = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=Path(__file__).parents[2],
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    return process.stdout.decode().split()
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import paperswithcode",
+        "from paperswithcode import version, __version__",
+        "import paperswithcode.models",
+        "import paperswithcode; dir(paperswithcode)",
+    ],
+)
+def test_lazy_imports(code):
+    assert imported(code) == []
+
+
+@pytest.mark.parametrize(
+    "code, modules",
+    [
+        ("from paperswithcode import PapersWithCodeClient", HEAVY_MODULES),
+        (
+            "from paperswithcode.models import Paper",
+            ("pydantic", "tea_client"),
+        ),
+    ],
+)
+def test_imported_on_first_use(code, modules):
+    assert imported(code) == list(modules)
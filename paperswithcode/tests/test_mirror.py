@@ -0,0 +1,133 @@
+import pytest
+
+from paperswithcode.errors import PapersWithCodeError
+from paperswithcode.mirror import Mirror
+from paperswithcode.tests.conftest import result
+
+
+def fail_once(path, page=None):
+    """Return a hook failing the first request for the path and page."""
+    failed = []
+
+    def hook(method, request_path, params, body):
+        if (
+            not failed
+            and request_path == path
+            and (page is None or params.get("page") == str(page))
+        ):
+            failed.append(request_path)
+            return 500, b'{"detail": "Server error."}'
+
+    return hook
+
+
+def count(mirror, table, where="1", parameters=()):
+    return mirror.execute(
+        f"SELECT count(*) FROM {table} WHERE {where}", parameters
+    ).fetchone()[0]
+
+
+@pytest.fixture
+def mirror(tmp_path, client):
+    with Mirror(tmp_path / "mirror.sqlite", client=client) as mirror:
+        yield mirror
+
+
+def test_crawl(api, mirror):
+    mirror.crawl(items_per_page=5, workers=2)
+    for path, table in (
+        ("/papers/", "papers"),
+        ("/repositories/", "repositories"),
+        ("/authors/", "authors"),
+        ("/tasks/", "tasks"),
+        ("/evaluations/", "evaluations"),
+    ):
+        assert count(mirror, table) == len(api.catalog[path])
+    assert count(mirror, "proceedings") == 3
+    assert count(mirror, "area_tasks") == 6
+    assert count(mirror, "metrics") == 8
+    for i, evaluation_id in enumerate(("e_1", "ex1", "e2", "e3")):
+        assert count(
+            mirror, "results", "evaluation = ?", (evaluation_id,)
+        ) == (3 * i)
+
+
+def test_crawl_is_resumed_after_the_last_stored_page(api, mirror):
+    api.hooks.append(fail_once("/papers/", page=3))
+    with pytest.raises(PapersWithCodeError):
+        mirror.crawl(resources=["papers"], items_per_page=5, workers=1)
+    assert count(mirror, "papers") == 10
+
+    del api.requests[:]
+    mirror.crawl(resources=["papers"], items_per_page=5, workers=1)
+    assert count(mirror, "papers") == 23
+    assert sorted(params["page"] for _, _, params, _ in api.requests) == [
+        "3",
+        "4",
+        "5",
+    ]
+
+
+def test_crawl_is_resumed_after_the_last_crawled_parent(api, mirror):
+    mirror.crawl(resources=["evaluations"])
+    paths = {f"/evaluations/{i}/results/" for i in ("e_1", "ex1", "e2", "e3")}
+    del api.requests[:]
+    api.hooks.append(fail_once("/evaluations/ex1/results/"))
+    with pytest.raises(PapersWithCodeError):
+        mirror.crawl(resources=["results"], workers=1)
+    crawled = set(api.paths()) - {"/evaluations/ex1/results/"}
+    assert "/evaluations/e_1/results/" in crawled
+
+    del api.requests[:]
+    mirror.crawl(resources=["results"], workers=1)
+    # The parent ids are matched exactly, "e_1" was crawled and "ex1" not.
+    assert sorted(api.paths()) == sorted(paths - crawled)
+    assert count(mirror, "results") == 18
+
+    del api.requests[:]
+    mirror.crawl(resources=["results"])
+    assert api.paths() == []
+
+
+def test_crawl_with_a_capped_page_size(api, mirror):
+    api.max_items_per_page = 5
+    mirror.crawl(resources=["papers"], items_per_page=10, workers=4)
+    assert count(mirror, "papers") == 23
+    # The pages are stored with the size the server used.
+    assert mirror.execute(
+        "SELECT DISTINCT items_per_page FROM pages WHERE name = 'papers'"
+    ).fetchall() == [(5,)]
+
+
+def test_refresh_without_changes(api, mirror):
+    mirror.crawl(items_per_page=5)
+    del api.requests[:]
+    assert set(mirror.refresh().values()) == {0}
+    # Only the first page of every nested list is checked.
+    results = [path for path in api.paths() if path.endswith("/results/")]
+    assert len(results) == 4
+
+
+def test_refresh_finds_added_nested_objects(api, mirror):
+    mirror.crawl(resources=["evaluations", "results"])
+    api.catalog["/evaluations/e2/results/"].append(result("e2", 6))
+    assert mirror.refresh(resources=["results"]) == {"results": 1}
+    assert count(mirror, "results", "evaluation = ?", ("e2",)) == 7
+
+
+def test_refresh_finds_changed_pages(api, mirror):
+    mirror.crawl(resources=["papers"], items_per_page=5)
+    api.catalog["/papers/"][-1]["title"] = "Renamed"
+    api.catalog["/papers/"].insert(0, dict(api.catalog["/papers/"][0]))
+    api.catalog["/papers/"][0]["id"] = "new"
+    assert mirror.refresh(resources=["papers"])["papers"] > 0
+    assert count(mirror, "papers") == 24
+    assert count(mirror, "papers", "title = ?", ("Renamed",)) == 1
+
+
+def test_refresh_with_a_capped_page_size(api, mirror):
+    api.max_items_per_page = 5
+    mirror.crawl(resources=["papers"], items_per_page=10)
+    api.catalog["/papers/"][-1]["title"] = "Renamed"
+    assert mirror.refresh(resources=["papers"]) == {"papers": 1}
+    assert count(mirror, "papers", "title = ?", ("Renamed",)) == 1
@@ -0,0 +1,96 @@
+import pytest
+
+from paperswithcode.errors import PapersWithCodeError
+from paperswithcode.mirror import Mirror
+from paperswithcode.offline import OfflinePapersWithCodeClient
+from paperswithcode.pagination import iterate
+
+
+@pytest.fixture
+def offline(tmp_path, client):
+    mirror = Mirror(tmp_path / "mirror.sqlite", client=client)
+    mirror.crawl(items_per_page=7)
+    with OfflinePapersWithCodeClient(mirror) as offline:
+        yield offline
+
+
+def ids(page):
+    return [item.id for item in page.results]
+
+
+def test_objects_match_the_server(client, offline):
+    assert offline.paper_get("p3") == client.paper_get("p3")
+    assert offline.evaluation_get("e_1") == client.evaluation_get("e_1")
+    assert offline.task_get("t2") == client.task_get("t2")
+
+
+@pytest.mark.parametrize(
+    "method, args",
+    [
+        ("paper_list", ()),
+        ("author_list", ()),
+        ("evaluation_list", ()),
+        ("evaluation_metric_list", ("e2",)),
+        ("evaluation_result_list", ("e3",)),
+        ("area_task_list", ("ar1",)),
+    ],
+)
+def test_lists_are_paginated_like_the_server(client, offline, method, args):
+    for page in (1, 2, 3):
+        online_page = getattr(client, method)(
+            *args, page=page, items_per_page=4
+        )
+        offline_page = getattr(offline, method)(
+            *args, page=page, items_per_page=4
+        )
+        assert offline_page.count == online_page.count
+        assert offline_page.next_page == online_page.next_page
+        assert offline_page.previous_page == online_page.previous_page
+        assert sorted(ids(offline_page)) == sorted(ids(online_page))
+
+
+def test_filters(offline):
+    papers = offline.paper_list(q="transformers", items_per_page=50)
+    assert sorted(ids(papers)) == sorted(f"p{i}" for i in range(0, 23, 3))
+    assert ids(offline.task_list(name="Task 4")) == ["t4"]
+
+
+def test_streaming(offline):
+    assert offline.streaming is offline
+    assert ids(offline.streaming.paper_list(items_per_page=4)) == ids(
+        offline.paper_list(items_per_page=4)
+    )
+    papers = iterate(offline.streaming.paper_list, items_per_page=4, workers=3)
+    assert sorted(paper.id for paper in papers) == sorted(
+        f"p{i}" for i in range(23)
+    )
+
+
+def test_missing_object(offline):
+    with pytest.raises(PapersWithCodeError) as error:
+        offline.paper_get("missing")
+    assert error.value.status_code == 404
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "paper_dataset_list",
+        "paper_method_list",
+        "paper_repository_list",
+        "paper_task_list",
+        "author_paper_list",
+        "task_paper_list",
+    ],
+)
+def test_unmirrored_data_is_not_available(offline, method):
+    with pytest.raises(PapersWithCodeError) as error:
+        getattr(offline, method)("p1")
+    assert error.value.status_code == 501
+
+
+def test_read_only(api, offline):
+    with pytest.raises(PapersWithCodeError) as error:
+        offline.task_delete("t1")
+    assert error.value.status_code == 405
+    assert api.paths("DELETE") == []
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from paperswithcode.async_client import AsyncPapersWithCodeClient
+from paperswithcode.pagination import aiterate, iterate, iterate_pages
+
+PAPERS = [f"p{i}" for i in range(23)]
+
+
+def ids(items):
+    return [
+        item["id"] if isinstance(item, dict) else item.id for item in items
+    ]
+
+
+def add_papers_after_first_page(api, number):
+    """Add papers to the catalog when the second page is requested."""
+    added = []
+    lock = threading.Lock()
+
+    def hook(method, path, params, body):
+        if path != "/papers/" or params.get("page") == "1":
+            return
+        # The pages are requested concurrently.
+        with lock:
+            if not added:
+                for i in range(number):
+                    added.append(
+                        dict(api.catalog["/papers/"][0], id=f"new{i}")
+                    )
+                api.catalog["/papers/"].extend(added)
+
+    api.hooks.append(hook)
+    return added
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+@pytest.mark.parametrize("items_per_page", [1, 5, 7, 23, 50])
+def test_iterate(client, workers, items_per_page):
+    papers = iterate(
+        client.paper_list, items_per_page=items_per_page, workers=workers
+    )
+    assert ids(papers) == PAPERS
+
+
+def test_iterate_from_a_page(client):
+    papers = iterate(client.paper_list, page=3, items_per_page=5, workers=3)
+    assert ids(papers) == PAPERS[10:]
+
+
+def test_iterate_raw_pages(client):
+    pages = list(iterate_pages(client.raw.paper_list, items_per_page=10))
+    assert [len(page["results"]) for page in pages] == [10, 10, 3]
+    assert ids(iterate(client.raw.paper_list, workers=2)) == PAPERS
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_capped_page_size(api, client, workers):
+    api.max_items_per_page = 5
+    pages = list(
+        iterate_pages(client.paper_list, items_per_page=10, workers=workers)
+    )
+    assert [len(page.results) for page in pages] == [5, 5, 5, 5, 3]
+    assert ids(item for page in pages for item in page.results) == PAPERS
+
+
+def test_unordered(api, client):
+    api.max_items_per_page = 3
+    papers = ids(
+        iterate(client.paper_list, items_per_page=10, workers=4, ordered=False)
+    )
+    assert sorted(papers) == sorted(PAPERS)
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_pages_changed_during_the_iteration(api, client, ordered):
+    added = add_papers_after_first_page(api, 7)
+    papers = ids(
+        iterate(
+            client.paper_list, items_per_page=5, workers=3, ordered=ordered
+        )
+    )
+    # The planned pages end at the 23rd paper, the remaining pages are found
+    # with the next page links.
+    assert sorted(papers) == sorted(PAPERS + ids(added))
+
+
+def test_pages_changed_before_unordered_pages(api, client):
+    # The second page is held until the last planned page, which finds out
+    # that papers were added, has been answered.
+    added = add_papers_after_first_page(api, 3)
+    last_page = threading.Event()
+    held = []
+
+    def hook(method, path, params, body):
+        if path != "/papers/":
+            return
+        if params.get("page") == "5":
+            last_page.set()
+        elif params.get("page") == "2" and not held:
+            held.append(True)
+            last_page.wait(5)
+            time.sleep(0.1)
+
+    api.hooks.append(hook)
+    papers = iterate(
+        client.paper_list, items_per_page=5, workers=2, ordered=False
+    )
+    assert sorted(ids(papers)) == sorted(PAPERS + ids(added))
+
+
+def test_empty_list(api, client):
+    api.catalog["/papers/"] = []
+    assert list(iterate(client.paper_list, workers=4)) == []
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_async_iterate(api, workers):
+    api.max_items_per_page = 5
+
+    async def main():
+        async with AsyncPapersWithCodeClient(url=api.url) as client:
+            papers = [
+                paper
+                async for paper in aiterate(
+                    client.paper_list, items_per_page=10, workers=workers
+                )
+            ]
+            assert ids(papers) == PAPERS
+
+            added = add_papers_after_first_page(api, 4)
+            papers = [
+                paper
+                async for paper in aiterate(
+                    client.paper_list, items_per_page=10, workers=workers
+                )
+            ]
+            assert ids(papers) == PAPERS + ids(added)
+
+    asyncio.run(main())
@@ -0,0 +1,66 @@
+import math
+
+import pytest
+
+from paperswithcode.frame import ResultFrame
+from paperswithcode.ranking import Ranking, competition_rank
+from paperswithcode.tests.conftest import result
+
+numpy = pytest.importorskip("numpy")
+
+
+def test_competition_rank():
+    numpy.testing.assert_array_equal(
+        competition_rank([90, 85, 85, 80]), [1, 2, 2, 4]
+    )
+    numpy.testing.assert_array_equal(
+        competition_rank([90, math.nan, 85, 85], is_loss=True),
+        [3, math.nan, 1, 1],
+    )
+
+
+def test_ranking(client):
+    ranking = client.evaluation_ranking("e3")
+    assert len(ranking) == 9
+    ranks = numpy.arange(1.0, 10.0)
+    numpy.testing.assert_array_equal(ranking.ranks["Accuracy"], ranks)
+    # Lower errors are better.
+    numpy.testing.assert_array_equal(ranking.ranks["Error"], ranks)
+    numpy.testing.assert_array_equal(ranking.best_rank, ranks)
+    # Ties go to the first metric of the table.
+    assert set(ranking.best_metric) == {"Accuracy"}
+
+
+def test_preview_and_insert(client):
+    ranking = client.evaluation_ranking("e3")
+    candidates = [
+        {"metrics": {"Accuracy": "95%"}},
+        {"metrics": {"Accuracy": "85", "Error": "1"}},
+        {"metrics": {}},
+    ]
+    preview = ranking.preview(candidates)
+    numpy.testing.assert_array_equal(preview.best_rank, [1, 1, math.nan])
+    numpy.testing.assert_array_equal(
+        preview.ranks["Accuracy"], [1, 6, math.nan]
+    )
+    assert list(preview.best_metric) == ["Accuracy", "Error", None]
+
+    inserted = ranking.insert(candidates)
+    assert len(inserted) == 12
+    assert inserted.ranks["Accuracy"][9] == 1
+    numpy.testing.assert_array_equal(
+        inserted.ranks["Accuracy"][[5, 10]], [7, 7]
+    )
+    # The table is not changed.
+    assert len(ranking) == 9
+
+
+def test_ranking_without_metric_values():
+    results = [dict(result("e", i), metrics={}) for i in range(3)]
+    frame = ResultFrame.from_results(results)
+    for metrics in ([], [{"name": "Accuracy", "is_loss": False}]):
+        ranking = Ranking.from_frame(frame, metrics)
+        assert len(ranking) == 3
+        assert numpy.isnan(ranking.best_rank).all()
+        assert list(ranking.best_metric) == [None] * 3
+        assert len(ranking.insert([{"metrics": {}}])) == 4
@@ -0,0 +1,151 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from paperswithcode import PapersWithCodeClient, http, ratelimit
+from paperswithcode.async_client import AsyncPapersWithCodeClient
+from paperswithcode.errors import PapersWithCodeError
+from paperswithcode.ratelimit import RateLimiter
+from paperswithcode.tests.conftest import evaluation
+
+
+def response(status, headers=None):
+    return httpx.Response(status, headers=headers or {})
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replace the monotonic clock of the rate limiter."""
+    now = [0.0]
+    monkeypatch.setattr(ratelimit.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record the delays of the HTTP client instead of waiting."""
+    sleeps = []
+    monkeypatch.setattr(http.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def fail(api, path, *answers):
+    """Answer the first requests for the path with the given answers."""
+    answers = list(answers)
+
+    def hook(method, request_path, params, body):
+        if request_path == path and answers:
+            return answers.pop(0)
+
+    api.hooks.append(hook)
+
+
+def test_groups():
+    assert RateLimiter.group("/papers/p1/repositories/") == "papers"
+    assert RateLimiter.group("rpc/evaluation-synchronize/") == "rpc"
+    limiter = RateLimiter(rate=10, group_rates={"search": 1})
+    assert limiter.current_rate("/search/") == 1
+    assert limiter.current_rate("/papers/") == 10
+
+
+def test_token_buckets(clock):
+    limiter = RateLimiter(rate=2, group_rates={"search": 1})
+    assert [limiter.acquire("/papers/") for _ in range(3)] == [0, 0, 0.5]
+    # Every group has its own bucket.
+    assert limiter.acquire("/tasks/") == 0
+    assert limiter.acquire("/search/") == 0
+    assert limiter.acquire("/search/") == 1
+    clock[0] = 1.5
+    assert limiter.acquire("/papers/") == 0
+
+
+def test_the_rate_adapts_to_the_server(clock):
+    limiter = RateLimiter(rate=4, max_rate=5, increase=0.5, decrease=0.5)
+    for _ in range(4):
+        limiter.update("/papers/", response(200))
+    assert limiter.current_rate("/papers/") == 5
+    limiter.update("/papers/", response(429, {"Retry-After": "3"}))
+    assert limiter.current_rate("/papers/") == 2.5
+    # The group is paused for the time requested by the server.
+    assert limiter.acquire("/papers/") >= 3
+    assert limiter.acquire("/tasks/") == 0
+    for _ in range(10):
+        limiter.update("/tasks/", response(429))
+    assert limiter.current_rate("/tasks/") == 0.1
+
+
+def test_retry_delay():
+    limiter = RateLimiter(backoff=1, max_backoff=4, max_retries=3)
+    for attempt in range(3):
+        assert 0 <= limiter.retry_delay("GET", attempt) <= min(4, 2 ** attempt)
+        assert limiter.retry_delay("GET", attempt, response(503)) <= 4
+    assert limiter.retry_delay("GET", 3) is None
+    assert limiter.retry_delay("GET", 0, response(404)) is None
+    # Only GET requests are retried.
+    for method in ("POST", "PATCH", "DELETE"):
+        assert limiter.retry_delay(method, 0, response(503)) is None
+    retry_after = response(429, {"Retry-After": "30"})
+    assert limiter.retry_delay("GET", 0, retry_after) == 30
+
+
+def test_retry_after():
+    assert RateLimiter.retry_after(response(429)) is None
+    assert (
+        RateLimiter.retry_after(response(429, {"Retry-After": "2.5"})) == 2.5
+    )
+    when = datetime.now(timezone.utc) + timedelta(seconds=60)
+    delay = RateLimiter.retry_after(
+        response(429, {"Retry-After": format_datetime(when, usegmt=True)})
+    )
+    assert 55 < delay <= 60
+    invalid = response(429, {"Retry-After": "soon"})
+    assert RateLimiter.retry_after(invalid) is None
+
+
+def test_get_requests_are_retried(api, sleeps):
+    fail(
+        api,
+        "/tasks/t0/",
+        (429, b"{}", {"Retry-After": "7"}),
+        (503, b"{}"),
+    )
+    limiter = RateLimiter()
+    with PapersWithCodeClient(url=api.url, rate_limiter=limiter) as client:
+        assert client.task_get("t0").id == "t0"
+    assert api.paths() == ["/tasks/t0/"] * 3
+    assert max(sleeps) >= 7
+    assert limiter.current_rate("/tasks/") < 10
+
+
+def test_async_get_requests_are_retried(api, monkeypatch):
+    sleeps = []
+
+    async def sleep(delay):
+        sleeps.append(delay)
+
+    monkeypatch.setattr(http.asyncio, "sleep", sleep)
+    fail(api, "/tasks/t0/", (429, b"{}", {"Retry-After": "7"}))
+
+    async def main():
+        async with AsyncPapersWithCodeClient(
+            url=api.url, rate_limiter=RateLimiter()
+        ) as client:
+            return await client.task_get("t0")
+
+    assert asyncio.run(main()).id == "t0"
+    assert api.paths() == ["/tasks/t0/"] * 2
+    assert max(sleeps) >= 7
+
+
+def test_writes_are_not_retried(api, sleeps):
+    fail(api, "/rpc/evaluation-synchronize/", (503, b"{}"))
+    with PapersWithCodeClient(
+        url=api.url, rate_limiter=RateLimiter()
+    ) as client:
+        with pytest.raises(PapersWithCodeError) as error:
+            client.evaluation_synchronize(evaluation(1))
+    assert error.value.status_code == 503
+    assert api.paths("POST") == ["/rpc/evaluation-synchronize/"]
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+from pydantic import BaseModel
+
+from paperswithcode import PapersWithCodeClient
+from paperswithcode.async_client import AsyncPapersWithCodeClient
+from paperswithcode.cache import MemoryCache
+from paperswithcode.pagination import aiterate_pages
+
+
+@pytest.fixture
+def no_models(monkeypatch):
+    """Fail if a model is built, validated or not."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("A model was built.")
+
+    monkeypatch.setattr(BaseModel, "__init__", fail)
+    monkeypatch.setattr(BaseModel, "construct", classmethod(fail))
+    monkeypatch.setattr("paperswithcode.client.construct", fail)
+    monkeypatch.setattr("paperswithcode.async_client.construct", fail)
+
+
+def call(api, asynchronous, name, *args, **kwargs):
+    """Call a method of the raw client, trusted to use `construct`."""
+    options = dict(url=api.url, memory_cache=MemoryCache(), trusted=True)
+    if not asynchronous:
+        with PapersWithCodeClient(**options) as client:
+            return getattr(client.raw, name)(*args, **kwargs)
+
+    async def main():
+        async with AsyncPapersWithCodeClient(**options) as client:
+            return await getattr(client.raw, name)(*args, **kwargs)
+
+    return asyncio.run(main())
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_object(api, no_models, asynchronous):
+    paper = call(api, asynchronous, "paper_get", "p1")
+    assert paper == api.catalog["/papers/"][1]
+
+
+@pytest.mark.parametrize("asynchronous", [False, True])
+def test_page(api, no_models, asynchronous):
+    page = call(
+        api, asynchronous, "evaluation_result_list", "e3", items_per_page=4
+    )
+    assert page == {
+        "count": 9,
+        "next_page": 2,
+        "previous_page": None,
+        "results": api.catalog["/evaluations/e3/results/"][:4],
+    }
+
+
+def test_raw_clients_do_not_use_the_memory_cache(api):
+    with PapersWithCodeClient(
+        url=api.url, memory_cache=MemoryCache()
+    ) as client:
+        assert client.raw.paper_get("p1") == api.catalog["/papers/"][1]
+        assert len(client.memory_cache) == 0
+        assert client.paper_get("p1").id == "p1"
+        # The models cached by the client are not returned.
+        assert isinstance(client.raw.paper_get("p1"), dict)
+
+
+def test_async_iterate_raw_pages(api, no_models):
+    async def main():
+        async with AsyncPapersWithCodeClient(url=api.url) as client:
+            return [
+                page
+                async for page in aiterate_pages(
+                    client.raw.paper_list, items_per_page=10, workers=2
+                )
+            ]
+
+    pages = asyncio.run(main())
+    assert [page["results"] for page in pages] == [
+        api.catalog["/papers/"][i : i + 10] for i in (0, 10, 20)
+    ]
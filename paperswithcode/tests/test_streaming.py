@@ -0,0 +1,229 @@
+import json
+import asyncio
+import threading
+
+import pytest
+from tea_client import errors
+
+from paperswithcode import PapersWithCodeClient
+from paperswithcode.async_client import AsyncPapersWithCodeClient
+from paperswithcode.http import PoolLimits
+from paperswithcode.pagination import aiterate, aiterate_pages, iterate
+from paperswithcode.streaming import AsyncPageStream, _AsyncReader, _Reader
+
+PAPERS = [f"p{i}" for i in range(23)]
+
+
+def serve(api, path, body):
+    """Answer the GET requests for the path with the raw body."""
+    api.hooks.append(
+        lambda method, request_path, params, _: (
+            (200, body) if request_path == path else None
+        )
+    )
+
+
+def test_reader_with_tiny_chunks():
+    document = {
+        "count": 12345678901234567890,
+        "text": "naïve ± ünïcode 🚀",
+        "results": [{"value": -1.5e-3}, [], {}, None, True],
+    }
+    data = json.dumps(document, ensure_ascii=False, indent=1).encode()
+    reader = _Reader(data[i : i + 1] for i in range(len(data)))
+    assert reader.value() == document
+    assert reader.peek() == ""
+
+
+def test_async_reader_with_tiny_chunks():
+    document = {"text": "naïve 🚀", "results": [1, 23, -4.5e6, [None]]}
+    data = json.dumps(document, ensure_ascii=False).encode()
+
+    async def chunks():
+        for i in range(len(data)):
+            yield data[i : i + 1]
+
+    async def main():
+        reader = _AsyncReader(chunks())
+        assert await reader.value() == document
+        assert await reader.peek() == ""
+
+    asyncio.run(main())
+
+
+def test_streamed_page_matches_page(client):
+    page = client.paper_list(page=2, items_per_page=10)
+    with client.streaming.paper_list(page=2, items_per_page=10) as stream:
+        assert stream.count == page.count
+        assert stream.next_page == page.next_page
+        assert stream.previous_page == page.previous_page
+        assert list(stream.results) == page.results
+
+
+def test_fields_after_the_results(api, client):
+    page = api._page("/tasks/", {})
+    body = json.dumps({"results": page["results"], "count": 6}).encode()
+    serve(api, "/tasks/", body)
+    stream = client.streaming.task_list()
+    assert stream.count is None
+    assert [task.id for task in stream.results] == [f"t{i}" for i in range(6)]
+    assert stream.count == 6
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b'{"count": 6, "results": [{"id": "t0", "name": "Task 0", "descr',
+        b'{"count": 6, "results": [{"id": "t0", "name": "Task 0", '
+        b'"description": ""} {"id"',
+        b'{"count": 6, "results": [{"id": "t0", "name": "\xff"}]}',
+    ],
+)
+def test_invalid_results(api, client, body):
+    serve(api, "/tasks/", body)
+    # Raised when the page is created or while iterating, depending on
+    # where the chunks end.
+    with pytest.raises(errors.HttpClientError) as error:
+        list(client.streaming.task_list().results)
+    assert "Error while parsing server response" in error.value.message
+
+
+def test_invalid_page(api, client):
+    serve(api, "/tasks/", b"<html>Server error</html>")
+    with pytest.raises(errors.HttpClientError) as error:
+        client.streaming.task_list()
+    assert "Error while parsing server response" in error.value.message
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+@pytest.mark.parametrize("max_items_per_page", [None, 3])
+def test_iterate_streamed_pages(api, client, ordered, max_items_per_page):
+    api.max_items_per_page = max_items_per_page
+    papers = iterate(
+        client.streaming.paper_list,
+        items_per_page=5,
+        workers=3,
+        ordered=ordered,
+    )
+    assert sorted(paper.id for paper in papers) == sorted(PAPERS)
+
+
+def test_iterate_with_fewer_connections_than_workers(api):
+    # Every streamed page holds a connection until it is read, the workers
+    # are limited to the pool size instead of waiting for each other.
+    papers = []
+    limits = PoolLimits(max_connections=2)
+    with PapersWithCodeClient(url=api.url, pool_limits=limits) as client:
+        thread = threading.Thread(
+            target=lambda: papers.extend(
+                iterate(
+                    client.streaming.paper_list, items_per_page=2, workers=6
+                )
+            ),
+            daemon=True,
+        )
+        thread.start()
+        thread.join(10)
+        assert not thread.is_alive()
+        assert [paper.id for paper in papers] == PAPERS
+        # All the connections were released.
+        assert client.http._slots.acquire(blocking=False)
+        assert client.http._slots.acquire(blocking=False)
+
+
+def test_async_streamed_page_matches_page(api, client):
+    page = client.paper_list(page=2, items_per_page=10)
+
+    async def main():
+        async with AsyncPapersWithCodeClient(url=api.url) as aclient:
+            stream = await aclient.streaming.paper_list(
+                page=2, items_per_page=10
+            )
+            assert isinstance(stream, AsyncPageStream)
+            async with stream:
+                assert stream.count == page.count
+                assert stream.next_page == page.next_page
+                assert stream.previous_page == page.previous_page
+                assert [paper async for paper in stream] == page.results
+            # The other methods behave as usual.
+            paper = await aclient.streaming.paper_get("p1")
+            assert paper == client.paper_get("p1")
+            raw = await aclient.raw.streaming.task_list()
+            assert [task async for task in raw] == api.catalog["/tasks/"]
+
+    asyncio.run(main())
+
+
+def test_async_invalid_results(api):
+    serve(api, "/tasks/", b'{"count": 6, "results": [{"id": "t0", "na')
+
+    async def main():
+        async with AsyncPapersWithCodeClient(url=api.url) as client:
+            page = await client.streaming.task_list()
+            with pytest.raises(errors.HttpClientError) as error:
+                [task async for task in page]
+            assert "Error while parsing server response" in error.value.message
+
+    asyncio.run(main())
+
+
+@pytest.mark.parametrize("max_items_per_page", [None, 3])
+def test_async_iterate_with_fewer_connections_than_workers(
+    api, max_items_per_page
+):
+    api.max_items_per_page = max_items_per_page
+    limits = PoolLimits(max_connections=2)
+
+    async def main():
+        async with AsyncPapersWithCodeClient(
+            url=api.url, pool_limits=limits
+        ) as client:
+            papers = [
+                paper
+                async for paper in aiterate(
+                    client.streaming.paper_list, items_per_page=2, workers=6
+                )
+            ]
+            assert [paper.id for paper in papers] == PAPERS
+            # All the connections were released.
+            for _ in range(2):
+                await asyncio.wait_for(client.http.slots.acquire(), 1)
+
+    asyncio.run(asyncio.wait_for(main(), 10))
+
+
+def test_async_closed_page_releases_the_connection(api):
+    limits = PoolLimits(max_connections=1)
+
+    async def main():
+        async with AsyncPapersWithCodeClient(
+            url=api.url, pool_limits=limits
+        ) as client:
+            async with await client.streaming.paper_list() as page:
+                assert (await page.results.__anext__()).id == "p0"
+            paper = await asyncio.wait_for(client.paper_get("p1"), 5)
+            assert paper.id == "p1"
+
+    asyncio.run(main())
+
+
+def test_async_pages_fetched_ahead_are_released(api):
+    limits = PoolLimits(max_connections=3)
+
+    async def main():
+        async with AsyncPapersWithCodeClient(
+            url=api.url, pool_limits=limits
+        ) as client:
+            pages = aiterate_pages(
+                client.streaming.paper_list, items_per_page=2, workers=3
+            )
+            async with await pages.__anext__():
+                pass
+            async with await pages.__anext__():
+                # Let the pages fetched ahead complete.
+                await asyncio.sleep(0.2)
+            await pages.aclose()
+            for _ in range(3):
+                await asyncio.wait_for(client.http.slots.acquire(), 1)
+
+    asyncio.run(main())
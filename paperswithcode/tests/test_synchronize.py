@@ -0,0 +1,164 @@
+import asyncio
+
+import pytest
+
+from paperswithcode import synchronize
+from paperswithcode.async_client import AsyncPapersWithCodeClient
+from paperswithcode.errors import PapersWithCodeError
+from paperswithcode.synchronize import SyncDelta, SyncState
+from paperswithcode.tests.conftest import evaluation
+
+
+def fail(api, status, posts):
+    """Fail the synchronization requests with the given indices."""
+    requests = []
+
+    def hook(method, path, params, body):
+        if method == "POST":
+            requests.append(path)
+            if len(requests) - 1 in posts:
+                return status, b'{"detail": "Failed."}'
+
+    api.hooks.append(hook)
+
+
+def external_ids(results):
+    return [
+        result["external_id"]
+        if isinstance(result, dict)
+        else result.external_id
+        for result in results
+    ]
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record the delays between the retries instead of waiting."""
+    sleeps = []
+    monkeypatch.setattr(synchronize.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def test_synchronize(api, client):
+    response = client.evaluation_synchronize(evaluation())
+    assert response.id == "table"
+    assert external_ids(response.results) == [f"x{i}" for i in range(10)]
+    assert len(api.posts) == 1
+
+
+def test_chunked_synchronization(api, client):
+    progress = []
+    response = client.evaluation_synchronize(
+        evaluation(),
+        chunk_size=4,
+        progress=lambda done, total: progress.append((done, total)),
+    )
+    assert [len(post["results"]) for post in api.posts] == [4, 4, 2]
+    assert all(post["metrics"] for post in api.posts)
+    assert external_ids(response.results) == [f"x{i}" for i in range(10)]
+    assert progress == [(4, 10), (8, 10), (10, 10)]
+
+
+def test_failed_chunks_are_retried(api, client, sleeps):
+    fail(api, 503, {1, 2})
+    response = client.evaluation_synchronize(evaluation(), chunk_size=4)
+    assert external_ids(response.results) == [f"x{i}" for i in range(10)]
+    assert len(sleeps) == 2
+    assert [len(post["results"]) for post in api.posts] == [4, 4, 2]
+
+
+def test_rejected_chunks_are_not_retried(api, client, sleeps):
+    fail(api, 400, {1})
+    with pytest.raises(PapersWithCodeError):
+        client.evaluation_synchronize(evaluation(), chunk_size=4)
+    assert sleeps == []
+    assert len(api.posts) == 1
+
+
+def test_synchronization_is_resumed_with_the_state(api, client):
+    fail(api, 400, {1})
+    state = SyncState()
+    with pytest.raises(PapersWithCodeError):
+        client.evaluation_synchronize(evaluation(), chunk_size=4, state=state)
+    response = client.evaluation_synchronize(
+        evaluation(), chunk_size=4, state=state
+    )
+    assert external_ids(response.results) == [f"x{i}" for i in range(10)]
+    assert [external_ids(post["results"]) for post in api.posts] == [
+        ["x0", "x1", "x2", "x3"],
+        ["x4", "x5", "x6", "x7"],
+        ["x8", "x9"],
+    ]
+
+    with pytest.raises(ValueError):
+        client.evaluation_synchronize(evaluation(), chunk_size=5, state=state)
+
+
+@pytest.mark.parametrize("external_id", ["", None])
+def test_chunked_results_must_have_an_external_id(api, client, external_id):
+    table = evaluation()
+    table.results[7].external_id = external_id
+    with pytest.raises(ValueError):
+        client.evaluation_synchronize(table, chunk_size=4)
+    assert api.posts == []
+    # Without chunks, the table is sent once and never retried.
+    client.evaluation_synchronize(table)
+    assert len(api.posts) == 1
+
+
+def test_delta_synchronization(api, client, tmp_path):
+    with SyncDelta(tmp_path / "sync.sqlite") as delta:
+        client.evaluation_synchronize(evaluation(), delta=delta)
+        changed = evaluation(12)
+        changed.results[3].metrics = {"Accuracy": "99"}
+        response = client.evaluation_synchronize(
+            changed, chunk_size=2, delta=delta
+        )
+        assert external_ids(response.results) == ["x3", "x10", "x11"]
+        assert [len(post["results"]) for post in api.posts] == [10, 2, 1]
+
+        # The results of a failed synchronization are sent again.
+        changed.results[5].metrics = {"Accuracy": "0"}
+        fail(api, 400, {0})
+        with pytest.raises(PapersWithCodeError):
+            client.evaluation_synchronize(changed, delta=delta)
+        response = client.evaluation_synchronize(changed, delta=delta)
+        assert external_ids(response.results) == ["x5"]
+
+        delta.forget(changed)
+        response = client.evaluation_synchronize(changed, delta=delta)
+        assert len(response.results) == 12
+
+
+def test_synchronize_many(api, client):
+    evaluations = [evaluation(i + 1, dataset=f"d{i}") for i in range(4)]
+    batch = client.evaluation_synchronize_many(evaluations, workers=2)
+    assert sorted(batch.results) == [0, 1, 2, 3]
+    for i in range(4):
+        assert batch[i].dataset == f"d{i}"
+        assert len(batch[i].results) == i + 1
+
+
+def test_synchronize_many_rejects_duplicate_tables(api, client):
+    evaluations = [evaluation(dataset="d0"), evaluation(dataset="d1")]
+    with pytest.raises(ValueError):
+        client.evaluation_synchronize_many(evaluations + evaluations[:1])
+    assert api.posts == []
+
+
+def test_async_synchronization(api):
+    async def main():
+        async with AsyncPapersWithCodeClient(url=api.url) as client:
+            response = await client.evaluation_synchronize(
+                evaluation(), chunk_size=4
+            )
+            assert external_ids(response.results) == [
+                f"x{i}" for i in range(10)
+            ]
+            with pytest.raises(ValueError):
+                await client.evaluation_synchronize_many(
+                    [evaluation(), evaluation()]
+                )
+
+    asyncio.run(main())
+    assert [len(post["results"]) for post in api.posts] == [4, 4, 2]
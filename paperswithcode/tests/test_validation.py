@@ -0,0 +1,107 @@
+import math
+
+import pytest
+
+from paperswithcode.models import ResultSyncRequest
+from paperswithcode.tests.conftest import evaluation
+from paperswithcode.validation import validate_evaluation
+
+METRIC_VALUES = [
+    ("85", 85.0),
+    ("85.3%", 85.3),
+    ("95.1 ± 0.2", 95.1),
+    ("1,234.5", 1234.5),
+    ("(12.5)", 12.5),
+    ("−3e2", -300.0),
+    (".5M", 0.5),
+    (7, 7.0),
+    ("-", math.nan),
+    ("", math.nan),
+    (None, math.nan),
+    ("NaN", math.nan),
+    ("inf", math.nan),
+    ("1e999", math.nan),
+    (True, math.nan),
+    ([1], math.nan),
+    ((1,), math.nan),
+    ({"value": 1}, math.nan),
+]
+
+
+def with_metrics(*metrics):
+    table = evaluation(len(metrics))
+    for result, values in zip(table.results, metrics):
+        result.metrics = values
+    return table
+
+
+def issues(report):
+    return [(issue.index, issue.field) for issue in report]
+
+
+@pytest.mark.parametrize("value, expected", METRIC_VALUES)
+def test_validation_agrees_with_the_frames(value, expected):
+    table = evaluation(1)
+    table.results[0] = ResultSyncRequest(
+        **dict(table.results[0].dict(), metrics={"Accuracy": value})
+    )
+    # Missing values are valid.
+    assert validate_evaluation(table).ok == (
+        value is None or math.isfinite(expected)
+    )
+    try:
+        from paperswithcode.frame import parse_metric_values
+
+        parsed = parse_metric_values([value])
+    except ImportError:
+        return
+    assert math.isnan(parsed[0]) == math.isnan(expected)
+
+
+def test_valid_table():
+    report = validate_evaluation(evaluation())
+    assert report.ok
+    assert len(report) == 0
+
+
+def test_undeclared_metrics():
+    table = with_metrics({"Accuracy": "1"}, {"Top 5": "2", "Accuracy": "3"})
+    assert issues(validate_evaluation(table)) == [(1, "metrics.Top 5")]
+
+
+def test_non_numeric_values():
+    # The same values are checked once, unhashable values are not cached.
+    table = with_metrics(
+        {"Accuracy": "85%"},
+        {"Accuracy": [1]},
+        {"Accuracy": {"a": 1}},
+        {"Accuracy": [1]},
+        {"Accuracy": "85%"},
+        {"Accuracy": 1},
+        {"Accuracy": True},
+    )
+    report = validate_evaluation(table)
+    assert issues(report) == [
+        (1, "metrics.Accuracy"),
+        (2, "metrics.Accuracy"),
+        (3, "metrics.Accuracy"),
+        (6, "metrics.Accuracy"),
+    ]
+    assert report.issues[1].value == {"a": 1}
+    assert str(report.issues[0]) == (
+        "results[1].metrics.Accuracy: Value is not a finite number."
+    )
+
+
+def test_dates_and_external_ids():
+    table = evaluation(4)
+    table.results[1].evaluated_on = "2020-02-30"
+    table.results[2].evaluated_on = "01/01/2020"
+    table.results[3].external_id = "x0"
+    report = validate_evaluation(table)
+    assert issues(report) == [
+        (1, "evaluated_on"),
+        (2, "evaluated_on"),
+        (3, "external_id"),
+    ]
+    assert report.issues[2].message == "Duplicate of results[0].external_id."
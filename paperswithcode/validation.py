@@ -0,0 +1,206 @@
+__all__ = ["ValidationIssue", "ValidationReport", "validate_evaluation"]
+
+import re
+import math
+from datetime import date
+from typing import Any, Dict, Iterator, List, Optional
+
+from paperswithcode.models import EvaluationTableSyncRequest
+
+_DATE = re.compile(r"(\d{4})-(\d{2})-(\d{2})\Z")
+# Leading number of a metric value, after opening parentheses, e.g. "85"
+# in "85%", "85 ± 0.3" or "(85)". Everything after the number is ignored.
+_LEADING_NUMBER = re.compile(
+    r"[\s(]*([-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?)"
+)
+# Thousands separators, e.g. in "1,234.5".
+_THOUSANDS = re.compile(r"(?<=\d),(?=\d{3}(?!\d))")
+
+
+class ValidationIssue:
+    """Problem found in an evaluation table.
+
+    Attributes:
+        index (int): Position of the result in the table results.
+        field (str): Invalid field, e.g. `evaluated_on` or
+            `metrics.Top 1 Accuracy`.
+        message (str): Description of the problem.
+        value (Any): Invalid value.
+    """
+
+    __slots__ = ("index", "field", "message", "value")
+
+    def __init__(self, index: int, field: str, message: str, value: Any):
+        self.index = index
+        self.field = field
+        self.message = message
+        self.value = value
+
+    def __repr__(self):
+        return (
+            f"ValidationIssue(index={self.index}, field={self.field!r}, "
+            f"message={self.message!r}, value={self.value!r})"
+        )
+
+    def __str__(self):
+        return f"results[{self.index}].{self.field}: {self.message}"
+
+
+class ValidationReport:
+    """All the problems found in an evaluation table.
+
+    Attributes:
+        issues (list): `ValidationIssue` objects in the order of the results.
+    """
+
+    __slots__ = ("issues",)
+
+    def __init__(self):
+        self.issues: List[ValidationIssue] = []
+
+    def __repr__(self):
+        return f"ValidationReport(issues={len(self.issues)})"
+
+    def __str__(self):
+        return "\n".join(str(issue) for issue in self.issues)
+
+    def __len__(self):
+        return len(self.issues)
+
+    def __iter__(self) -> Iterator[ValidationIssue]:
+        return iter(self.issues)
+
+    @property
+    def ok(self) -> bool:
+        """True if no problems were found."""
+        return not self.issues
+
+    def add(self, index: int, field: str, message: str, value: Any):
+        """Record a problem."""
+        self.issues.append(ValidationIssue(index, field, message, value))
+
+
+def _parse_number(value: Any) -> float:
+    """Parse the leading number of a metric value.
+
+    Returns NaN if the value doesn't start with a number, if the number is
+    too large to be finite, or if the value is not a string or a number,
+    e.g. a list.
+
+    Metric values are checked by `validate_evaluation` and parsed by
+    `paperswithcode.frame.parse_metric_values` with this function, so both
+    agree on which values are numbers.
+    """
+    if not isinstance(value, (str, int, float)):
+        return float("nan")
+    match = _LEADING_NUMBER.match(
+        _THOUSANDS.sub("", str(value).replace("\u2212", "-"))
+    )
+    if match is None:
+        return float("nan")
+    number = float(match.group(1))
+    return number if math.isfinite(number) else float("nan")
+
+
+def _valid_number(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, str):
+        value = _parse_number(value)
+    # NaN and infinite values are not valid JSON.
+    return isinstance(value, (int, float)) and math.isfinite(value)
+
+
+def _valid_date(value: Any) -> bool:
+    match = _DATE.match(value) if isinstance(value, str) else None
+    if match is None:
+        return False
+    try:
+        date(*map(int, match.groups()))
+    except ValueError:
+        return False
+    return True
+
+
+def validate_evaluation(
+    evaluation: EvaluationTableSyncRequest,
+) -> ValidationReport:
+    """Check an evaluation table before it is synchronized.
+
+    All the results are checked in a single pass and all the problems are
+    reported, so they can be fixed before a long upload. The checks are:
+
+    - every metric of a result is declared in the table metrics,
+    - every metric value is a finite number, or a string starting with one,
+      e.g. "85.3%" or "95.1 ± 0.2", see
+      `paperswithcode.frame.parse_metric_values`,
+    - `evaluated_on` is a valid date in the YYYY-MM-DD format,
+    - the `external_id` values are unique.
+
+    Missing metric values (None) and results without an `external_id` are
+    allowed.
+
+    Args:
+        evaluation (EvaluationTableSyncRequest): Evaluation table.
+
+    Returns:
+        ValidationReport: Problems found in the table.
+    """
+    report = ValidationReport()
+    metrics = {metric.name for metric in evaluation.metrics}
+    # Leaderboards repeat the same values and dates many times.
+    numbers: Dict[Any, bool] = {}
+    dates: Dict[str, bool] = {}
+    external_ids: Dict[str, int] = {}
+    for index, result in enumerate(evaluation.results):
+        for name, value in result.metrics.items():
+            if name not in metrics:
+                report.add(
+                    index,
+                    f"metrics.{name}",
+                    "Metric is not declared in the evaluation table.",
+                    value,
+                )
+            if value is None:
+                continue
+            if isinstance(value, (str, int, float)):
+                # Booleans are equal to 0 and 1, don't mix them with numbers.
+                key = (value.__class__, value)
+                valid = numbers.get(key)
+                if valid is None:
+                    valid = numbers[key] = _valid_number(value)
+            else:
+                # Lists, dictionaries... are not numbers and might not be
+                # hashable.
+                valid = False
+            if not valid:
+                report.add(
+                    index,
+                    f"metrics.{name}",
+                    "Value is not a finite number.",
+                    value,
+                )
+
+        evaluated_on = result.evaluated_on
+        valid: Optional[bool] = dates.get(evaluated_on)
+        if valid is None:
+            valid = dates[evaluated_on] = _valid_date(evaluated_on)
+        if not valid:
+            report.add(
+                index,
+                "evaluated_on",
+                "Date is not valid or not in the YYYY-MM-DD format.",
+                evaluated_on,
+            )
+
+        external_id = result.external_id
+        if external_id:
+            first = external_ids.setdefault(external_id, index)
+            if first != index:
+                report.add(
+                    index,
+                    "external_id",
+                    f"Duplicate of results[{first}].external_id.",
+                    external_id,
+                )
+    return report
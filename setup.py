@@ -33,7 +33,12 @@ setup(
     platforms=["Windows", "POSIX", "MacOSX"],
     license="Apache-2.0",
     packages=find_packages(),
+    python_requires=">=3.7",
     install_requires=io.open("requirements.txt").read().splitlines(),
+    extras_require={
+        "fast": ["orjson>=3"],
+        "frame": ["numpy>=1.15", "pandas>=0.24"],
+    },
     entry_points="""
         [console_scripts]
         pwc=paperswithcode.__main__:app